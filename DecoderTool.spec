@@ -31,7 +31,15 @@ a = Analysis(
     runtime_hooks=[],
     excludes=[
         'matplotlib',
+        'scipy',
+        'IPython',
+        'notebook',
+        'tornado',
+        'sqlalchemy',
+        'PIL.ImageQt',
         'numpy.distutils',
+        'numpy.tests',
+        'pandas.tests',
         'pytest',
         'setuptools',
     ],
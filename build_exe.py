@@ -3,11 +3,27 @@
 Build script for creating standalone EXE executable
 Uses PyInstaller to package the application
 """
+import argparse
+import importlib.util
 import subprocess
 import sys
 import shutil
 from pathlib import Path
 
+# Heavy optional dependencies pulled in transitively by pandas that the app never uses
+EXCLUDED_MODULES = [
+    'matplotlib',
+    'scipy',
+    'IPython',
+    'notebook',
+    'tornado',
+    'sqlalchemy',
+    'PIL.ImageQt',
+    'pytest',
+    'pandas.tests',
+    'numpy.tests',
+]
+
 
 def clean_build_directories():
     """Remove old build artifacts"""
@@ -20,25 +36,45 @@ def clean_build_directories():
             print(f"  ✓ Removed {dir_name}/")
 
 
-def build_exe():
-    """Build the executable using PyInstaller"""
+def build_exe(fresh: bool = False, upx_dir: str = None):
+    """
+    Build the executable using PyInstaller
+
+    Builds in one-folder mode: the EXE sits next to its _internal/ folder,
+    so launches skip the temp-dir extraction a one-file build does every time.
+
+    Args:
+        fresh: Discard PyInstaller's cache and rebuild from scratch
+               (default: reuse the cache for faster incremental builds)
+        upx_dir: Directory containing UPX to compress binaries with
+                 (default: no UPX; measure startup before enabling it)
+    """
     print("\nBuilding executable...")
 
     # PyInstaller command
     cmd = [
         'pyinstaller',
         '--name=DecoderTool',
-        '--onefile',
+        '--onedir',
         '--windowed',
         '--add-data=demo_data:demo_data',
         '--hidden-import=pandas',
         '--hidden-import=openpyxl',
         '--hidden-import=tkinter',
         '--icon=NONE',
-        '--clean',
+        '--noconfirm',
+        *[f'--exclude-module={module}' for module in EXCLUDED_MODULES],
         'main.py'
     ]
 
+    if fresh:
+        cmd.insert(-1, '--clean')
+    if importlib.util.find_spec('orjson') is not None:
+        # Optional fast JSON backend for client profiles
+        cmd.insert(-1, '--hidden-import=orjson')
+    if upx_dir:
+        cmd.insert(-1, f'--upx-dir={upx_dir}')
+
     try:
         result = subprocess.run(cmd, check=True, capture_output=True, text=True)
         print("  ✓ Build successful!")
@@ -58,33 +94,32 @@ def create_release_package():
         print("  ✗ Dist directory not found!")
         return False
 
-    # Create release directory
+    # Create release directory (reruns overwrite it in place; timestamps are
+    # not preserved since the shipped files don't need them)
     release_dir = dist_dir / 'DecoderTool_Release'
     release_dir.mkdir(exist_ok=True)
 
-    # Copy executable
-    exe_file = dist_dir / 'DecoderTool.exe'
-    if not exe_file.exists():
-        exe_file = dist_dir / 'DecoderTool'  # Linux/Mac
-
-    if exe_file.exists():
-        shutil.copy2(exe_file, release_dir)
-        print(f"  ✓ Copied executable")
+    # Copy application folder (executable + _internal/)
+    app_dir = dist_dir / 'DecoderTool'
+    if app_dir.is_dir():
+        shutil.copytree(app_dir, release_dir / 'DecoderTool',
+                        dirs_exist_ok=True, copy_function=shutil.copy)
+        print(f"  ✓ Copied application folder")
     else:
-        print("  ✗ Executable not found!")
+        print("  ✗ Application folder not found!")
         return False
 
     # Copy demo data
     demo_src = Path('demo_data')
     if demo_src.exists():
         demo_dst = release_dir / 'demo_data'
-        shutil.copytree(demo_src, demo_dst)
+        shutil.copytree(demo_src, demo_dst, dirs_exist_ok=True, copy_function=shutil.copy)
         print("  ✓ Copied demo data")
 
     # Copy README
     readme = Path('README.md')
     if readme.exists():
-        shutil.copy2(readme, release_dir)
+        shutil.copy(readme, release_dir)
         print("  ✓ Copied README")
 
     print(f"\n✓ Release package created: {release_dir}")
@@ -93,6 +128,13 @@ def create_release_package():
 
 def main():
     """Main build process"""
+    parser = argparse.ArgumentParser(description="Build DecoderTool executable")
+    parser.add_argument('--fresh', action='store_true',
+                        help="Remove build/ and dist/ and ignore PyInstaller's cache")
+    parser.add_argument('--upx-dir', metavar='DIR',
+                        help="Compress binaries with the UPX found in DIR")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("DecoderTool - Executable Build Script")
     print("=" * 60)
@@ -106,11 +148,12 @@ def main():
         print("  Install it with: pip install pyinstaller")
         sys.exit(1)
 
-    # Clean old builds
-    clean_build_directories()
+    # Clean old builds only on request; reusing build/ keeps rebuilds incremental
+    if args.fresh:
+        clean_build_directories()
 
     # Build executable
-    if not build_exe():
+    if not build_exe(fresh=args.fresh, upx_dir=args.upx_dir):
         print("\n✗ Build failed!")
         sys.exit(1)
 
@@ -122,7 +165,7 @@ def main():
     print("\n" + "=" * 60)
     print("✓ Build completed successfully!")
     print("=" * 60)
-    print("\nExecutable location: dist/DecoderTool_Release/")
+    print("\nExecutable location: dist/DecoderTool_Release/DecoderTool/")
     print("You can now distribute the entire DecoderTool_Release folder.")
 
 
@@ -0,0 +1,25 @@
+"""Script to regenerate all demo data files at once
+
+Runs the independent demo file generators in parallel worker processes
+(each writes its own file, so no coordination is needed).
+Like the individual scripts, run it from the project root.
+"""
+from multiprocessing import Pool
+
+from create_demo_files import create_master_file, create_orders_export
+from create_demo_with_empty_skus import create_orders_with_empty_skus
+
+
+GENERATORS = [create_master_file, create_orders_export, create_orders_with_empty_skus]
+
+
+def _run_generator(generator):
+    """Run a single generator (module-level so it can be pickled on Windows)"""
+    generator()
+
+
+if __name__ == '__main__':
+    print("Creating all demo data files...\n")
+    with Pool(len(GENERATORS)) as pool:
+        pool.map(_run_generator, GENERATORS)
+    print("\n✓ All demo files created successfully!")
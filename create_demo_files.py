@@ -1,7 +1,18 @@
-"""Script to generate demo data files for testing"""
+"""Script to generate demo data files for testing
+
+The generated files are committed in demo_data/ and bundled as-is by the build,
+so this is a one-shot developer helper: run it only after changing the demo data.
+"""
 import pandas as pd
 from datetime import datetime
 
+# xlsxwriter is a faster write-only engine; fall back to openpyxl if it's not installed
+try:
+    import xlsxwriter  # noqa: F401
+    EXCEL_ENGINE = 'xlsxwriter'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
 def create_master_file():
     """Create demo master file (HERBAR_TRUTH_FILE.xlsx) with PRODUCTS and SETS sheets"""
 
@@ -113,7 +124,7 @@ def create_master_file():
 
     # Save to Excel with multiple sheets
     output_path = 'demo_data/HERBAR_TRUTH_FILE.xlsx'
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+    with pd.ExcelWriter(output_path, engine=EXCEL_ENGINE) as writer:
         products_df.to_excel(writer, sheet_name='PRODUCTS', index=False)
         sets_df.to_excel(writer, sheet_name='SETS', index=False)
 
@@ -248,12 +259,16 @@ def create_orders_export():
         ]
     }
 
-    # Create DataFrame
-    orders_df = pd.DataFrame(orders_data)
+    # Create DataFrame with explicit numeric dtypes (keeps the CSV writer on its typed fast path)
+    orders_df = pd.DataFrame(orders_data).astype({
+        'Lineitem quantity': 'int64',
+        'Lineitem price': 'float64',
+        'Lineitem discount': 'float64',
+    })
 
     # Save to CSV
     output_path = 'demo_data/orders_export.csv'
-    orders_df.to_csv(output_path, index=False)
+    orders_df.to_csv(output_path, index=False, lineterminator='\n', chunksize=65536)
 
     print(f"\n✓ Created orders export: {output_path}")
     print(f"  - Total rows: {len(orders_df)}")
@@ -1,4 +1,7 @@
-"""Script to generate demo orders with empty SKUs for testing"""
+"""Script to generate demo orders with empty SKUs for testing
+
+The generated file is committed in demo_data/; run this only after changing the demo data.
+"""
 import pandas as pd
 
 
@@ -90,12 +93,16 @@ def create_orders_with_empty_skus():
         ]
     }
 
-    # Create DataFrame
-    orders_df = pd.DataFrame(orders_data)
+    # Create DataFrame with explicit numeric dtypes (keeps the CSV writer on its typed fast path)
+    orders_df = pd.DataFrame(orders_data).astype({
+        'Lineitem quantity': 'int64',
+        'Lineitem price': 'float64',
+        'Lineitem discount': 'int64',
+    })
 
     # Save to CSV
     output_path = 'demo_data/orders_with_empty_skus.csv'
-    orders_df.to_csv(output_path, index=False)
+    orders_df.to_csv(output_path, index=False, lineterminator='\n', chunksize=65536)
 
     print(f"✓ Created orders with empty SKUs: {output_path}")
     print(f"  - Total rows: {len(orders_df)}")
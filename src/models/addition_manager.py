@@ -1,6 +1,29 @@
 """Addition Manager - handles automatic product additions from ADDITION sheet"""
 import pandas as pd
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, NamedTuple
+
+# Cell values (lowercased) that are treated as an empty SKU
+_EMPTY_SENTINELS = frozenset(('', 'nan', 'none'))
+
+
+def _normalize_sku(sku) -> str:
+    """
+    Normalize a SKU for rule lookup
+
+    Args:
+        sku: SKU value to normalize
+
+    Returns:
+        SKU as a stripped string
+    """
+    return str(sku).strip()
+
+
+class AdditionRule(NamedTuple):
+    """Automatic addition rule for a trigger SKU"""
+    add_sku: str
+    quantity: int
+    type: str
 
 
 class AdditionManager:
@@ -8,7 +31,7 @@ class AdditionManager:
 
     def __init__(self):
         """Initialize empty addition rules map"""
-        self._addition_rules: Dict[str, Dict[str, any]] = {}
+        self._addition_rules: Dict[str, AdditionRule] = {}
 
     def load_from_dataframe(self, df: pd.DataFrame) -> None:
         """
@@ -44,51 +67,43 @@ class AdditionManager:
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
 
-        # Check for optional columns
-        has_quantity_column = 'QUANTITY' in df.columns
-        has_type_column = 'TYPE' in df.columns
-
-        # Build addition rules map
-        self._addition_rules = {}
-        for _, row in df.iterrows():
-            # Check for NaN before converting to string
-            if pd.isna(row['IF_SKU']) or pd.isna(row['THEN_ADD']):
-                continue
-
-            if_sku = str(row['IF_SKU']).strip()
-            then_add = str(row['THEN_ADD']).strip()
-
-            # Skip empty values
-            if (not if_sku or not then_add or
-                if_sku.lower() in ('nan', 'none', '') or
-                then_add.lower() in ('nan', 'none', '')):
-                continue
-
-            # Get type from TYPE column, default to FIXED
-            rule_type = 'FIXED'
-            if has_type_column and not pd.isna(row['TYPE']):
-                rule_type = str(row['TYPE']).strip().upper()
-                # Validate type
-                if rule_type not in ('FIXED', 'MATCHED'):
-                    rule_type = 'FIXED'  # Default to FIXED for invalid values
-
-            # Get quantity from QUANTITY column, default to 1
-            # Note: For MATCHED type, quantity is ignored
-            if has_quantity_column:
-                try:
-                    quantity = int(row['QUANTITY'])
-                except (ValueError, TypeError):
-                    quantity = 1
-            else:
-                quantity = 1
-
-            self._addition_rules[if_sku] = {
-                'add_sku': then_add,
-                'quantity': quantity,
-                'type': rule_type
-            }
-
-    def get_addition_rule(self, sku: str) -> Optional[Dict[str, any]]:
+        # Drop rows where either SKU is missing before converting to string
+        mask = df['IF_SKU'].notna() & df['THEN_ADD'].notna()
+        if_skus = df.loc[mask, 'IF_SKU'].astype(str).str.strip()
+        then_adds = df.loc[mask, 'THEN_ADD'].astype(str).str.strip()
+
+        # Skip empty values
+        empty = (if_skus.str.lower().isin(_EMPTY_SENTINELS) |
+                 then_adds.str.lower().isin(_EMPTY_SENTINELS))
+        valid = ~empty
+        if_skus = if_skus[valid]
+        then_adds = then_adds[valid]
+
+        # Get quantity from QUANTITY column, default to 1
+        # Note: For MATCHED type, quantity is ignored
+        if 'QUANTITY' in df.columns:
+            quantities = pd.to_numeric(df.loc[if_skus.index, 'QUANTITY'], errors='coerce')
+            quantities = quantities.fillna(1).astype('int64')
+        else:
+            quantities = pd.Series(1, index=if_skus.index)
+
+        # Get type from TYPE column, default to FIXED for missing/invalid values
+        if 'TYPE' in df.columns:
+            rule_types = df.loc[if_skus.index, 'TYPE'].astype(str).str.strip().str.upper()
+            rule_types = rule_types.where(rule_types.isin(('FIXED', 'MATCHED')), 'FIXED')
+        else:
+            rule_types = pd.Series('FIXED', index=if_skus.index)
+
+        # Build addition rules map (later rows override earlier ones for the same IF_SKU)
+        self._addition_rules = {
+            if_sku: AdditionRule(then_add, int(quantity), rule_type)
+            for if_sku, then_add, quantity, rule_type in zip(
+                if_skus.to_numpy(), then_adds.to_numpy(),
+                quantities.to_numpy(), rule_types.to_numpy()
+            )
+        }
+
+    def get_addition_rule(self, sku: str) -> Optional[AdditionRule]:
         """
         Get addition rule for a SKU
 
@@ -96,9 +111,9 @@ class AdditionManager:
             sku: Product SKU to check
 
         Returns:
-            Dictionary with 'add_sku' and 'quantity', or None if no rule exists
+            AdditionRule with add_sku, quantity and type, or None if no rule exists
         """
-        return self._addition_rules.get(str(sku).strip())
+        return self._addition_rules.get(_normalize_sku(sku))
 
     def has_addition_rule(self, sku: str) -> bool:
         """
@@ -110,7 +125,7 @@ class AdditionManager:
         Returns:
             True if SKU has addition rule, False otherwise
         """
-        return str(sku).strip() in self._addition_rules
+        return _normalize_sku(sku) in self._addition_rules
 
     def get_all_trigger_skus(self) -> List[str]:
         """
@@ -121,6 +136,22 @@ class AdditionManager:
         """
         return list(self._addition_rules.keys())
 
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Get all addition rules as a DataFrame indexed by trigger SKU
+
+        Useful for vectorized lookups, e.g. orders['Lineitem sku'].map(frame['add_sku']).
+
+        Returns:
+            DataFrame with 'add_sku', 'quantity' and 'type' columns
+        """
+        frame = pd.DataFrame(
+            list(self._addition_rules.values()),
+            index=pd.Index(list(self._addition_rules.keys()), name='IF_SKU'),
+            columns=list(AdditionRule._fields)
+        )
+        return frame.astype({'quantity': 'int64'})
+
     def count(self) -> int:
         """
         Get number of addition rules
@@ -1,11 +1,15 @@
 """Client Profile - represents a client configuration with column mapping"""
-from dataclasses import dataclass, field, asdict
-from typing import Dict, Optional
-import json
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import ClassVar, Dict, Mapping, Optional, Tuple
+import os
+import stat
+import time
 from pathlib import Path
+from ..utils import json_io
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientProfile:
     """
     Represents a client profile with custom configuration
@@ -22,9 +26,16 @@ class ClientProfile:
     column_mapping: Dict[str, str] = field(default_factory=dict)
     output_folder: Optional[str] = None
     platform: str = "Shopify"
+    # (path, checked_at, result) of the last validate_output_folder() call
+    _fs_cache: Optional[Tuple[str, float, bool]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # How long a validate_output_folder() result is reused, in seconds
+    FS_CACHE_TTL: ClassVar[float] = 1.0
 
-    # Standard column names that the application expects
-    STANDARD_COLUMNS = {
+    # Standard column names that the application expects (read-only)
+    STANDARD_COLUMNS: ClassVar[Mapping[str, str]] = MappingProxyType({
         'Name': 'Order ID',
         'Created at': 'Order date',
         'Lineitem quantity': 'Quantity',
@@ -34,7 +45,7 @@ class ClientProfile:
         'Lineitem discount': 'Discount',
         'Shipping Name': 'Shipping name',
         'Shipping Method': 'Shipping method',
-    }
+    })
 
     def __post_init__(self):
         """Validate profile after initialization"""
@@ -50,7 +61,15 @@ class ClientProfile:
         Returns:
             Dictionary representation of the profile
         """
-        return asdict(self)
+        # Built by hand: all fields are flat, so dataclasses.asdict's
+        # recursive deep copy is pure overhead here
+        return {
+            'client_id': self.client_id,
+            'client_name': self.client_name,
+            'column_mapping': dict(self.column_mapping),
+            'output_folder': self.output_folder,
+            'platform': self.platform,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'ClientProfile':
@@ -72,7 +91,7 @@ class ClientProfile:
         Returns:
             JSON string representation
         """
-        return json.dumps(self.to_dict(), indent=2)
+        return json_io.dumps(self.to_dict()).decode('utf-8')
 
     @classmethod
     def from_json(cls, json_str: str) -> 'ClientProfile':
@@ -85,7 +104,7 @@ class ClientProfile:
         Returns:
             ClientProfile instance
         """
-        data = json.loads(json_str)
+        data = json_io.loads(json_str)
         return cls.from_dict(data)
 
     def get_mapped_column(self, client_column: str) -> str:
@@ -100,6 +119,18 @@ class ClientProfile:
         """
         return self.column_mapping.get(client_column, client_column)
 
+    def as_renamer(self) -> Dict[str, str]:
+        """
+        Get the column mapping in the form DataFrame.rename expects
+
+        Prefer df.rename(columns=profile.as_renamer()) over calling
+        get_mapped_column for each column - pandas renames in one pass.
+
+        Returns:
+            Copy of the client → standard column mapping
+        """
+        return dict(self.column_mapping)
+
     def has_column_mapping(self) -> bool:
         """
         Check if profile has any column mappings defined
@@ -113,14 +144,29 @@ class ClientProfile:
         """
         Check if output folder exists and is accessible
 
+        The result is cached for FS_CACHE_TTL seconds so repeated UI checks
+        don't hit a slow (e.g. network) drive every time.
+
         Returns:
             True if folder is valid, False otherwise
         """
         if not self.output_folder:
             return False
 
-        folder = Path(self.output_folder)
-        return folder.exists() and folder.is_dir()
+        now = time.monotonic()
+        if self._fs_cache is not None:
+            cached_path, checked_at, cached_result = self._fs_cache
+            if cached_path == self.output_folder and now - checked_at < self.FS_CACHE_TTL:
+                return cached_result
+
+        # One stat call answers both "exists" and "is a directory"
+        try:
+            result = stat.S_ISDIR(os.stat(self.output_folder).st_mode)
+        except OSError:
+            result = False
+
+        self._fs_cache = (self.output_folder, now, result)
+        return result
 
     def ensure_output_folder(self) -> Path:
         """
@@ -138,26 +184,18 @@ class ClientProfile:
 
         folder = Path(self.output_folder)
         folder.mkdir(parents=True, exist_ok=True)
+        self._fs_cache = None
         return folder
 
 
-# Predefined platform templates for common e-commerce platforms
-PLATFORM_TEMPLATES = {
-    'Shopify': ClientProfile(
-        client_id='template_shopify',
-        client_name='Shopify Template',
-        column_mapping={},  # No mapping needed - Shopify is the standard
-        platform='Shopify'
-    ),
-    'WooCommerce': ClientProfile(
-        client_id='template_woocommerce',
-        client_name='WooCommerce Template',
-        column_mapping={
-            'Order ID': 'Name',  # WooCommerce 'Order ID' → Standard 'Name'
-            'Ordered at': 'Created at',  # WooCommerce 'Ordered at' → Standard 'Created at'
-        },
-        platform='WooCommerce'
-    ),
+# Default column mappings for common e-commerce platforms
+# (plain dicts, copied into each new profile by create_default_profile)
+PLATFORM_COLUMN_MAPPINGS = {
+    'Shopify': {},  # No mapping needed - Shopify is the standard
+    'WooCommerce': {
+        'Order ID': 'Name',  # WooCommerce 'Order ID' → Standard 'Name'
+        'Ordered at': 'Created at',  # WooCommerce 'Ordered at' → Standard 'Created at'
+    },
 }
 
 
@@ -173,11 +211,9 @@ def create_default_profile(client_id: str, client_name: str, platform: str = 'Sh
     Returns:
         ClientProfile with platform-specific defaults
     """
-    template = PLATFORM_TEMPLATES.get(platform, PLATFORM_TEMPLATES['Shopify'])
-
     return ClientProfile(
         client_id=client_id,
         client_name=client_name,
-        column_mapping=template.column_mapping.copy(),
+        column_mapping=PLATFORM_COLUMN_MAPPINGS.get(platform, {}).copy(),
         platform=platform
     )
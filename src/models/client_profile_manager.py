@@ -1,8 +1,35 @@
 """Client Profile Manager - manages client profiles with file server support"""
-import json
+import atexit
+import hashlib
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set, Tuple
 from .client_profile import ClientProfile
+from ..utils.json_io import dumps, read_json, write_json
+
+# Upper bound on threads used to read profile files in parallel
+MAX_LOAD_WORKERS = 16
+
+# Translation table deleting every ASCII character not allowed in profile file names
+_UNSAFE_ASCII_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c in ('-', '_'))
+))
+
+# Managers whose pending changes are written at exit. Held weakly, so a manager
+# that is no longer used isn't kept alive by the exit hook.
+_live_managers: weakref.WeakSet = weakref.WeakSet()
+
+
+def _flush_live_managers() -> None:
+    """Write the pending changes of every manager still alive (runs at exit)"""
+    for manager in list(_live_managers):
+        manager.flush()
+
+
+atexit.register(_flush_live_managers)
 
 
 class ClientProfileManager:
@@ -32,6 +59,18 @@ class ClientProfileManager:
         # Profile storage
         self._profiles: Dict[str, ClientProfile] = {}
 
+        # Parsed file contents keyed by path, reused while (mtime_ns, size) is unchanged
+        self._file_stat_cache: Dict[Path, Tuple[Tuple[int, int], dict]] = {}
+
+        # Digest of the last payload written per profile, with the file's (mtime_ns, size)
+        # right after that write - an identical save of an untouched file is skipped
+        self._saved_payloads: Dict[str, Tuple[bytes, Tuple[int, int]]] = {}
+
+        # Profiles added/updated with save=False, written together by flush()
+        self._dirty: Set[str] = set()
+        self._dirty_lock = threading.Lock()
+        _live_managers.add(self)
+
         # Load profiles from disk
         self._load_all_profiles()
 
@@ -58,6 +97,9 @@ class ClientProfileManager:
         if not new_path.is_dir():
             raise ValueError(f"Path is not a directory: {path}")
 
+        # Write pending changes to the old location before switching
+        self.flush()
+
         self._config_path = new_path
         # Reload profiles from new location
         self._profiles.clear()
@@ -73,24 +115,78 @@ class ClientProfileManager:
         Returns:
             Path to profile JSON file
         """
-        # Sanitize client_id for use as filename
-        safe_id = "".join(c for c in client_id if c.isalnum() or c in ('-', '_'))
+        # Sanitize client_id for use as filename (one C-level pass for ASCII IDs)
+        safe_id = client_id.translate(_UNSAFE_ASCII_TABLE)
+        if not safe_id.isascii():
+            safe_id = "".join(c for c in safe_id if c.isalnum() or c in ('-', '_'))
         return self._config_path / f"{safe_id}.json"
 
+    def _read_profile_file(self, entry: os.DirEntry) -> Tuple[Optional[Tuple[int, int]], Optional[dict], Optional[Exception]]:
+        """
+        Read one profile file (runs on a worker thread, must not modify shared state)
+
+        The file is only parsed again if its modification time or size changed
+        since the last load.
+
+        Args:
+            entry: Directory entry of the profile JSON file
+
+        Returns:
+            Tuple of (stat_key, data, None) on success or (None, None, error) on failure
+        """
+        try:
+            # DirEntry.stat() is cached on the entry (free on Windows, from the scan itself)
+            st = entry.stat()
+            stat_key = (st.st_mtime_ns, st.st_size)
+
+            json_file = Path(entry.path)
+            cached = self._file_stat_cache.get(json_file)
+            if cached is not None and cached[0] == stat_key:
+                return stat_key, cached[1], None
+
+            return stat_key, read_json(json_file), None
+        except Exception as e:
+            return None, None, e
+
     def _load_all_profiles(self) -> None:
         """Load all profiles from configuration directory"""
         if not self._config_path.exists():
             return
 
-        for json_file in self._config_path.glob('*.json'):
+        # One directory scan; the entries already know whether they are files
+        with os.scandir(self._config_path) as entries:
+            json_entries = [
+                entry for entry in entries
+                if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False)
+            ]
+        if not json_entries:
+            self._file_stat_cache = {}
+            return
+
+        # Reads overlap on a thread pool - on a network share each file costs a round trip
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(json_entries))) as executor:
+            results = list(executor.map(self._read_profile_file, json_entries))
+
+        # Merge on this thread, in directory order
+        file_stat_cache = {}
+        for entry, (stat_key, data, error) in zip(json_entries, results):
+            json_file = Path(entry.path)
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    profile = ClientProfile.from_dict(data)
-                    self._profiles[profile.client_id] = profile
+                if error is not None:
+                    raise error
+                # Copy the mapping so edits to the profile don't leak into the cache
+                profile = ClientProfile.from_dict(
+                    {**data, 'column_mapping': dict(data.get('column_mapping') or {})}
+                )
             except Exception as e:
                 # Log error but continue loading other profiles
                 print(f"Warning: Could not load profile from {json_file}: {str(e)}")
+                continue
+            self._profiles[profile.client_id] = profile
+            file_stat_cache[json_file] = (stat_key, data)
+
+        # Only files that still exist (and loaded fine) stay cached
+        self._file_stat_cache = file_stat_cache
 
     def add_profile(self, profile: ClientProfile, save: bool = True) -> None:
         """
@@ -98,7 +194,8 @@ class ClientProfileManager:
 
         Args:
             profile: ClientProfile to add
-            save: Whether to save to disk immediately (default: True)
+            save: Whether to save to disk immediately (default: True);
+                  otherwise it is written by the next flush()/save_all()
 
         Raises:
             ValueError: If profile with same client_id already exists
@@ -110,6 +207,8 @@ class ClientProfileManager:
 
         if save:
             self._save_profile(profile)
+        else:
+            self._mark_dirty(profile.client_id)
 
     def update_profile(self, profile: ClientProfile, save: bool = True) -> None:
         """
@@ -117,7 +216,8 @@ class ClientProfileManager:
 
         Args:
             profile: ClientProfile with updated data
-            save: Whether to save to disk immediately (default: True)
+            save: Whether to save to disk immediately (default: True);
+                  otherwise it is written by the next flush()/save_all()
 
         Raises:
             ValueError: If profile doesn't exist
@@ -129,6 +229,8 @@ class ClientProfileManager:
 
         if save:
             self._save_profile(profile)
+        else:
+            self._mark_dirty(profile.client_id)
 
     def delete_profile(self, client_id: str) -> None:
         """
@@ -145,6 +247,9 @@ class ClientProfileManager:
 
         # Remove from memory
         del self._profiles[client_id]
+        self._saved_payloads.pop(client_id, None)
+        with self._dirty_lock:
+            self._dirty.discard(client_id)
 
         # Remove from disk
         profile_file = self._get_profile_file_path(client_id)
@@ -214,6 +319,8 @@ class ClientProfileManager:
     def clear(self) -> None:
         """Clear all profiles from memory (does not delete from disk)"""
         self._profiles.clear()
+        with self._dirty_lock:
+            self._dirty.clear()
 
     def _save_profile(self, profile: ClientProfile) -> None:
         """
@@ -226,9 +333,80 @@ class ClientProfileManager:
             OSError: If file cannot be written
         """
         profile_file = self._get_profile_file_path(profile.client_id)
+        payload = dumps(profile.to_dict())
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
 
-        with open(profile_file, 'w', encoding='utf-8') as f:
-            json.dump(profile.to_dict(), f, indent=2, ensure_ascii=False)
+        if self._is_saved(profile.client_id, profile_file, digest):
+            with self._dirty_lock:
+                self._dirty.discard(profile.client_id)
+            return
+
+        # Write to a temp file and swap it in, so readers on other PCs
+        # never see a half-written profile
+        tmp_file = profile_file.with_name(profile_file.name + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, profile_file)
+
+        st = profile_file.stat()
+        self._saved_payloads[profile.client_id] = (digest, (st.st_mtime_ns, st.st_size))
+
+        with self._dirty_lock:
+            self._dirty.discard(profile.client_id)
+
+    def _is_saved(self, client_id: str, profile_file: Path, digest: bytes) -> bool:
+        """
+        Check if a payload is exactly what we last wrote and the file is untouched since
+
+        Args:
+            client_id: Client ID
+            profile_file: Path to profile JSON file
+            digest: Digest of the payload about to be written
+
+        Returns:
+            True if writing the payload again would not change anything
+        """
+        saved = self._saved_payloads.get(client_id)
+        if saved is None or saved[0] != digest:
+            return False
+
+        try:
+            st = profile_file.stat()
+        except OSError:
+            return False
+        return saved[1] == (st.st_mtime_ns, st.st_size)
+
+    def _mark_dirty(self, client_id: str) -> None:
+        """
+        Remember that a profile has changes not yet written to disk
+
+        Args:
+            client_id: Client ID of the changed profile
+        """
+        with self._dirty_lock:
+            self._dirty.add(client_id)
+
+    def has_unsaved_changes(self) -> bool:
+        """
+        Check if any profile changes are waiting for flush()
+
+        Returns:
+            True if there are unsaved profiles, False otherwise
+        """
+        return bool(self._dirty)
+
+    def flush(self) -> None:
+        """Write all profiles added/updated with save=False to disk in one batch"""
+        with self._dirty_lock:
+            pending = list(self._dirty)
+            self._dirty.clear()
+
+        for client_id in pending:
+            profile = self._profiles.get(client_id)
+            if profile is not None:
+                self._save_profile(profile)
 
     def save_all(self) -> None:
         """Save all profiles to disk"""
@@ -236,7 +414,8 @@ class ClientProfileManager:
             self._save_profile(profile)
 
     def reload(self) -> None:
-        """Reload all profiles from disk"""
+        """Reload all profiles from disk (pending changes are written first)"""
+        self.flush()
         self._profiles.clear()
         self._load_all_profiles()
 
@@ -256,9 +435,7 @@ class ClientProfileManager:
         if not profile:
             raise ValueError(f"Profile with client_id '{client_id}' not found")
 
-        export_file = Path(export_path)
-        with open(export_file, 'w', encoding='utf-8') as f:
-            json.dump(profile.to_dict(), f, indent=2, ensure_ascii=False)
+        write_json(export_path, profile.to_dict())
 
     def import_profile(self, import_path: str, overwrite: bool = False) -> ClientProfile:
         """
@@ -281,10 +458,7 @@ class ClientProfileManager:
         if not import_file.exists():
             raise FileNotFoundError(f"Import file not found: {import_path}")
 
-        with open(import_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        profile = ClientProfile.from_dict(data)
+        profile = ClientProfile.from_dict(read_json(import_file))
 
         if self.has_profile(profile.client_id) and not overwrite:
             raise ValueError(
@@ -306,6 +480,15 @@ class ClientProfileManager:
         Returns:
             Dictionary mapping client_id to list of issues (empty list if valid)
         """
+        # Folder checks are filesystem round trips (often to a network share) -
+        # run them concurrently, the string checks below are cheap
+        with_folder = [(cid, p) for cid, p in self._profiles.items() if p.output_folder]
+        folder_ok = {}
+        if with_folder:
+            with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(with_folder))) as executor:
+                results = executor.map(lambda item: item[1].validate_output_folder(), with_folder)
+                folder_ok = {cid: ok for (cid, _), ok in zip(with_folder, results)}
+
         issues = {}
 
         for client_id, profile in self._profiles.items():
@@ -320,7 +503,7 @@ class ClientProfileManager:
                 profile_issues.append("Empty client_name")
 
             # Check output folder if set
-            if profile.output_folder and not profile.validate_output_folder():
+            if profile.output_folder and not folder_ok.get(client_id, False):
                 profile_issues.append(f"Invalid output folder: {profile.output_folder}")
 
             issues[client_id] = profile_issues
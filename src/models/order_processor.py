@@ -1,15 +1,36 @@
 """Order Processor - handles order processing and set decoding logic"""
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Tuple, Optional
 from .product_manager import ProductManager
 from .set_manager import SetManager
 from .addition_manager import AdditionManager
-from ..utils.sku_generator import generate_sku_from_name, is_empty_sku
+from ..utils.sku_generator import generate_sku_from_name, empty_sku_mask
+from ..utils.pandas_compat import copy_frame
+
+
+def _parse_quantities(quantities: pd.Series) -> pd.Series:
+    """
+    Parse order line quantities for arithmetic
+
+    Values may arrive as text; blank or invalid ones count as 0, and fractions
+    are truncated like int() does.
+
+    Args:
+        quantities: 'Lineitem quantity' values as loaded
+
+    Returns:
+        int64 quantities (int64 so large set totals can't overflow)
+    """
+    return pd.to_numeric(quantities, errors='coerce').fillna(0).astype('int64')
 
 
 class OrderProcessor:
     """Processes orders and decodes sets into individual components"""
 
+    # Order columns read by processing (other columns are passed through as-is)
+    REQUIRED_COLUMNS = ('Name', 'Lineitem sku', 'Lineitem name', 'Lineitem quantity', 'Lineitem price')
+
     def __init__(self, product_manager: ProductManager, set_manager: SetManager,
                  addition_manager: Optional[AdditionManager] = None):
         """
@@ -24,15 +45,45 @@ class OrderProcessor:
         self.set_manager = set_manager
         self.addition_manager = addition_manager or AdditionManager()
         self._orders_df: pd.DataFrame = None
-
-    def load_orders(self, df: pd.DataFrame) -> None:
+        # Manually added rows, appended to _orders_df in one concat when next needed
+        self._pending_rows: List[Dict] = []
+        # Order ID -> position of its first row in _orders_df, built on the first manual add
+        self._first_row_by_order: Optional[Dict[str, int]] = None
+        # Bumped whenever the orders change, so callers can cache derived results
+        self._revision = 0
+        # (revision, count) of the last get_unique_order_count() result
+        self._unique_order_count: Tuple[int, int] = (-1, 0)
+        # ((components_df, product SKUs), frame) of the last _build_components_frame() result
+        self._components_frame: Optional[Tuple[tuple, pd.DataFrame]] = None
+        # Loaded rows whose quantity was blank or not a number (stored as 0)
+        self._missing_quantity_count = 0
+
+    def load_orders(self, df: pd.DataFrame) -> int:
         """
         Load orders from a DataFrame
 
         Args:
             df: DataFrame with order data from Shopify export
+
+        Returns:
+            Number of order rows loaded
         """
-        self._orders_df = df.copy()
+        # Shares the data under Copy-on-Write, both sides stay independent
+        orders = copy_frame(df)
+
+        # Columns are kept as exported (they are written back out unchanged);
+        # quantities are only parsed where processing multiplies them
+        self._missing_quantity_count = 0
+        if 'Lineitem quantity' in orders.columns:
+            self._missing_quantity_count = int(
+                pd.to_numeric(orders['Lineitem quantity'], errors='coerce').isna().sum()
+            )
+
+        self._orders_df = orders
+        self._pending_rows = []
+        self._first_row_by_order = None
+        self._revision += 1
+        return len(orders)
 
     def generate_missing_skus(self) -> Tuple[int, List[Dict[str, str]]]:
         """
@@ -48,29 +99,45 @@ class OrderProcessor:
         if self._orders_df is None:
             return 0, []
 
-        changes = []
-        count = 0
+        self.flush_manual_additions()
 
-        for idx, row in self._orders_df.iterrows():
-            sku = row.get('Lineitem sku', '')
-            name = row.get('Lineitem name', '')
+        orders = self._orders_df
+        if 'Lineitem name' not in orders.columns:
+            return 0, []
+
+        names = orders['Lineitem name']
+        skus = orders.get('Lineitem sku')
+        if skus is not None:
+            sku_empty = empty_sku_mask(skus)
+        else:
+            sku_empty = np.ones(len(orders), dtype=bool)
+
+        # Rows with an empty SKU and a (truthy) product name
+        mask = sku_empty & names.map(bool).to_numpy(dtype=bool)
+        if not mask.any():
+            return 0, []
 
-            if is_empty_sku(sku) and name:
-                # Generate new SKU from product name
-                new_sku = generate_sku_from_name(name)
+        # Generate new SKUs from product names in one pass
+        target_names = names[mask]
+        new_skus = target_names.map(generate_sku_from_name)
 
-                # Track the change
-                changes.append({
-                    'name': str(name),
-                    'old_sku': str(sku) if not is_empty_sku(sku) else '(empty)',
-                    'new_sku': new_sku
-                })
+        # A missing or all-empty (float) SKU column can't hold strings - widen it
+        if skus is None:
+            orders['Lineitem sku'] = None
+        elif not (pd.api.types.is_object_dtype(skus) or pd.api.types.is_string_dtype(skus)):
+            orders['Lineitem sku'] = skus.astype(object)
 
-                # Update the dataframe
-                self._orders_df.at[idx, 'Lineitem sku'] = new_sku
-                count += 1
+        # Update the dataframe
+        orders.loc[mask, 'Lineitem sku'] = new_skus.to_numpy()
+        self._revision += 1
 
-        return count, changes
+        # Track the changes
+        changes = [
+            {'name': str(name), 'old_sku': '(empty)', 'new_sku': new_sku}
+            for name, new_sku in zip(target_names, new_skus)
+        ]
+
+        return len(changes), changes
 
     def add_manual_product(self, order_id: str, sku: str, quantity: int) -> tuple[bool, str]:
         """
@@ -87,14 +154,19 @@ class OrderProcessor:
         if self._orders_df is None:
             return False, "Error: No orders loaded"
 
-        # Find first matching order row
-        matching_rows = self._orders_df[self._orders_df['Name'] == order_id]
+        # Find first matching order row. Additions only extend existing orders
+        # (appended at the end), so the positions stay valid until the next load.
+        if self._first_row_by_order is None:
+            names = self._orders_df['Name'].to_numpy()
+            first_rows = np.flatnonzero(~pd.Series(names).duplicated().to_numpy())
+            self._first_row_by_order = dict(zip(names[first_rows], first_rows.tolist()))
 
-        if matching_rows.empty:
+        position = self._first_row_by_order.get(order_id)
+        if position is None:
             return False, f"Error: Order ID {order_id} not found"
 
-        # Get first matching row as template
-        template_row = matching_rows.iloc[0].copy()
+        # Get first matching row as template (a dict: the row's values may be text)
+        template_row = self._orders_df.iloc[position].to_dict()
 
         # Update with new product info
         template_row['Lineitem sku'] = sku
@@ -108,26 +180,35 @@ class OrderProcessor:
         template_row['Lineitem price'] = 0
         template_row['Lineitem discount'] = 0
 
-        # Add new row to orders DataFrame
-        # Convert to DataFrame for concatenation
-        new_row_df = pd.DataFrame([template_row])
-        self._orders_df = pd.concat([self._orders_df, new_row_df], ignore_index=True)
+        # Buffer the row; flush_manual_additions() appends all of them at once
+        self._pending_rows.append(template_row)
+        self._revision += 1
 
         return True, f"Added {sku} (Qty: {quantity}) to order {order_id}"
 
+    def flush_manual_additions(self) -> None:
+        """Append buffered manual additions to the orders DataFrame in a single concat"""
+        if not self._pending_rows:
+            return
+
+        new_rows_df = pd.DataFrame(self._pending_rows, columns=self._orders_df.columns)
+        self._orders_df = pd.concat([self._orders_df, new_rows_df], ignore_index=True)
+        self._pending_rows = []
+
     def process_orders(self) -> pd.DataFrame:
         """
         Process orders by decoding sets into components
 
         Main logic:
-        1. Iterate through each order line
-        2. If SKU is a set:
+        1. Split order lines into set lines and regular lines
+        2. Set lines:
            - Don't include the set line itself
-           - Decode into component products
+           - Decode into component products (one merge for all sets)
            - First component gets the original price
            - Other components get price = 0
-        3. If SKU is not a set:
+        3. Regular lines:
            - Include as-is
+        4. Restore original line order (components take the place of their set)
 
         Returns:
             Processed DataFrame with sets decoded
@@ -138,78 +219,104 @@ class OrderProcessor:
         if self._orders_df is None:
             raise ValueError("No orders loaded. Call load_orders() first.")
 
-        processed_rows = []
-
-        # Iterate through each order row
-        for _, order_row in self._orders_df.iterrows():
-            sku = str(order_row['Lineitem sku']).strip()
-
-            # Check if this SKU is a set
-            if self.set_manager.is_set(sku):
-                # This is a set - decode it
-                self._decode_set(order_row, processed_rows)
-            else:
-                # Regular product - add as-is
-                processed_rows.append(order_row.to_dict())
+        self.flush_manual_additions()
+        orders = self._orders_df
+        # SKUs repeat across lines: encode them once (like a categorical) and
+        # normalize/probe only the distinct values; missing SKUs (code -1) are never sets
+        sku_codes, unique_skus = pd.factorize(orders['Lineitem sku'])
+        unique_skus = pd.Index(unique_skus).map(str).str.strip()
+        unique_is_set = np.append(unique_skus.isin(self.set_manager.set_skus), False)
+        is_set = unique_is_set[sku_codes]
+
+        # Row position + component index keep the output in original line order
+        positions = pd.RangeIndex(len(orders))
+
+        regular = orders.loc[~is_set].assign(
+            _row_pos=positions[~is_set], _component_index=0
+        )
+        decoded = self._decode_sets(
+            orders.loc[is_set].assign(_row_pos=positions[is_set],
+                                      _set_sku=unique_skus[sku_codes[is_set]].to_numpy())
+        )
+
+        # Leave out an empty side so it can't widen the other side's dtypes
+        parts = [part for part in (regular, decoded) if not part.empty] or [regular]
+        processed = pd.concat(parts, ignore_index=True)
+        processed = processed.sort_values(['_row_pos', '_component_index'], kind='stable')
+        processed = processed.drop(columns=['_row_pos', '_component_index'])
 
         # Apply addition rules (automatic companion products)
-        processed_rows = self._apply_addition_rules(processed_rows)
-
-        # Create output DataFrame
-        return pd.DataFrame(processed_rows)
+        return self._apply_addition_rules(processed.reset_index(drop=True))
 
-    def _decode_set(self, order_row: pd.Series, processed_rows: List[Dict]) -> None:
+    def _decode_sets(self, set_rows: pd.DataFrame) -> pd.DataFrame:
         """
-        Decode a set into its component products
+        Decode set order lines into their component products
 
         Args:
-            order_row: Order row containing the set
-            processed_rows: List to append decoded components to
-        """
-        set_sku = str(order_row['Lineitem sku']).strip()
-        order_quantity = int(order_row['Lineitem quantity'])
-        order_price = order_row['Lineitem price']
-
-        # Get set components with quantities
-        components = self.set_manager.get_components(set_sku)
-
-        if not components:
-            # No components found - skip this set
-            return
-
-        # Process each component
-        for idx, component in enumerate(components):
-            component_sku = component['sku']
-            set_quantity = component['quantity']  # Quantity of this component in the set
-
-            new_row = order_row.to_dict()
+            set_rows: Order rows containing sets, with '_set_sku' and '_row_pos' columns
 
-            # Get component details from product map
-            product_details = self.product_manager.get_product(component_sku)
-
-            if product_details:
-                # Component found in product map
-                new_row['Lineitem name'] = product_details['name']
-                physical_qty = int(product_details['physical_qty'])
-            else:
-                # Component not in product map - use SKU as name, qty = 1
-                new_row['Lineitem name'] = component_sku
-                physical_qty = 1
-
-            # Update component info
-            new_row['Lineitem sku'] = component_sku
-            # Final quantity = order_quantity × set_quantity × physical_qty
-            new_row['Lineitem quantity'] = order_quantity * set_quantity * physical_qty
-
-            # Price distribution: only first component gets the price
-            if idx == 0:
-                new_row['Lineitem price'] = order_price
-            else:
-                new_row['Lineitem price'] = 0
+        Returns:
+            One row per component, with '_row_pos' and '_component_index' columns
+        """
+        components = self._build_components_frame()
+
+        expanded = set_rows.merge(
+            components, left_on='_set_sku', right_on='set_sku', how='inner', sort=False
+        )
+        first_component = expanded['_component_index'].to_numpy() == 0
+
+        # Final quantity = order_quantity × set_quantity × physical_qty
+        expanded['Lineitem quantity'] = (
+            _parse_quantities(expanded['Lineitem quantity'])
+            * expanded['set_quantity'] * expanded['physical_qty']
+        )
+        expanded['Lineitem sku'] = expanded['component_sku']
+        expanded['Lineitem name'] = expanded['component_name']
+        # Price distribution: only first component gets the price
+        expanded['Lineitem price'] = expanded['Lineitem price'].where(first_component, 0)
+
+        return expanded.drop(columns=[
+            '_set_sku', 'set_sku', 'component_sku', 'component_name',
+            'set_quantity', 'physical_qty'
+        ])
+
+    def _build_components_frame(self) -> pd.DataFrame:
+        """
+        Join the flat set components table with product details
 
-            processed_rows.append(new_row)
+        Components missing from the product map use their SKU as name and
+        a physical quantity of 1. The result is reused until the set manager
+        or product manager loads new data (both replace these objects then).
 
-    def _apply_addition_rules(self, processed_rows: List[Dict]) -> List[Dict]:
+        Returns:
+            DataFrame with set_sku, _component_index, component_sku,
+            component_name, set_quantity and physical_qty columns
+        """
+        components = self.set_manager.get_components_df()
+        sources = (components, self.product_manager.skus)
+        if self._components_frame is not None:
+            cached_sources, frame = self._components_frame
+            if all(a is b for a, b in zip(cached_sources, sources)):
+                return frame
+        component_skus = components['component_sku']
+
+        # One batch lookup for all components (unknown SKUs come back as NaN)
+        details = self.product_manager.get_products_batch(component_skus.to_numpy())
+        names = pd.Series(details['name'].to_numpy(), index=components.index)
+        physical_qtys = pd.Series(details['physical_qty'].to_numpy(), index=components.index)
+
+        frame = pd.DataFrame({
+            'set_sku': components['set_sku'],
+            '_component_index': components['component_index'],
+            'component_sku': component_skus,
+            'component_name': names.fillna(component_skus),
+            'set_quantity': components['set_quantity'],
+            'physical_qty': physical_qtys.fillna(1).astype('int32'),
+        })
+        self._components_frame = (sources, frame)
+        return frame
+
+    def _apply_addition_rules(self, processed: pd.DataFrame) -> pd.DataFrame:
         """
         Apply automatic product addition rules to processed orders
 
@@ -220,70 +327,91 @@ class OrderProcessor:
 
         For each order, check if any product SKU has an addition rule.
         If so, automatically add the companion product if it's not already in the order.
+        Rows are grouped by order (in order of first appearance), each order's
+        additions following its own lines.
 
         Args:
-            processed_rows: List of processed order rows
+            processed: Processed order rows (with a default RangeIndex)
 
         Returns:
-            List of order rows with additions applied
+            DataFrame of order rows with additions applied
         """
-        # Group rows by Order ID to process each order separately
-        orders_by_id = {}
-        for row in processed_rows:
-            order_id = row['Name']
-            if order_id not in orders_by_id:
-                orders_by_id[order_id] = []
-            orders_by_id[order_id].append(row)
-
-        result_rows = []
-
-        # Process each order
-        for order_id, order_rows in orders_by_id.items():
-            # Get all SKUs in this order
-            existing_skus = {row['Lineitem sku'] for row in order_rows}
-
-            # Check each row for addition rules
-            additions_to_add = []
-            for row in order_rows:
-                sku = row['Lineitem sku']
-
-                # Check if this SKU has an addition rule
-                if self.addition_manager.has_addition_rule(sku):
-                    rule = self.addition_manager.get_addition_rule(sku)
-                    add_sku = rule['add_sku']
-                    rule_type = rule.get('type', 'FIXED')  # Default to FIXED for backwards compatibility
-
-                    # Calculate quantity based on rule type
-                    if rule_type == 'MATCHED':
-                        # Match the quantity of the trigger product
-                        add_quantity = int(row['Lineitem quantity'])
-                    else:
-                        # FIXED type: use quantity from rule
-                        add_quantity = rule['quantity']
-
-                    # Only add if not already in order
-                    if add_sku not in existing_skus:
-                        # Create new row for the added product
-                        new_row = row.copy()
-                        new_row['Lineitem sku'] = add_sku
-                        new_row['Lineitem quantity'] = add_quantity
-                        new_row['Lineitem price'] = 0  # Added products have 0 price
-
-                        # Get product name from product manager
-                        product_details = self.product_manager.get_product(add_sku)
-                        if product_details:
-                            new_row['Lineitem name'] = product_details['name']
-                        else:
-                            new_row['Lineitem name'] = add_sku
-
-                        additions_to_add.append(new_row)
-                        existing_skus.add(add_sku)  # Mark as added to avoid duplicates
-
-            # Add original rows and additions
-            result_rows.extend(order_rows)
-            result_rows.extend(additions_to_add)
-
-        return result_rows
+        # Orders numbered by first appearance; all missing order IDs share one group
+        order_codes = pd.factorize(processed['Name'], use_na_sentinel=False)[0]
+        positions = np.arange(len(processed))
+
+        additions = self._build_addition_rows(processed, order_codes)
+
+        rows = processed.assign(_order=order_codes, _added=0, _pos=positions)
+        if not additions.empty:
+            rows = pd.concat([rows, additions], ignore_index=True)
+
+        rows = rows.sort_values(['_order', '_added', '_pos'], kind='stable')
+        return rows.drop(columns=['_order', '_added', '_pos']).reset_index(drop=True)
+
+    def _build_addition_rows(self, processed: pd.DataFrame, order_codes: np.ndarray) -> pd.DataFrame:
+        """
+        Build the companion product rows the addition rules add to each order
+
+        A rule fires once per order and product: the first trigger line wins,
+        and nothing is added if the order already contains the product.
+
+        Args:
+            processed: Processed order rows (with a default RangeIndex)
+            order_codes: Order number of each row (see _apply_addition_rules)
+
+        Returns:
+            New rows (copies of their trigger line) with '_order', '_added'
+            and '_pos' sort columns; empty if no rule applies
+        """
+        rules = self.addition_manager.to_frame()
+        if rules.empty or processed.empty:
+            return processed.iloc[:0]
+
+        # Look up the rule of every line in one reindex (no rule -> NaN)
+        skus = processed['Lineitem sku']
+        matched = rules.reindex(skus.map(str).str.strip().to_numpy())
+        is_trigger = matched['add_sku'].notna().to_numpy()
+        if not is_trigger.any():
+            return processed.iloc[:0]
+
+        matched = matched[is_trigger]
+        trigger_pos = np.flatnonzero(is_trigger)
+        candidates = pd.DataFrame({
+            '_order': order_codes[trigger_pos],
+            '_pos': trigger_pos,
+            'add_sku': matched['add_sku'].to_numpy(),
+            # MATCHED copies the trigger line's quantity, FIXED uses the rule's
+            'quantity': np.where(
+                matched['type'].to_numpy() == 'MATCHED',
+                _parse_quantities(processed['Lineitem quantity'].iloc[trigger_pos]).to_numpy(),
+                matched['quantity'].to_numpy(),
+            ).astype('int64'),
+        })
+
+        # One addition per order and product, skipped if the order already has it
+        candidates = candidates.drop_duplicates(subset=['_order', 'add_sku'], keep='first')
+        in_order = pd.MultiIndex.from_arrays([order_codes, skus])
+        candidates = candidates[
+            ~pd.MultiIndex.from_arrays([candidates['_order'], candidates['add_sku']]).isin(in_order)
+        ]
+        if candidates.empty:
+            return processed.iloc[:0]
+
+        # Names of the added products, fetched in one batch lookup
+        add_skus = candidates['add_sku']
+        products = self.product_manager.get_products(add_skus.unique())
+        names = {sku: product['name'] for sku, product in products.items()}
+
+        additions = processed.iloc[candidates['_pos'].to_numpy()].reset_index(drop=True)
+        additions['Lineitem sku'] = add_skus.to_numpy()
+        additions['Lineitem quantity'] = candidates['quantity'].to_numpy()
+        additions['Lineitem price'] = 0  # Added products have 0 price
+        additions['Lineitem name'] = add_skus.map(names).fillna(add_skus).to_numpy()
+
+        return additions.assign(
+            _order=candidates['_order'].to_numpy(), _added=1, _pos=candidates['_pos'].to_numpy()
+        )
 
     def get_orders_dataframe(self) -> pd.DataFrame:
         """
@@ -292,7 +420,10 @@ class OrderProcessor:
         Returns:
             Current orders DataFrame or None if not loaded
         """
-        return self._orders_df.copy() if self._orders_df is not None else None
+        if self._orders_df is None:
+            return None
+        self.flush_manual_additions()
+        return copy_frame(self._orders_df)
 
     def get_order_count(self) -> int:
         """
@@ -301,8 +432,59 @@ class OrderProcessor:
         Returns:
             Number of rows in orders DataFrame, or 0 if not loaded
         """
-        return len(self._orders_df) if self._orders_df is not None else 0
+        if self._orders_df is None:
+            return 0
+        return len(self._orders_df) + len(self._pending_rows)
+
+    def get_unique_order_count(self) -> int:
+        """
+        Get number of distinct orders (order IDs) loaded
+
+        Computed once per revision of the orders.
+
+        Returns:
+            Number of unique values in the 'Name' column (every row counts as
+            its own order if there is no such column), or 0 if not loaded
+        """
+        if self._orders_df is None:
+            return 0
+
+        revision, count = self._unique_order_count
+        if revision != self._revision:
+            self.flush_manual_additions()
+            orders = self._orders_df
+            count = orders['Name'].nunique() if 'Name' in orders.columns else len(orders)
+            self._unique_order_count = (self._revision, count)
+        return count
+
+    def get_missing_quantity_count(self) -> int:
+        """
+        Get number of loaded rows whose quantity was blank or not a number
+
+        These rows are kept with quantity 0. Manually added rows always have a
+        valid quantity, so they don't change the count.
+
+        Returns:
+            Number of such rows, or 0 if no orders are loaded
+        """
+        return self._missing_quantity_count
+
+    def get_revision(self) -> int:
+        """
+        Get a counter that changes whenever the orders change
+
+        Loading, clearing, manual additions and SKU generation each bump it,
+        so results derived from the orders can be reused while it stays the same.
+
+        Returns:
+            Current revision number
+        """
+        return self._revision
 
     def clear_orders(self) -> None:
         """Clear loaded orders"""
         self._orders_df = None
+        self._pending_rows = []
+        self._first_row_by_order = None
+        self._missing_quantity_count = 0
+        self._revision += 1
@@ -1,14 +1,29 @@
 """Product Manager - handles product map from PRODUCTS sheet"""
 import pandas as pd
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, Optional
 
 
 class ProductManager:
     """Manages product data and provides product information lookup"""
 
     def __init__(self):
-        """Initialize empty product map"""
-        self._product_map: Dict[str, Dict[str, any]] = {}
+        """Initialize empty product table"""
+        self._set_products(pd.DataFrame(
+            {'name': pd.Series(dtype=object), 'physical_qty': pd.Series(dtype='int32')},
+            index=pd.Index([], dtype=object, name='SKU')
+        ))
+
+    def _set_products(self, products_df: pd.DataFrame) -> None:
+        """
+        Store the product table and the column arrays used for single lookups
+
+        Args:
+            products_df: DataFrame indexed by SKU with 'name' and 'physical_qty' columns
+        """
+        self._products_df = products_df
+        self._names = products_df['name'].to_numpy()
+        self._physical_qtys = products_df['physical_qty'].to_numpy()
+        self._skus: FrozenSet[str] = frozenset(products_df.index)
 
     def load_from_dataframe(self, df: pd.DataFrame) -> None:
         """
@@ -34,14 +49,16 @@ class ProductManager:
         # Handle duplicates by keeping first occurrence
         df_clean = df.drop_duplicates(subset=['SKU'], keep='first')
 
-        # Build product map
-        self._product_map = {}
-        for _, row in df_clean.iterrows():
-            sku = str(row['SKU']).strip()
-            self._product_map[sku] = {
-                'name': str(row['Products_Name']),
-                'physical_qty': int(row['Quantity_Product'])
-            }
+        # Build product table indexed by SKU
+        products_df = pd.DataFrame({
+            'name': df_clean['Products_Name'].map(str).to_numpy(dtype=object),
+            'physical_qty': df_clean['Quantity_Product'].astype('int32').to_numpy(),
+        }, index=pd.Index(df_clean['SKU'].map(str).str.strip().to_numpy(dtype=object), name='SKU'))
+
+        # SKUs that only differ by surrounding whitespace: the last one wins
+        products_df = products_df[~products_df.index.duplicated(keep='last')]
+
+        self._set_products(products_df)
 
     def get_product(self, sku: str) -> Optional[Dict[str, any]]:
         """
@@ -53,7 +70,42 @@ class ProductManager:
         Returns:
             Dictionary with 'name' and 'physical_qty', or None if not found
         """
-        return self._product_map.get(str(sku).strip())
+        try:
+            pos = self._products_df.index.get_loc(str(sku).strip())
+        except KeyError:
+            return None
+        return {'name': self._names[pos], 'physical_qty': int(self._physical_qtys[pos])}
+
+    def get_products_batch(self, skus) -> pd.DataFrame:
+        """
+        Get product details for many SKUs at once
+
+        Args:
+            skus: Iterable of (already stripped) product SKUs
+
+        Returns:
+            DataFrame indexed by the given SKUs with 'name' and 'physical_qty'
+            columns; SKUs not in the product table get NaN
+        """
+        return self._products_df.reindex(skus)
+
+    def get_products(self, skus) -> Dict[str, Dict[str, any]]:
+        """
+        Get product details for many SKUs in one lookup
+
+        Args:
+            skus: Iterable of product SKUs
+
+        Returns:
+            Dictionary {sku: {'name', 'physical_qty'}} for the SKUs that exist
+            (keys are the stripped SKUs)
+        """
+        keys = list(dict.fromkeys(str(sku).strip() for sku in skus))
+        found = self.get_products_batch(keys).dropna(subset=['name'])
+        return {
+            sku: {'name': name, 'physical_qty': int(physical_qty)}
+            for sku, name, physical_qty in zip(found.index, found['name'], found['physical_qty'])
+        }
 
     def get_product_name(self, sku: str, fallback: Optional[str] = None) -> str:
         """
@@ -97,7 +149,17 @@ class ProductManager:
         Returns:
             True if product exists, False otherwise
         """
-        return str(sku).strip() in self._product_map
+        return str(sku).strip() in self._products_df.index
+
+    @property
+    def skus(self) -> FrozenSet[str]:
+        """
+        All product SKUs as a frozenset, for fast bulk membership tests
+
+        Returns:
+            Frozenset of product SKUs
+        """
+        return self._skus
 
     def get_all_skus(self) -> list:
         """
@@ -106,7 +168,7 @@ class ProductManager:
         Returns:
             List of all SKUs in the product map
         """
-        return list(self._product_map.keys())
+        return self._products_df.index.tolist()
 
     def count(self) -> int:
         """
@@ -115,8 +177,8 @@ class ProductManager:
         Returns:
             Number of products
         """
-        return len(self._product_map)
+        return len(self._products_df)
 
     def clear(self) -> None:
         """Clear the product map"""
-        self._product_map.clear()
+        self._set_products(self._products_df.iloc[:0])
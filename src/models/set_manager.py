@@ -1,6 +1,6 @@
 """Set Manager - handles set map from SETS sheet"""
 import pandas as pd
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 
 
 class SetManager:
@@ -9,6 +9,13 @@ class SetManager:
     def __init__(self):
         """Initialize empty set map"""
         self._set_map: Dict[str, List[Dict[str, any]]] = {}
+        self._set_skus: FrozenSet[str] = frozenset()
+        # Sets listed in the sheet without any usable component (left out of the set map)
+        self._empty_set_skus: List[str] = []
+        self._components_df: pd.DataFrame = self._build_components_df()
+        # Per-SKU lookup results - order files repeat the same SKUs many times
+        self._is_set_cache: Dict[str, bool] = {}
+        self._components_cache: Dict[str, Optional[List[Dict[str, any]]]] = {}
 
     def load_from_dataframe(self, df: pd.DataFrame) -> None:
         """
@@ -34,35 +41,60 @@ class SetManager:
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
 
-        # Check if SET_QUANTITY column exists
-        has_quantity_column = 'SET_QUANTITY' in df.columns
-
-        # Group by SET_SKU to collect all components
-        self._set_map = {}
-        grouped = df.groupby('SET_SKU')
-
-        for set_sku, group in grouped:
-            # Collect all component SKUs with quantities for this set
-            components = []
-            for _, row in group.iterrows():
-                component_sku = str(row['SKUs_in_SET']).strip()
-                if component_sku:  # Skip empty values
-                    # Get quantity from SET_QUANTITY column, default to 1
-                    if has_quantity_column:
-                        try:
-                            quantity = int(row['SET_QUANTITY'])
-                        except (ValueError, TypeError):
-                            quantity = 1
-                    else:
-                        quantity = 1
-
-                    components.append({
-                        'sku': component_sku,
-                        'quantity': quantity
-                    })
-
-            if components:  # Only add if there are components
-                self._set_map[str(set_sku).strip()] = components
+        # Rows without a set SKU cannot belong to any set
+        df = df[df['SET_SKU'].notna()]
+        set_skus = df['SET_SKU'].map(str).str.strip()
+        component_skus = df['SKUs_in_SET'].map(str).str.strip()
+
+        # Get quantity from SET_QUANTITY column, default to 1 for missing/invalid values
+        if 'SET_QUANTITY' in df.columns:
+            quantities = pd.to_numeric(df['SET_QUANTITY'], errors='coerce').fillna(1).astype('int64')
+        else:
+            quantities = pd.Series(1, index=df.index)
+
+        # Skip empty component values
+        valid = (component_skus != '').to_numpy()
+
+        # Collect all components per set in one pass (row order within a set is kept)
+        set_map: Dict[str, List[Dict[str, any]]] = {}
+        for set_sku, component_sku, quantity in zip(
+            set_skus[valid].tolist(), component_skus[valid].tolist(), quantities[valid].tolist()
+        ):
+            set_map.setdefault(set_sku, []).append({
+                'sku': component_sku,
+                'quantity': quantity
+            })
+
+        # Keep sets in sorted SKU order
+        self._set_map = {set_sku: set_map[set_sku] for set_sku in sorted(set_map)}
+
+        self._set_skus = frozenset(self._set_map)
+        self._empty_set_skus = sorted(set(set_skus.tolist()) - self._set_skus)
+        self._components_df = self._build_components_df()
+        self._clear_lookup_caches()
+
+    def _clear_lookup_caches(self) -> None:
+        """Drop memoized is_set/get_components results (call whenever the set map changes)"""
+        self._is_set_cache.clear()
+        self._components_cache.clear()
+
+    def _build_components_df(self) -> pd.DataFrame:
+        """
+        Flatten the set map into one row per set component
+
+        Returns:
+            DataFrame with set_sku, component_sku, set_quantity and
+            component_index (position of the component within its set)
+        """
+        records = [
+            (set_sku, component['sku'], component['quantity'], idx)
+            for set_sku, components in self._set_map.items()
+            for idx, component in enumerate(components)
+        ]
+        components_df = pd.DataFrame(
+            records, columns=['set_sku', 'component_sku', 'set_quantity', 'component_index']
+        )
+        return components_df.astype({'set_quantity': 'int32', 'component_index': 'int32'})
 
     def get_components(self, set_sku: str) -> Optional[List[Dict[str, any]]]:
         """
@@ -75,7 +107,25 @@ class SetManager:
             List of component dictionaries with 'sku' and 'quantity' keys,
             or None if set not found
         """
-        return self._set_map.get(str(set_sku).strip())
+        # Only plain strings are memoized: 1, 1.0 and True hash alike but normalize differently
+        if type(set_sku) is not str:
+            return self._set_map.get(str(set_sku).strip())
+
+        try:
+            return self._components_cache[set_sku]
+        except KeyError:
+            components = self._components_cache[set_sku] = self._set_map.get(set_sku.strip())
+            return components
+
+    def get_components_df(self) -> pd.DataFrame:
+        """
+        Get all set components as a flat, join-ready DataFrame
+
+        Returns:
+            DataFrame with set_sku, component_sku, set_quantity and
+            component_index columns, one row per component
+        """
+        return self._components_df
 
     def get_component_skus(self, set_sku: str) -> Optional[List[str]]:
         """
@@ -102,7 +152,24 @@ class SetManager:
         Returns:
             True if SKU is a set, False otherwise
         """
-        return str(sku).strip() in self._set_map
+        if type(sku) is not str:
+            return str(sku).strip() in self._set_map
+
+        try:
+            return self._is_set_cache[sku]
+        except KeyError:
+            result = self._is_set_cache[sku] = sku.strip() in self._set_map
+            return result
+
+    @property
+    def set_skus(self) -> FrozenSet[str]:
+        """
+        All set SKUs as a frozenset, for fast bulk membership tests
+
+        Returns:
+            Frozenset of set SKUs
+        """
+        return self._set_skus
 
     def get_all_set_skus(self) -> list:
         """
@@ -113,6 +180,17 @@ class SetManager:
         """
         return list(self._set_map.keys())
 
+    def empty_set_skus(self) -> List[str]:
+        """
+        Get SKUs of sets that were listed without any component
+
+        These sets are not part of the set map (is_set() is False for them).
+
+        Returns:
+            Sorted list of set SKUs
+        """
+        return list(self._empty_set_skus)
+
     def count(self) -> int:
         """
         Get number of sets in the map
@@ -138,3 +216,7 @@ class SetManager:
     def clear(self) -> None:
         """Clear the set map"""
         self._set_map.clear()
+        self._set_skus = frozenset()
+        self._empty_set_skus = []
+        self._components_df = self._build_components_df()
+        self._clear_lookup_caches()
@@ -1,29 +1,50 @@
 """Main GUI window for Decoder Tool application v2.2 - Enhanced Edition"""
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-import sys
+from typing import Callable, List, Optional, Tuple
 import os
+import sys
+import time
 import pandas as pd
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from src.models.product_manager import ProductManager
-from src.models.set_manager import SetManager
-from src.models.addition_manager import AdditionManager
-from src.models.order_processor import OrderProcessor
-from src.models.client_profile_manager import ClientProfileManager
-from src.utils.file_handlers import MasterFileLoader, OrdersFileLoader
-from src.utils.column_mapper import ColumnMapper
-from src.ui.preview_window import show_preview
-from src.ui.profile_manager_window import show_profile_manager
-from src.ui.ui_constants import ICONS, COLORS, TOOLTIPS, FONTS, PADDING, WINDOW_SIZES, STATUS_MESSAGES
-from src.ui.ui_utils import (ToolTip, create_button_with_icon, StatusBar, set_status_color,
-                              show_context_menu, confirm_dialog, info_dialog, error_dialog, warning_dialog)
-from src.utils.file_history import FileHistory
-from src.utils.error_logger import ErrorLogger, CrashRecovery, get_logger
+from ..models.product_manager import ProductManager
+from ..models.set_manager import SetManager
+from ..models.addition_manager import AdditionManager
+from ..models.order_processor import OrderProcessor
+from ..models.client_profile_manager import ClientProfileManager
+from ..utils.file_handlers import MasterFileLoader, OrdersFileLoader
+from ..utils.column_mapper import ColumnMapper
+from ..utils.pandas_compat import enable_copy_on_write
+from .preview_window import show_preview
+from .profile_manager_window import show_profile_manager
+from .ui_constants import ICONS, COLORS, TOOLTIPS, FONTS, PADDING, WINDOW_SIZES, STATUS_MESSAGES
+from .ui_utils import (ToolTip, create_button_with_icon, StatusBar, set_status_color,
+                       show_context_menu, confirm_dialog, info_dialog, error_dialog, warning_dialog,
+                       show_toast)
+from ..utils.file_history import FileHistory
+from ..utils.error_logger import ErrorLogger, CrashRecovery, get_logger
+
+# How often (ms) the Tk loop checks whether a background job has finished
+BACKGROUND_POLL_MS = 50
+
+# Minimum time (ms) between forced status bar repaints
+STATUS_FLUSH_MS = 50
+
+# Orders with more rows than this can be validated on a random sample instead
+VALIDATION_SAMPLE_THRESHOLD = 500_000
+VALIDATION_SAMPLE_ROWS = 100_000
+
+# Process section info label: (text, color) per state, built once
+_PROCESS_READY_FMT = (f"{ICONS['ok']} Ready to process: "
+                      "{products} products, {sets} sets, {orders} order rows")
+_PROCESS_INFO_STATIC = {
+    (True, False): (f"{ICONS['info']} Master file loaded. Please load orders to continue.", COLORS['info']),
+    (False, True): (f"{ICONS['warning']} Orders loaded. Please load master file to continue.", COLORS['warning']),
+    (False, False): ("Load master file and orders to begin processing", COLORS['default']),
+}
+_COLOR_SUCCESS = COLORS['success']
 
 
 class DecoderToolApp:
@@ -63,8 +84,21 @@ class DecoderToolApp:
         self.master_loaded = False
         self.orders_loaded = False
         self.current_master_file = None
-        self.current_orders_files = []
+        # Orders files are kept as a folder plus file names; full paths are
+        # only joined when needed (see current_orders_files)
+        self._orders_folder = None
+        self._orders_file_names = []
         self.current_profile_id = None  # Currently selected profile
+        self._last_master_menu_sig = None  # What the master recent menu currently shows
+        self._busy = False  # A file load or processing job is running in the background
+        self._last_process_info = None  # (text, color) the process info label currently shows
+        self._last_flush_ns = 0  # When _update_status last forced a repaint
+        self._order_checks = {}  # Validation results for the orders at _order_checks_revision
+        self._order_checks_revision = None
+        self._toast = None  # Confirmation message currently shown (see _show_toast)
+
+        # Worker threads for file parsing, so the Tk loop keeps running meanwhile
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
 
         # Undo/Redo stacks
         self.undo_stack = []
@@ -76,11 +110,65 @@ class DecoderToolApp:
         # Create UI
         self._create_ui()
 
+        # Load the file dialog code once the window is up, not on the first click
+        self.root.after_idle(self._prewarm_dialogs)
+
         # Set up window close handler
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
 
         self.logger.log_info("UI initialized successfully", "MainWindow")
 
+    def _prewarm_dialogs(self):
+        """
+        Load Tk's script-level file dialogs ahead of their first use
+
+        On X11 the open/save and folder dialogs are Tcl code loaded on first
+        use, which shows up as a pause on the first Browse click. Windows and
+        macOS use native dialogs, where this does nothing.
+        """
+        try:
+            self.root.tk.call('auto_load', '::tk::dialog::file::Create')
+            self.root.tk.call('auto_load', '::tk::dialog::file::chooseDir::')
+        except tk.TclError as e:
+            self.logger.log_debug("File dialog prewarm skipped: %s", "MainWindow", e)
+
+    def _show_toast(self, message: str, status_type: str = 'success'):
+        """
+        Confirm an action with a message that goes away by itself (no modal dialog)
+
+        Args:
+            message: Message text
+            status_type: Status type for the background color
+        """
+        # Only the latest message is shown
+        if self._toast is not None and self._toast.winfo_exists():
+            self._toast.destroy()
+        self._toast = show_toast(self.root, message, status_type)
+
+    def _remember_dialog_dir(self, dialog: str, directory: str):
+        """
+        Open a file dialog in this directory next time (also after a restart)
+
+        Args:
+            dialog: Dialog name passed to FileHistory.get_last_dir
+            directory: Directory the user picked a file in (or picked)
+        """
+        if self.file_history.set_last_dir(dialog, directory):
+            # Write the file once the dialog has closed and the UI is idle
+            self.root.after_idle(self.file_history.save_last_dirs)
+
+    @property
+    def current_orders_files(self) -> List[str]:
+        """Full paths of the loaded orders files"""
+        if self._orders_folder is None:
+            return list(self._orders_file_names)
+        return [os.path.join(self._orders_folder, name) for name in self._orders_file_names]
+
+    @current_orders_files.setter
+    def current_orders_files(self, file_paths: List[str]):
+        self._orders_folder = None
+        self._orders_file_names = list(file_paths)
+
     def _check_crash_recovery(self):
         """Check if there's a crash recovery state"""
         if self.crash_recovery.has_recovery_state():
@@ -93,34 +181,49 @@ class DecoderToolApp:
                 if state:
                     self.logger.log_info("Restored previous session state", "CrashRecovery")
                     # Restore master file if available
-                    if 'master_file' in state and Path(state['master_file']).exists():
+                    if 'master_file' in state and os.path.isfile(state['master_file']):
                         self.current_master_file = state['master_file']
                     # Restore orders if available
                     if 'orders_files' in state:
-                        self.current_orders_files = [f for f in state['orders_files'] if Path(f).exists()]
+                        self.current_orders_files = [f for f in state['orders_files'] if os.path.isfile(f)]
 
             # Clear recovery state after check
             self.crash_recovery.clear_state()
 
     def _setup_autosave(self):
         """Set up periodic auto-save of application state"""
-        def autosave():
-            try:
-                state = {
-                    'master_file': self.current_master_file,
-                    'orders_files': self.current_orders_files,
-                    'master_loaded': self.master_loaded,
-                    'orders_loaded': self.orders_loaded,
-                }
-                self.crash_recovery.save_state(state)
-            except Exception as e:
-                self.logger.log_error(f"Autosave failed: {str(e)}", "Autosave")
-            finally:
-                # Schedule next autosave in 60 seconds
-                self.root.after(60000, autosave)
+        # State written by the last autosave; unchanged state isn't written again
+        self._last_autosave_state = None
 
         # Start autosave after 60 seconds
-        self.root.after(60000, autosave)
+        self.root.after(60000, self._autosave_tick)
+
+    def _get_session_state(self) -> dict:
+        """
+        Get the application state stored for crash recovery
+
+        Returns:
+            Dictionary with loaded files and load flags
+        """
+        return {
+            'master_file': self.current_master_file,
+            'orders_files': self.current_orders_files,
+            'master_loaded': self.master_loaded,
+            'orders_loaded': self.orders_loaded,
+        }
+
+    def _autosave_tick(self):
+        """Save application state if it changed since the last autosave, then reschedule"""
+        try:
+            state = self._get_session_state()
+            if state != self._last_autosave_state:
+                self.crash_recovery.save_state(dict(state))
+                self._last_autosave_state = state
+        except Exception as e:
+            self.logger.log_error("Autosave failed: %s", "Autosave", e)
+        finally:
+            # Schedule next autosave in 60 seconds
+            self.root.after(60000, self._autosave_tick)
 
     def _create_ui(self):
         """Create the main UI layout"""
@@ -194,11 +297,11 @@ class DecoderToolApp:
         buttons_frame.grid(row=0, column=0, sticky=tk.W, padx=PADDING['small'])
 
         # Load button
-        load_btn = create_button_with_icon(
+        self.load_master_btn = create_button_with_icon(
             buttons_frame, "Load Master File", ICONS['load'],
             self._load_master_file, TOOLTIPS['load_master']
         )
-        load_btn.pack(side=tk.LEFT, padx=(0, PADDING['small']))
+        self.load_master_btn.pack(side=tk.LEFT, padx=(0, PADDING['small']))
 
         # Reload button
         self.reload_master_btn = create_button_with_icon(
@@ -282,18 +385,18 @@ class DecoderToolApp:
         load_frame.grid(row=0, column=0, sticky=tk.W, padx=PADDING['small'], pady=PADDING['small'])
 
         # Load single file button
-        load_single_btn = create_button_with_icon(
+        self.load_single_btn = create_button_with_icon(
             load_frame, "Load Single CSV", ICONS['file'],
             self._load_orders, TOOLTIPS['load_single']
         )
-        load_single_btn.pack(side=tk.LEFT, padx=(0, PADDING['small']))
+        self.load_single_btn.pack(side=tk.LEFT, padx=(0, PADDING['small']))
 
         # Load folder button
-        load_folder_btn = create_button_with_icon(
+        self.load_folder_btn = create_button_with_icon(
             load_frame, "Load Folder", ICONS['folder'],
             self._load_orders_folder, TOOLTIPS['load_folder']
         )
-        load_folder_btn.pack(side=tk.LEFT, padx=(0, PADDING['small']))
+        self.load_folder_btn.pack(side=tk.LEFT, padx=(0, PADDING['small']))
 
         # Reload button
         self.reload_orders_btn = create_button_with_icon(
@@ -334,11 +437,17 @@ class DecoderToolApp:
         ToolTip(self.quantity_entry, "Enter quantity to add")
 
         # Add button
-        add_btn = create_button_with_icon(
+        self.add_product_btn = create_button_with_icon(
             manual_frame, "Add Product", ICONS['add'],
             self._add_manual_product, TOOLTIPS['add_product']
         )
-        add_btn.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=PADDING['normal'])
+        self.add_product_btn.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=PADDING['normal'])
+
+        # Keyboard entry: Return moves to the next field, and on Quantity adds the
+        # product (like the Add button, not while a background job runs)
+        self.order_id_entry.bind('<Return>', lambda e: self.sku_entry.focus_set())
+        self.sku_entry.bind('<Return>', lambda e: self.quantity_entry.focus_set())
+        self.quantity_entry.bind('<Return>', lambda e: None if self._busy else self._add_manual_product())
 
     def _create_utilities_section(self, parent, row):
         """Create Section 2.5: Data Processing Utilities with enhanced validation"""
@@ -348,25 +457,25 @@ class DecoderToolApp:
         section.columnconfigure(1, weight=1)
 
         # Generate SKU button
-        sku_btn = create_button_with_icon(
+        self.generate_skus_btn = create_button_with_icon(
             section, "Generate Missing SKUs", ICONS['generate'],
             self._generate_skus, TOOLTIPS['generate_skus']
         )
-        sku_btn.grid(row=0, column=0, sticky=tk.W, padx=(0, PADDING['small']), pady=PADDING['tiny'])
+        self.generate_skus_btn.grid(row=0, column=0, sticky=tk.W, padx=(0, PADDING['small']), pady=PADDING['tiny'])
 
         # Validate button
-        validate_btn = create_button_with_icon(
+        self.validate_btn = create_button_with_icon(
             section, "Validate Data", ICONS['validate'],
             self._validate_data_enhanced, TOOLTIPS['validate']
         )
-        validate_btn.grid(row=1, column=0, sticky=tk.W, padx=(0, PADDING['small']), pady=PADDING['tiny'])
+        self.validate_btn.grid(row=1, column=0, sticky=tk.W, padx=(0, PADDING['small']), pady=PADDING['tiny'])
 
         # Check duplicates button
-        dup_btn = create_button_with_icon(
+        self.check_duplicates_btn = create_button_with_icon(
             section, "Check Duplicates", ICONS['search'],
             self._check_duplicates, TOOLTIPS['check_duplicates']
         )
-        dup_btn.grid(row=2, column=0, sticky=tk.W, padx=(0, PADDING['small']), pady=PADDING['tiny'])
+        self.check_duplicates_btn.grid(row=2, column=0, sticky=tk.W, padx=(0, PADDING['small']), pady=PADDING['tiny'])
 
         # Statistics label
         self.utils_status_label = ttk.Label(section, text="", font=FONTS['default'])
@@ -383,12 +492,12 @@ class DecoderToolApp:
         button_frame = ttk.Frame(section)
         button_frame.pack(pady=PADDING['normal'])
 
-        preview_btn = create_button_with_icon(
+        self.preview_btn = create_button_with_icon(
             button_frame, "Preview & Save Results", ICONS['preview'],
             self._preview_results, TOOLTIPS['preview_save'],
             width=25
         )
-        preview_btn.pack()
+        self.preview_btn.pack()
 
         # Help text
         help_label = ttk.Label(
@@ -417,29 +526,18 @@ class DecoderToolApp:
         """Update process section info label with current state"""
         if hasattr(self, 'process_info_label'):
             if self.master_loaded and self.orders_loaded:
-                product_count = self.product_manager.count()
-                set_count = self.set_manager.count()
-                orders_df = self.order_processor.get_orders_dataframe()
-                order_count = len(orders_df) if orders_df is not None else 0
-
-                info_text = (f"{ICONS['ok']} Ready to process: "
-                           f"{product_count} products, {set_count} sets, {order_count} order rows")
-                self.process_info_label.config(text=info_text, foreground=COLORS['success'])
-            elif self.master_loaded:
-                self.process_info_label.config(
-                    text=f"{ICONS['info']} Master file loaded. Please load orders to continue.",
-                    foreground=COLORS['info']
-                )
-            elif self.orders_loaded:
-                self.process_info_label.config(
-                    text=f"{ICONS['warning']} Orders loaded. Please load master file to continue.",
-                    foreground=COLORS['warning']
-                )
+                # get_order_count() doesn't flush pending additions or copy the frame
+                info = (_PROCESS_READY_FMT.format(products=self.product_manager.count(),
+                                                  sets=self.set_manager.count(),
+                                                  orders=self.order_processor.get_order_count()),
+                        _COLOR_SUCCESS)
             else:
-                self.process_info_label.config(
-                    text="Load master file and orders to begin processing",
-                    foreground=COLORS['default']
-                )
+                info = _PROCESS_INFO_STATIC[(self.master_loaded, self.orders_loaded)]
+
+            # Reconfiguring the label makes Tk redraw it, so only do it on change
+            if info != self._last_process_info:
+                self._last_process_info = info
+                self.process_info_label.config(text=info[0], foreground=info[1])
 
     def _create_status_bar(self, parent, row):
         """Create enhanced status bar with multiple sections"""
@@ -451,7 +549,7 @@ class DecoderToolApp:
         self.logger.log_debug("Status bar initialized", "StatusBar")
 
     def _update_status(self, message: str, status_type: str = 'default',
-                      info: str = "", counter: str = ""):
+                      info: str = "", counter: str = "", flush: bool = False):
         """
         Update status bar with message and optional info/counter
 
@@ -460,141 +558,287 @@ class DecoderToolApp:
             status_type: Status type for color coding
             info: Optional info message (center)
             counter: Optional counter text (right)
+            flush: Repaint right away, only needed before blocking work on the
+                   Tk thread that would otherwise keep the message from showing
+                   (at most once per STATUS_FLUSH_MS); otherwise Tk repaints
+                   when idle, e.g. while a _run_task job runs
         """
         self.status_bar.set_status(message, status_type)
         if info:
             self.status_bar.set_info(info)
         if counter:
             self.status_bar.set_counter(counter)
-        self.root.update_idletasks()
+
+        if flush:
+            now = time.monotonic_ns()
+            if now - self._last_flush_ns >= STATUS_FLUSH_MS * 1_000_000:
+                self._last_flush_ns = now
+                self.root.update_idletasks()
 
     # ==================== Master File Operations ====================
 
+    def _run_in_background(self, func: Callable, *args, on_done: Callable) -> None:
+        """
+        Run func(*args) on a worker thread and report back on the Tk thread
+
+        Args:
+            func: Function to run (must not touch Tk widgets)
+            *args: Arguments for func
+            on_done: Called as on_done(result, error) once func finished;
+                     error is None on success
+        """
+        future = self._io_pool.submit(func, *args)
+
+        def poll():
+            if not future.done():
+                self.root.after(BACKGROUND_POLL_MS, poll)
+                return
+            error = future.exception()
+            on_done(None if error is not None else future.result(), error)
+
+        self.root.after(BACKGROUND_POLL_MS, poll)
+
+    def _set_busy(self, busy: bool) -> None:
+        """
+        Disable the action buttons while a background job runs, and restore them after
+
+        Reload and Pin buttons are only re-enabled if there is something to reload.
+
+        Args:
+            busy: True when a job starts, False when it has finished
+        """
+        self._busy = busy
+        state = 'disabled' if busy else 'normal'
+        for button in (self.load_master_btn, self.load_single_btn, self.load_folder_btn,
+                       self.add_product_btn, self.generate_skus_btn, self.validate_btn,
+                       self.check_duplicates_btn, self.preview_btn):
+            button.config(state=state)
+
+        master_state = 'normal' if not busy and self.master_loaded else 'disabled'
+        self.reload_master_btn.config(state=master_state)
+        self.pin_master_btn.config(state=master_state)
+        self.reload_orders_btn.config(state='normal' if not busy and self.orders_loaded else 'disabled')
+
+    def _run_task(self, func: Callable, *args, on_finished: Callable, on_failed: Callable) -> None:
+        """
+        Run one job at a time in the background, with the action buttons disabled meanwhile
+
+        The job may read and update the models (nothing else can change them
+        while it runs) but must not touch Tk widgets; the callbacks run on the
+        Tk thread.
+
+        Args:
+            func: Function to run
+            *args: Arguments for func
+            on_finished: Called as on_finished(result) if func succeeded
+            on_failed: Called as on_failed(error) if func raised
+        """
+        if self._busy:
+            return
+        self._set_busy(True)
+
+        def done(result, error):
+            self._set_busy(False)
+            if error is not None:
+                on_failed(error)
+            else:
+                on_finished(result)
+
+        self._run_in_background(func, *args, on_done=done)
+
+    def _start_master_load(self, file_path: str, on_loaded: Callable, on_failed: Callable) -> None:
+        """
+        Parse a master file in the background with the action buttons disabled
+
+        Args:
+            file_path: Path to master XLSX file
+            on_loaded: Called as on_loaded(file_path, sheets) with the parsed sheets
+            on_failed: Called as on_failed(error) if parsing failed
+        """
+        if self._busy:
+            return
+
+        self.master_status_label.config(text=f"⏳ {STATUS_MESSAGES['loading']} {Path(file_path).name}")
+        set_status_color(self.master_status_label, 'info')
+
+        def loaded(sheets):
+            self._restore_master_status_label()
+            on_loaded(file_path, sheets)
+
+        def failed(error):
+            self._restore_master_status_label()
+            on_failed(error)
+
+        self._run_task(MasterFileLoader.load_cached, file_path, on_finished=loaded, on_failed=failed)
+
+    def _restore_master_status_label(self):
+        """Show the currently loaded master file (or none) in the master status label"""
+        if self.master_loaded and self.current_master_file:
+            self.master_status_label.config(
+                text=f"{ICONS['ok']} Master file loaded: {Path(self.current_master_file).name}"
+            )
+            set_status_color(self.master_status_label, 'success')
+        else:
+            self.master_status_label.config(text=STATUS_MESSAGES['no_master'])
+            set_status_color(self.master_status_label, 'default')
+
+    def _apply_master_sheets(self, products_df: pd.DataFrame, sets_df: pd.DataFrame,
+                             additions_df: Optional[pd.DataFrame]):
+        """
+        Load parsed master sheets into the product, set and addition managers
+
+        Args:
+            products_df: PRODUCTS sheet
+            sets_df: SETS sheet
+            additions_df: ADDITION sheet, or None if the file has none
+        """
+        self.product_manager.clear()
+        self.product_manager.load_from_dataframe(products_df)
+
+        self.set_manager.clear()
+        self.set_manager.load_from_dataframe(sets_df)
+
+        # Load addition rules if available
+        self.addition_manager.clear()
+        if additions_df is not None:
+            try:
+                self.addition_manager.load_from_dataframe(additions_df)
+                addition_count = self.addition_manager.count()
+                if addition_count > 0:
+                    self.logger.log_info("Loaded %d addition rules", "AdditionRules", addition_count)
+            except Exception as e:
+                self.logger.log_warning("Could not load addition rules: %s", "AdditionRules", e)
+
+    def _apply_master_frames(self, file_path: str, sheets: tuple) -> Tuple[int, int]:
+        """
+        Make a parsed master file the current one
+
+        Loads the sheets into the managers, records the file in history and
+        updates the master section and process info.
+
+        Args:
+            file_path: Path of the parsed master file
+            sheets: (products_df, sets_df, additions_df) from MasterFileLoader
+
+        Returns:
+            Tuple of (product_count, set_count)
+        """
+        self._apply_master_sheets(*sheets)
+
+        # Update state
+        self.master_loaded = True
+        self.current_master_file = file_path
+
+        # Add to history
+        self.file_history.add_recent(file_path, 'master')
+        self._update_master_recent_menu()
+
+        # Update UI
+        self._restore_master_status_label()
+        self._update_process_info()
+
+        # Enable reload and pin buttons
+        self.reload_master_btn.config(state='normal')
+        self.pin_master_btn.config(state='normal')
+        self._update_pin_button_text()
+
+        return self.product_manager.count(), self.set_manager.count()
+
     def _load_master_file(self):
         """Load master file with error handling and history tracking"""
+        if self._busy:
+            return
+
         try:
             file_path = filedialog.askopenfilename(
                 title="Select Master File",
                 filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
-                initialdir=str(Path.home())
+                initialdir=self.file_history.get_last_dir('master')
             )
 
             if not file_path:
                 return
+            self._remember_dialog_dir('master', os.path.dirname(file_path))
 
             self._update_status("Loading master file...", 'info')
-            self.logger.log_info(f"Loading master file: {file_path}", "MasterFile")
-
-            # Load products, sets, and optional additions
-            products_df, sets_df, additions_df = MasterFileLoader.load(file_path)
-
-            self.product_manager.clear()
-            self.product_manager.load_from_dataframe(products_df)
-
-            self.set_manager.clear()
-            self.set_manager.load_from_dataframe(sets_df)
-
-            # Load addition rules if available
-            self.addition_manager.clear()
-            if additions_df is not None:
-                try:
-                    self.addition_manager.load_from_dataframe(additions_df)
-                    addition_count = self.addition_manager.count()
-                    if addition_count > 0:
-                        self.logger.log_info(f"Loaded {addition_count} addition rules", "AdditionRules")
-                except Exception as e:
-                    self.logger.log_warning(f"Could not load addition rules: {str(e)}", "AdditionRules")
-
-            # Update state
-            self.master_loaded = True
-            self.current_master_file = file_path
-
-            # Add to history
-            self.file_history.add_recent(file_path, 'master')
-            self._update_master_recent_menu()
+            self.logger.log_info("Loading master file: %s", "MasterFile", file_path)
 
-            # Update UI
-            file_name = Path(file_path).name
-            status_text = f"{ICONS['ok']} Master file loaded: {file_name}"
-            self.master_status_label.config(text=status_text)
-            self._update_process_info()
-            set_status_color(self.master_status_label, 'success')
+            # Parse products, sets, and optional additions off the Tk thread
+            self._start_master_load(file_path, self._finish_load_master_file,
+                                    self._on_load_master_file_failed)
 
-            # Enable reload and pin buttons
-            self.reload_master_btn.config(state='normal')
-            self.pin_master_btn.config(state='normal')
-            self._update_pin_button_text()
+        except Exception as e:
+            self._on_load_master_file_failed(e)
+
+    def _finish_load_master_file(self, file_path: str, sheets: tuple):
+        """Apply a master file parsed by _load_master_file"""
+        try:
+            product_count, set_count = self._apply_master_frames(file_path, sheets)
 
             # Update status bar
-            product_count = self.product_manager.count()
-            set_count = self.set_manager.count()
             self._update_status(
                 "Master file loaded successfully", 'success',
                 info=f"{product_count} products, {set_count} sets loaded"
             )
 
-            self.logger.log_info(f"Master file loaded: {product_count} products, {set_count} sets", "MasterFile")
+            self.logger.log_info("Master file loaded: %d products, %d sets", "MasterFile", product_count, set_count)
 
-            info_dialog(self.root, "Success",
-                       f"Master file loaded successfully!\n\n"
-                       f"Products: {product_count}\n"
-                       f"Sets: {set_count}")
+            self._show_toast(f"Master file loaded successfully!\n"
+                             f"Products: {product_count}, Sets: {set_count}")
 
         except Exception as e:
-            self.logger.log_exception(e, "Load Master File")
-            self._update_status(f"Error loading master file", 'error')
-            error_dialog(self.root, "Error", f"Failed to load master file:\n{str(e)}")
+            self._on_load_master_file_failed(e)
+
+    def _on_load_master_file_failed(self, e: Exception):
+        """Report a failed _load_master_file"""
+        self.logger.log_exception(e, "Load Master File")
+        self._update_status(f"Error loading master file", 'error')
+        error_dialog(self.root, "Error", f"Failed to load master file:\n{str(e)}")
 
     def _reload_master_file(self):
         """Reload the current master file"""
-        if not self.current_master_file or not Path(self.current_master_file).exists():
+        # Also reachable from the context menu, which stays enabled during a job
+        if self._busy:
+            return
+
+        if not self.current_master_file or not os.path.isfile(self.current_master_file):
             error_dialog(self.root, "Error", "No master file to reload or file not found")
             return
 
         try:
             self._update_status("Reloading master file...", 'info')
-            self.logger.log_info(f"Reloading master file: {self.current_master_file}", "MasterFile")
-
-            # Save current file path
-            file_path = self.current_master_file
+            self.logger.log_info("Reloading master file: %s", "MasterFile", self.current_master_file)
 
-            # Load products, sets, and optional additions
-            products_df, sets_df, additions_df = MasterFileLoader.load(file_path)
+            # Parse products, sets, and optional additions off the Tk thread
+            self._start_master_load(self.current_master_file, self._finish_reload_master_file,
+                                    self._on_reload_master_file_failed)
 
-            self.product_manager.clear()
-            self.product_manager.load_from_dataframe(products_df)
-
-            self.set_manager.clear()
-            self.set_manager.load_from_dataframe(sets_df)
+        except Exception as e:
+            self._on_reload_master_file_failed(e)
 
-            # Load addition rules if available
-            self.addition_manager.clear()
-            if additions_df is not None:
-                try:
-                    self.addition_manager.load_from_dataframe(additions_df)
-                    addition_count = self.addition_manager.count()
-                    if addition_count > 0:
-                        self.logger.log_info(f"Loaded {addition_count} addition rules", "AdditionRules")
-                except Exception as e:
-                    self.logger.log_warning(f"Could not load addition rules: {str(e)}", "AdditionRules")
+    def _finish_reload_master_file(self, file_path: str, sheets: tuple):
+        """Apply a master file parsed by _reload_master_file"""
+        try:
+            product_count, set_count = self._apply_master_frames(file_path, sheets)
 
             # Update status
-            product_count = self.product_manager.count()
-            set_count = self.set_manager.count()
-
             self._update_status(
                 "Master file reloaded", 'success',
                 info=f"{product_count} products, {set_count} sets"
             )
 
-            self.logger.log_info(f"Master file reloaded successfully", "MasterFile")
+            self.logger.log_info("Master file reloaded successfully", "MasterFile")
 
-            info_dialog(self.root, "Success", f"Master file reloaded!\n\n"
-                       f"Products: {product_count}\nSets: {set_count}")
+            self._show_toast(f"Master file reloaded!\n"
+                             f"Products: {product_count}, Sets: {set_count}")
 
         except Exception as e:
-            self.logger.log_exception(e, "Reload Master File")
-            error_dialog(self.root, "Error", f"Failed to reload master file:\n{str(e)}")
+            self._on_reload_master_file_failed(e)
+
+    def _on_reload_master_file_failed(self, e: Exception):
+        """Report a failed _reload_master_file"""
+        self.logger.log_exception(e, "Reload Master File")
+        error_dialog(self.root, "Error", f"Failed to reload master file:\n{str(e)}")
 
     def _toggle_pin_master(self):
         """Toggle pin/unpin for current master file"""
@@ -605,13 +849,13 @@ class DecoderToolApp:
             if self.file_history.is_favorite(self.current_master_file):
                 # Unpin
                 self.file_history.remove_favorite(self.current_master_file)
-                self.logger.log_info(f"Unpinned: {self.current_master_file}", "Favorites")
+                self.logger.log_info("Unpinned: %s", "Favorites", self.current_master_file)
                 info_dialog(self.root, "Unpinned", "Master file removed from favorites")
             else:
                 # Pin
                 nickname = Path(self.current_master_file).stem
                 self.file_history.add_favorite(self.current_master_file, 'master', nickname)
-                self.logger.log_info(f"Pinned: {self.current_master_file}", "Favorites")
+                self.logger.log_info("Pinned: %s", "Favorites", self.current_master_file)
                 info_dialog(self.root, "Pinned", "Master file added to favorites!")
 
             self._update_pin_button_text()
@@ -629,11 +873,23 @@ class DecoderToolApp:
             self.pin_master_btn.config(text=f"{ICONS['pin']} Pin")
 
     def _update_master_recent_menu(self):
-        """Update recent/favorites menu for master files"""
+        """Update recent/favorites menu for master files (skipped if nothing changed)"""
+        favorites = self.file_history.get_favorites('master')
+        recent = self.file_history.get_recent('master', limit=5)
+
+        # Rebuilding the menu costs a Tcl round trip per entry - only do it
+        # when the favorites or recent files actually changed
+        menu_sig = (
+            tuple((fav['path'], fav.get('nickname')) for fav in favorites),
+            tuple(recent_file['path'] for recent_file in recent),
+        )
+        if menu_sig == self._last_master_menu_sig:
+            return
+        self._last_master_menu_sig = menu_sig
+
         self.master_recent_menu.delete(0, 'end')
 
         # Add favorites
-        favorites = self.file_history.get_favorites('master')
         if favorites:
             self.master_recent_menu.add_command(label="=== FAVORITES ===", state='disabled')
             for fav in favorites:
@@ -645,7 +901,6 @@ class DecoderToolApp:
                 )
 
         # Add recent files
-        recent = self.file_history.get_recent('master', limit=5)
         if recent:
             if favorites:
                 self.master_recent_menu.add_separator()
@@ -671,7 +926,12 @@ class DecoderToolApp:
 
     def _load_master_from_path(self, file_path: str):
         """Load master file from specific path"""
-        if not Path(file_path).exists():
+        # The recent-files menu stays enabled during a job; don't announce a
+        # load that _start_master_load would refuse
+        if self._busy:
+            return
+
+        if not os.path.isfile(file_path):
             error_dialog(self.root, "Error", f"File not found:\n{file_path}")
             self.file_history.remove_recent(file_path)
             self._update_master_recent_menu()
@@ -680,49 +940,30 @@ class DecoderToolApp:
         try:
             self._update_status(f"Loading {Path(file_path).name}...", 'info')
 
-            products_df, sets_df, additions_df = MasterFileLoader.load(file_path)
-
-            self.product_manager.clear()
-            self.product_manager.load_from_dataframe(products_df)
-
-            self.set_manager.clear()
-            self.set_manager.load_from_dataframe(sets_df)
-
-            # Load addition rules if available
-            self.addition_manager.clear()
-            if additions_df is not None:
-                try:
-                    self.addition_manager.load_from_dataframe(additions_df)
-                    addition_count = self.addition_manager.count()
-                    if addition_count > 0:
-                        self.logger.log_info(f"Loaded {addition_count} addition rules", "AdditionRules")
-                except Exception as e:
-                    self.logger.log_warning(f"Could not load addition rules: {str(e)}", "AdditionRules")
+            # Parse products, sets, and optional additions off the Tk thread
+            self._start_master_load(file_path, self._finish_load_master_from_path,
+                                    self._on_load_master_from_path_failed)
 
-            self.master_loaded = True
-            self.current_master_file = file_path
-
-            self.file_history.add_recent(file_path, 'master')
-            self._update_master_recent_menu()
-
-            file_name = Path(file_path).name
-            self.master_status_label.config(text=f"{ICONS['ok']} Loaded: {file_name}")
-            set_status_color(self.master_status_label, 'success')
+        except Exception as e:
+            self._on_load_master_from_path_failed(e)
 
-            self.reload_master_btn.config(state='normal')
-            self.pin_master_btn.config(state='normal')
-            self._update_pin_button_text()
+    def _finish_load_master_from_path(self, file_path: str, sheets: tuple):
+        """Apply a master file parsed by _load_master_from_path"""
+        try:
+            product_count, set_count = self._apply_master_frames(file_path, sheets)
 
-            product_count = self.product_manager.count()
-            set_count = self.set_manager.count()
             self._update_status(
                 "Master file loaded", 'success',
                 info=f"{product_count} products, {set_count} sets"
             )
 
         except Exception as e:
-            self.logger.log_exception(e, "Load Master from Path")
-            error_dialog(self.root, "Error", f"Failed to load file:\n{str(e)}")
+            self._on_load_master_from_path_failed(e)
+
+    def _on_load_master_from_path_failed(self, e: Exception):
+        """Report a failed _load_master_from_path"""
+        self.logger.log_exception(e, "Load Master from Path")
+        error_dialog(self.root, "Error", f"Failed to load file:\n{str(e)}")
 
     def _clear_master_history(self):
         """Clear master file history"""
@@ -793,21 +1034,34 @@ class DecoderToolApp:
         try:
             file_path = filedialog.askopenfilename(
                 title="Select Orders CSV File",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-                initialdir=str(Path.home())
+                filetypes=[("CSV files", "*.csv *.csv.gz"), ("All files", "*.*")],
+                initialdir=self.file_history.get_last_dir('orders')
             )
 
             if not file_path:
                 return
+            self._remember_dialog_dir('orders', os.path.dirname(file_path))
 
             self._update_status("Loading orders...", 'info')
-            self.logger.log_info(f"Loading orders: {file_path}", "Orders")
+            self.logger.log_info("Loading orders: %s", "Orders", file_path)
 
             # Get column mapper from current profile
             column_mapper = self._get_current_column_mapper()
 
-            # Load with column mapping if profile is selected
-            orders_df = OrdersFileLoader.load(file_path, column_mapper)
+            # Parse with column mapping (if profile is selected) off the Tk thread
+            self._run_task(
+                OrdersFileLoader.load, file_path, column_mapper,
+                on_finished=lambda orders_df: self._finish_load_orders(file_path, column_mapper, orders_df),
+                on_failed=self._on_load_orders_failed
+            )
+
+        except Exception as e:
+            self._on_load_orders_failed(e)
+
+    def _finish_load_orders(self, file_path: str, column_mapper: Optional[ColumnMapper],
+                            orders_df: pd.DataFrame):
+        """Apply orders parsed by _load_orders"""
+        try:
             self.order_processor.load_orders(orders_df)
 
             # Log if column mapping was applied
@@ -819,7 +1073,7 @@ class DecoderToolApp:
 
             file_name = Path(file_path).name
             row_count = len(orders_df)
-            order_count = orders_df['Name'].nunique() if 'Name' in orders_df.columns else row_count
+            order_count = self.order_processor.get_unique_order_count()
 
             self.orders_status_label.config(text=f"{ICONS['ok']} Loaded: {file_name}")
             set_status_color(self.orders_status_label, 'success')
@@ -832,37 +1086,52 @@ class DecoderToolApp:
                 counter=f"{row_count} rows, {order_count} orders"
             )
 
-            self.logger.log_info(f"Orders loaded: {row_count} rows, {order_count} orders", "Orders")
+            self.logger.log_info("Orders loaded: %d rows, %d orders", "Orders", row_count, order_count)
 
-            info_dialog(self.root, "Success",
-                       f"Orders loaded successfully!\n\n"
-                       f"Total rows: {row_count}\n"
-                       f"Unique orders: {order_count}")
+            self._show_toast(f"Orders loaded successfully!\n"
+                             f"Total rows: {row_count}, Unique orders: {order_count}")
 
         except Exception as e:
-            self.logger.log_exception(e, "Load Orders")
-            self._update_status("Error loading orders", 'error')
-            error_dialog(self.root, "Error", f"Failed to load orders:\n{str(e)}")
+            self._on_load_orders_failed(e)
+
+    def _on_load_orders_failed(self, e: Exception):
+        """Report a failed _load_orders"""
+        self.logger.log_exception(e, "Load Orders")
+        self._update_status("Error loading orders", 'error')
+        error_dialog(self.root, "Error", f"Failed to load orders:\n{str(e)}")
 
     def _load_orders_folder(self):
         """Load multiple CSV files from folder"""
         try:
             folder_path = filedialog.askdirectory(
                 title="Select Folder with CSV Files",
-                initialdir=str(Path.home())
+                initialdir=self.file_history.get_last_dir('orders')
             )
 
             if not folder_path:
                 return
+            self._remember_dialog_dir('orders', folder_path)
 
             self._update_status("Loading orders from folder...", 'info')
-            self.logger.log_info(f"Loading orders from folder: {folder_path}", "Orders")
+            self.logger.log_info("Loading orders from folder: %s", "Orders", folder_path)
 
             # Get column mapper from current profile
             column_mapper = self._get_current_column_mapper()
 
-            # Load with column mapping if profile is selected
-            orders_df, file_names = OrdersFileLoader.load_from_folder(folder_path, column_mapper)
+            # Parse with column mapping (if profile is selected) off the Tk thread
+            self._run_task(
+                OrdersFileLoader.load_from_folder, folder_path, column_mapper,
+                on_finished=lambda loaded: self._finish_load_orders_folder(folder_path, column_mapper, *loaded),
+                on_failed=self._on_load_orders_folder_failed
+            )
+
+        except Exception as e:
+            self._on_load_orders_folder_failed(e)
+
+    def _finish_load_orders_folder(self, folder_path: str, column_mapper: Optional[ColumnMapper],
+                                   orders_df: pd.DataFrame, file_names: list):
+        """Apply orders parsed by _load_orders_folder"""
+        try:
             self.order_processor.load_orders(orders_df)
 
             # Log if column mapping was applied
@@ -870,12 +1139,19 @@ class DecoderToolApp:
                 self.logger.log_info("Column mapping applied from profile", "Orders")
 
             self.orders_loaded = True
-            self.current_orders_files = [str(Path(folder_path) / name) for name in file_names]
+            self._orders_folder = folder_path
+            self._orders_file_names = file_names
 
             row_count = len(orders_df)
-            order_count = orders_df['Name'].nunique() if 'Name' in orders_df.columns else row_count
+            order_count = self.order_processor.get_unique_order_count()
             file_count = len(file_names)
 
+            # Per-file lines and the summary go to the log file in one write
+            with self.logger.batched():
+                for name in file_names:
+                    self.logger.log_debug("Loaded file: %s", "Orders", name)
+                self.logger.log_info("Loaded %d files: %d rows, %d orders", "Orders", file_count, row_count, order_count)
+
             self.orders_status_label.config(text=f"{ICONS['ok']} Loaded {file_count} files from folder")
             set_status_color(self.orders_status_label, 'success')
             self._update_process_info()
@@ -887,26 +1163,22 @@ class DecoderToolApp:
                 counter=f"{row_count} rows, {order_count} orders"
             )
 
-            files_list = "\n".join([f"  • {name}" for name in file_names[:10]])
-            if len(file_names) > 10:
-                files_list += f"\n  ... and {len(file_names) - 10} more"
-
-            info_dialog(self.root, "Success",
-                       f"Loaded {file_count} CSV files!\n\n"
-                       f"Files:\n{files_list}\n\n"
-                       f"Total rows: {row_count}\n"
-                       f"Unique orders: {order_count}")
-
-            self.logger.log_info(f"Loaded {file_count} files: {row_count} rows, {order_count} orders", "Orders")
+            # File names are in the log; the message only summarizes
+            self._show_toast(f"Loaded {file_count} CSV files!\n"
+                             f"Total rows: {row_count}, Unique orders: {order_count}")
 
         except Exception as e:
-            self.logger.log_exception(e, "Load Orders Folder")
-            self._update_status("Error loading folder", 'error')
-            error_dialog(self.root, "Error", f"Failed to load orders folder:\n{str(e)}")
+            self._on_load_orders_folder_failed(e)
+
+    def _on_load_orders_folder_failed(self, e: Exception):
+        """Report a failed _load_orders_folder"""
+        self.logger.log_exception(e, "Load Orders Folder")
+        self._update_status("Error loading folder", 'error')
+        error_dialog(self.root, "Error", f"Failed to load orders folder:\n{str(e)}")
 
     def _reload_orders(self):
         """Reload current orders files"""
-        if not self.current_orders_files:
+        if not self._orders_file_names:
             error_dialog(self.root, "Error", "No orders to reload")
             return
 
@@ -914,69 +1186,80 @@ class DecoderToolApp:
             self._update_status("Reloading orders...", 'info')
             self.logger.log_info("Reloading orders", "Orders")
 
-            if len(self.current_orders_files) == 1:
-                orders_df = OrdersFileLoader.load(self.current_orders_files[0])
+            # Parse the files again off the Tk thread
+            file_paths = self.current_orders_files
+            if len(file_paths) == 1:
+                read, source = OrdersFileLoader.load, file_paths[0]
             else:
-                orders_df = OrdersFileLoader.load_multiple(self.current_orders_files)
+                read, source = OrdersFileLoader.load_multiple, file_paths
+            self._run_task(read, source, on_finished=self._finish_reload_orders,
+                           on_failed=self._on_reload_orders_failed)
 
+        except Exception as e:
+            self._on_reload_orders_failed(e)
+
+    def _finish_reload_orders(self, orders_df: pd.DataFrame):
+        """Apply orders parsed by _reload_orders"""
+        try:
             self.order_processor.load_orders(orders_df)
 
             row_count = len(orders_df)
-            order_count = orders_df['Name'].nunique() if 'Name' in orders_df.columns else row_count
+            order_count = self.order_processor.get_unique_order_count()
 
             self._update_status(
                 "Orders reloaded", 'success',
                 counter=f"{row_count} rows, {order_count} orders"
             )
 
-            info_dialog(self.root, "Success",
-                       f"Orders reloaded!\n\n"
-                       f"Total rows: {row_count}\n"
-                       f"Unique orders: {order_count}")
+            self._show_toast(f"Orders reloaded!\n"
+                             f"Total rows: {row_count}, Unique orders: {order_count}")
 
         except Exception as e:
-            self.logger.log_exception(e, "Reload Orders")
-            error_dialog(self.root, "Error", f"Failed to reload orders:\n{str(e)}")
+            self._on_reload_orders_failed(e)
+
+    def _on_reload_orders_failed(self, e: Exception):
+        """Report a failed _reload_orders"""
+        self.logger.log_exception(e, "Reload Orders")
+        error_dialog(self.root, "Error", f"Failed to reload orders:\n{str(e)}")
 
     def _add_manual_product(self):
         """Add product manually to order"""
         try:
             order_id = self.order_id_entry.get().strip()
             sku = self.sku_entry.get().strip()
-            quantity = self.quantity_entry.get().strip()
+            quantity_text = self.quantity_entry.get().strip()
 
-            if not all([order_id, sku, quantity]):
+            if not (order_id and sku and quantity_text):
                 warning_dialog(self.root, "Missing Information",
                              "Please fill in all fields: Order ID, SKU, and Quantity")
                 return
 
-            try:
-                quantity = int(quantity)
-                if quantity <= 0:
-                    raise ValueError("Quantity must be positive")
-            except ValueError as e:
+            # Digits only (no sign, no exception handling needed), and not 0
+            quantity = int(quantity_text) if quantity_text.isdecimal() else 0
+            if quantity <= 0:
                 error_dialog(self.root, "Invalid Quantity",
                            "Please enter a valid positive number for quantity")
                 return
 
             self._update_status(f"Adding {sku} to {order_id}...", 'info')
 
-            success = self.order_processor.add_manual_product(order_id, sku, quantity)
+            success, message = self.order_processor.add_manual_product(order_id, sku, quantity)
 
             if success:
                 self._update_status(f"Product added to {order_id}", 'success')
-                info_dialog(self.root, "Success",
-                           f"Added {quantity}x {sku} to order {order_id}")
+                # Show the new row count (O(1); the label is only redrawn if it changed)
+                self._update_process_info()
+                self._show_toast(f"Added {quantity}x {sku} to order {order_id}")
 
                 # Clear fields
-                self.order_id_entry.delete(0, tk.END)
-                self.sku_entry.delete(0, tk.END)
-                self.quantity_entry.delete(0, tk.END)
+                for entry in (self.order_id_entry, self.sku_entry, self.quantity_entry):
+                    entry.delete(0, tk.END)
+                self.order_id_entry.focus_set()  # Ready for the next product
 
-                self.logger.log_info(f"Manual product added: {quantity}x {sku} to {order_id}", "ManualAdd")
+                self.logger.log_info("Manual product added: %sx %s to %s", "ManualAdd", quantity, sku, order_id)
             else:
-                error_dialog(self.root, "Error",
-                           f"Failed to add product. Order {order_id} may not exist.")
+                self._update_status("Product not added", 'error')
+                error_dialog(self.root, "Error", f"Failed to add product:\n{message}")
 
         except Exception as e:
             self.logger.log_exception(e, "Add Manual Product")
@@ -991,7 +1274,7 @@ class DecoderToolApp:
                 warning_dialog(self.root, "No Orders", "Please load orders first")
                 return
 
-            self._update_status("Generating SKUs...", 'info')
+            self._update_status("Generating SKUs...", 'info', flush=True)
 
             count, changes = self.order_processor.generate_missing_skus()
 
@@ -1011,7 +1294,7 @@ class DecoderToolApp:
                 self._update_status(f"Generated {count} SKUs", 'success')
                 self.utils_status_label.config(text=f"{ICONS['ok']} Generated {count} SKUs")
                 set_status_color(self.utils_status_label, 'success')
-                self.logger.log_info(f"Generated {count} SKUs", "SKUGeneration")
+                self.logger.log_info("Generated %d SKUs", "SKUGeneration", count)
             else:
                 # User cancelled, but SKUs were already generated - need to reload
                 info_dialog(self.root, "Note",
@@ -1032,73 +1315,137 @@ class DecoderToolApp:
                 warning_dialog(self.root, "No Orders", "Please load orders first")
                 return
 
-            self._update_status("Validating data...", 'info')
-            self.logger.log_info("Starting data validation", "Validation")
+            # Very large orders can be checked on a sample for a quick estimate
+            row_count = self.order_processor.get_order_count()
+            full_scan = row_count <= VALIDATION_SAMPLE_THRESHOLD or confirm_dialog(
+                self.root, "Full Scan",
+                f"Orders have {row_count:,} rows.\n\n"
+                f"Run a full scan? Choose No for a quick estimate "
+                f"from a sample of {VALIDATION_SAMPLE_ROWS:,} rows."
+            )
 
-            # Run validation
-            issues = self._run_full_validation()
+            self._update_status("Validating data...", 'info')
+            self.logger.log_info("Starting data validation (full scan: %s)", "Validation", full_scan)
 
-            # Show validation report
-            self._show_validation_report(issues)
+            # Run validation off the Tk thread, then show the report
+            self._run_task(self._run_full_validation, full_scan, on_finished=self._show_validation_report,
+                           on_failed=self._on_validate_data_failed)
 
         except Exception as e:
-            self.logger.log_exception(e, "Validate Data")
-            error_dialog(self.root, "Error", f"Validation failed:\n{str(e)}")
+            self._on_validate_data_failed(e)
+
+    def _on_validate_data_failed(self, e: Exception):
+        """Report a failed _validate_data_enhanced"""
+        self.logger.log_exception(e, "Validate Data")
+        error_dialog(self.root, "Error", f"Validation failed:\n{str(e)}")
+
+    def _order_check(self, name: str, compute: Callable):
+        """
+        Get a result derived from the orders only, reusing it until the orders change
+
+        Args:
+            name: Name of the check
+            compute: Function computing the result from scratch
+
+        Returns:
+            The (possibly cached) result of compute()
+        """
+        revision = self.order_processor.get_revision()
+        if revision != self._order_checks_revision:
+            self._order_checks = {}
+            self._order_checks_revision = revision
+        if name not in self._order_checks:
+            self._order_checks[name] = compute()
+        return self._order_checks[name]
+
+    def _run_full_validation(self, full_scan: bool = True) -> dict:
+        """
+        Run comprehensive validation and return issues
+
+        Args:
+            full_scan: Check every order row. If False and the orders have more
+                than VALIDATION_SAMPLE_THRESHOLD rows, check a random sample of
+                VALIDATION_SAMPLE_ROWS rows and report estimates.
 
-    def _run_full_validation(self) -> dict:
-        """Run comprehensive validation and return issues"""
+        Returns:
+            Dictionary with 'critical', 'warning' and 'info' issue lists, and
+            'estimate' set when the issues come from a sample
+        """
         issues = {
             'critical': [],
             'warning': [],
-            'info': []
+            'info': [],
+            'estimate': False
         }
 
         orders_df = self.order_processor.get_orders_dataframe()
 
+        # Checks 1 and 3 only look at the orders and are reused until they change
+        scale = 1.0
+        if not full_scan and len(orders_df) > VALIDATION_SAMPLE_THRESHOLD:
+            # Row counts are scaled up to the whole orders; SKU and duplicate
+            # findings in the sample are lower bounds. Sample results aren't cached.
+            scale = len(orders_df) / VALIDATION_SAMPLE_ROWS
+            orders_df = orders_df.sample(VALIDATION_SAMPLE_ROWS, random_state=0)
+            issues['estimate'] = True
+
+        def check(name: str, compute: Callable):
+            return compute() if issues['estimate'] else self._order_check(name, compute)
+
+        def found(count: int, scaled: bool = False) -> str:
+            if not issues['estimate']:
+                return f"Found {count}"
+            return f"Found ~{round(count * scale)}" if scaled else f"Found at least {count}"
+
         # Check 1: Empty SKUs
         if 'Lineitem sku' in orders_df.columns:
-            empty_skus = orders_df[orders_df['Lineitem sku'].isna() | (orders_df['Lineitem sku'] == '')]
-            if len(empty_skus) > 0:
-                issues['warning'].append(f"Found {len(empty_skus)} rows with empty SKUs")
+            empty_sku_count = check('empty_skus', lambda: int(
+                (orders_df['Lineitem sku'].isna() | (orders_df['Lineitem sku'] == '')).sum()
+            ))
+            if empty_sku_count > 0:
+                issues['warning'].append(f"{found(empty_sku_count, scaled=True)} rows with empty SKUs")
 
         # Check 2: Orphaned SKUs (SKUs not in product map)
         if 'Lineitem sku' in orders_df.columns:
-            unique_skus = orders_df['Lineitem sku'].unique()
-            orphaned = []
-            for sku in unique_skus:
-                if pd.notna(sku) and sku != '':
-                    if not self.product_manager.has_product(sku) and not self.set_manager.is_set(sku):
-                        orphaned.append(sku)
+            unique_skus = pd.Series(
+                check('unique_skus', lambda: orders_df['Lineitem sku'].unique()), dtype=object
+            )
+            # One hash lookup per distinct SKU against the product and set SKUs
+            lookup_skus = unique_skus.map(str).str.strip()
+            known = lookup_skus.isin(self.product_manager.skus) | lookup_skus.isin(self.set_manager.set_skus)
+            orphaned = unique_skus[unique_skus.notna() & (unique_skus != '') & ~known].tolist()
 
             if orphaned:
-                issues['warning'].append(f"Found {len(orphaned)} SKUs not in master file: {', '.join(orphaned[:5])}"
+                issues['warning'].append(f"{found(len(orphaned))} SKUs not in master file: {', '.join(orphaned[:5])}"
                                        + (f"... (+{len(orphaned)-5} more)" if len(orphaned) > 5 else ""))
 
         # Check 3: Duplicate orders
-        if 'Name' in orders_df.columns:
-            duplicates = orders_df[orders_df.duplicated(subset=['Name', 'Lineitem sku'], keep=False)]
+        if 'Name' in orders_df.columns and 'Lineitem sku' in orders_df.columns:
+            duplicates = check('duplicates', lambda: self._find_duplicate_rows(orders_df))
             if len(duplicates) > 0:
-                issues['info'].append(f"Found {len(duplicates)} duplicate order-SKU combinations")
+                issues['info'].append(f"{found(len(duplicates))} duplicate order-SKU combinations")
 
         # Check 4: Sets with no components
-        all_sets = self.set_manager.get_all_set_skus()
-        empty_sets = []
-        for set_sku in all_sets:
-            components = self.set_manager.get_components(set_sku)
-            if not components:
-                empty_sets.append(set_sku)
+        empty_sets = self.set_manager.empty_set_skus()
 
         if empty_sets:
             issues['critical'].append(f"Found {len(empty_sets)} sets with no components: {', '.join(empty_sets)}")
 
-        # Check 5: Missing quantities
-        if 'Lineitem quantity' in orders_df.columns:
-            missing_qty = orders_df[orders_df['Lineitem quantity'].isna()]
-            if len(missing_qty) > 0:
-                issues['warning'].append(f"Found {len(missing_qty)} rows with missing quantities")
+        # Check 5: Missing quantities (counted on load, before they were stored as 0,
+        # so this is exact even when the other checks use a sample)
+        missing_qty_count = self.order_processor.get_missing_quantity_count()
+        if missing_qty_count > 0:
+            issues['warning'].append(f"Found {missing_qty_count} rows with missing or invalid quantities")
 
         return issues
 
+    @staticmethod
+    def _find_duplicate_rows(orders_df: pd.DataFrame) -> pd.DataFrame:
+        """Get all order rows whose order + SKU combination occurs more than once"""
+        # Group sizes in one hashing pass (missing values group together, as in duplicated())
+        group_sizes = orders_df.groupby(['Name', 'Lineitem sku'], sort=False, dropna=False)['Name'].transform('size')
+        return orders_df[(group_sizes > 1).to_numpy()]
+
     def _show_validation_report(self, issues: dict):
         """Show validation report window with enhanced UI"""
         from tkinter import scrolledtext
@@ -1116,6 +1463,8 @@ class DecoderToolApp:
         warning_count = len(issues['warning'])
         info_count = len(issues['info'])
 
+        estimate = issues.get('estimate', False)
+
         if critical_count > 0:
             status_icon = ICONS['error']
             status_text = "Critical Issues Found"
@@ -1129,6 +1478,9 @@ class DecoderToolApp:
             status_text = "Validation Passed"
             status_color = COLORS['success']
 
+        if estimate:
+            status_text += " (ESTIMATE)"
+
         header_label = ttk.Label(header_frame, text=f"{status_icon} {status_text}",
                                 font=FONTS['heading'], foreground=status_color)
         header_label.pack()
@@ -1147,33 +1499,25 @@ class DecoderToolApp:
         text_area.pack(fill=tk.BOTH, expand=True)
 
         # Build report text
-        report_text = "VALIDATION REPORT\n"
-        report_text += "=" * 60 + "\n\n"
-
-        if issues['critical']:
-            report_text += f"{ICONS['error']} CRITICAL ISSUES:\n"
-            report_text += "-" * 60 + "\n"
-            for issue in issues['critical']:
-                report_text += f"  • {issue}\n"
-            report_text += "\n"
-
-        if issues['warning']:
-            report_text += f"{ICONS['warning']} WARNINGS:\n"
-            report_text += "-" * 60 + "\n"
-            for issue in issues['warning']:
-                report_text += f"  • {issue}\n"
-            report_text += "\n"
-
-        if issues['info']:
-            report_text += f"{ICONS['info']} INFORMATION:\n"
-            report_text += "-" * 60 + "\n"
-            for issue in issues['info']:
-                report_text += f"  • {issue}\n"
-            report_text += "\n"
+        parts = ["VALIDATION REPORT (ESTIMATE)\n" if estimate else "VALIDATION REPORT\n", "=" * 60 + "\n\n"]
+        if estimate:
+            parts.append(f"Checked a random sample of {VALIDATION_SAMPLE_ROWS:,} order rows. "
+                         "Run a full scan for exact counts.\n\n")
+
+        for key, heading in (('critical', f"{ICONS['error']} CRITICAL ISSUES:\n"),
+                             ('warning', f"{ICONS['warning']} WARNINGS:\n"),
+                             ('info', f"{ICONS['info']} INFORMATION:\n")):
+            if issues[key]:
+                parts.append(heading)
+                parts.append("-" * 60 + "\n")
+                parts.extend(f"  • {issue}\n" for issue in issues[key])
+                parts.append("\n")
 
         if not any([issues['critical'], issues['warning'], issues['info']]):
-            report_text += f"{ICONS['ok']} No issues found! Data looks good.\n\n"
-            report_text += "All validations passed successfully."
+            parts.append(f"{ICONS['ok']} No issues found! Data looks good.\n\n")
+            parts.append("All validations passed successfully.")
+
+        report_text = "".join(parts)
 
         text_area.insert('1.0', report_text)
         text_area.config(state='disabled')
@@ -1213,16 +1557,16 @@ class DecoderToolApp:
                 warning_dialog(self.root, "No Orders", "Please load orders first")
                 return
 
-            self._update_status("Checking for duplicates...", 'info')
+            self._update_status("Checking for duplicates...", 'info', flush=True)
 
             orders_df = self.order_processor.get_orders_dataframe()
 
             # Check for duplicate rows (same order + SKU)
             if 'Name' in orders_df.columns and 'Lineitem sku' in orders_df.columns:
-                duplicates = orders_df[orders_df.duplicated(subset=['Name', 'Lineitem sku'], keep=False)]
+                duplicates = self._order_check('duplicates', lambda: self._find_duplicate_rows(orders_df))
 
                 if len(duplicates) > 0:
-                    dup_orders = duplicates['Name'].nunique()
+                    dup_orders = self._order_check('duplicate_orders', lambda: duplicates['Name'].nunique())
                     message = f"Found {len(duplicates)} duplicate rows\n"
                     message += f"Affecting {dup_orders} orders\n\n"
                     message += "Sample duplicates:\n"
@@ -1260,11 +1604,22 @@ class DecoderToolApp:
             self._update_status("Processing orders...", 'info')
             self.logger.log_info("Starting order processing", "Processing")
 
-            # Process orders
-            processed_df = self.order_processor.process_orders()
+            # Process orders and calculate statistics off the Tk thread
+            self._run_task(self._process_with_statistics, on_finished=self._finish_preview_results,
+                           on_failed=self._on_preview_results_failed)
+
+        except Exception as e:
+            self._on_preview_results_failed(e)
+
+    def _process_with_statistics(self) -> Tuple[pd.DataFrame, dict]:
+        """Process the orders and calculate statistics (runs in the background)"""
+        processed_df = self.order_processor.process_orders()
+        return processed_df, self._calculate_statistics(processed_df)
 
-            # Calculate statistics
-            stats = self._calculate_statistics(processed_df)
+    def _finish_preview_results(self, result: Tuple[pd.DataFrame, dict]):
+        """Show the results of _preview_results"""
+        try:
+            processed_df, stats = result
 
             # Update status
             self._update_status(
@@ -1273,7 +1628,7 @@ class DecoderToolApp:
                 counter=f"{stats['Unique Orders']} orders"
             )
 
-            self.logger.log_info(f"Processing complete: {stats['Processed Rows']} rows", "Processing")
+            self.logger.log_info("Processing complete: %s rows", "Processing", stats['Processed Rows'])
 
             # Show preview window
             show_preview(
@@ -1284,19 +1639,27 @@ class DecoderToolApp:
             )
 
         except Exception as e:
-            self.logger.log_exception(e, "Preview Results")
-            self._update_status("Processing failed", 'error')
-            error_dialog(self.root, "Error", f"Failed to process orders:\n{str(e)}")
+            self._on_preview_results_failed(e)
+
+    def _on_preview_results_failed(self, e: Exception):
+        """Report a failed _preview_results"""
+        self.logger.log_exception(e, "Preview Results")
+        self._update_status("Processing failed", 'error')
+        error_dialog(self.root, "Error", f"Failed to process orders:\n{str(e)}")
 
     def _calculate_statistics(self, processed_df: pd.DataFrame) -> dict:
         """Calculate processing statistics"""
         original_df = self.order_processor.get_orders_dataframe()
 
+        # Count unique orders and SKUs with a single nunique over both columns
+        columns = [c for c in ('Name', 'Lineitem sku') if c in processed_df.columns]
+        unique_counts = processed_df[columns].nunique() if columns else {}
+
         stats = {
             'Original Rows': len(original_df),
             'Processed Rows': len(processed_df),
-            'Unique Orders': processed_df['Name'].nunique() if 'Name' in processed_df.columns else 0,
-            'Unique SKUs': processed_df['Lineitem sku'].nunique() if 'Lineitem sku' in processed_df.columns else 0,
+            'Unique Orders': int(unique_counts.get('Name', 0)),
+            'Unique SKUs': int(unique_counts.get('Lineitem sku', 0)),
             'Sets Decoded': len(processed_df) - len(original_df) if len(processed_df) > len(original_df) else 0
         }
 
@@ -1306,7 +1669,7 @@ class DecoderToolApp:
         """Save processed data to CSV"""
         try:
             # Get default save location from profile if available
-            initial_dir = str(Path.home())
+            initial_dir = self.file_history.get_last_dir('save')
             initial_file = "processed_orders.csv"
 
             if self.current_profile_id:
@@ -1317,7 +1680,7 @@ class DecoderToolApp:
                     try:
                         profile.ensure_output_folder()
                     except Exception as e:
-                        self.logger.log_warning(f"Could not create output folder: {str(e)}", "Save")
+                        self.logger.log_warning("Could not create output folder: %s", "Save", e)
 
                     # Add client name to filename
                     initial_file = f"{profile.client_name}_processed_orders.csv"
@@ -1327,30 +1690,43 @@ class DecoderToolApp:
             file_path = filedialog.asksaveasfilename(
                 title="Save Processed Orders",
                 defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+                filetypes=OrdersFileLoader.SAVE_FILETYPES + [("All files", "*.*")],
                 initialdir=initial_dir,
                 initialfile=initial_file
             )
 
             if not file_path:
                 return
+            self._remember_dialog_dir('save', os.path.dirname(file_path))
 
             self._update_status("Saving processed data...", 'info')
-            self.logger.log_info(f"Saving to: {file_path}", "Save")
+            self.logger.log_info("Saving to: %s", "Save", file_path)
+
+            # Write the CSV off the Tk thread
+            self._run_task(
+                OrdersFileLoader.save, dataframe, file_path,
+                on_finished=lambda _: self._finish_save_processed_data(dataframe, file_path),
+                on_failed=self._on_save_processed_data_failed
+            )
 
-            dataframe.to_csv(file_path, index=False)
+        except Exception as e:
+            self._on_save_processed_data_failed(e)
 
-            self._update_status("Data saved successfully", 'success')
-            self.logger.log_info(f"Saved {len(dataframe)} rows to {file_path}", "Save")
+    def _finish_save_processed_data(self, dataframe: pd.DataFrame, file_path: str):
+        """Report a completed _save_processed_data"""
+        self._update_status("Data saved successfully", 'success')
+        self.logger.log_info("Saved %d rows to %s", "Save", len(dataframe), file_path)
 
-            info_dialog(self.root, "Success",
-                       f"Processed data saved successfully!\n\n"
-                       f"File: {Path(file_path).name}\n"
-                       f"Rows: {len(dataframe)}")
+        info_dialog(self.root, "Success",
+                   f"Processed data saved successfully!\n\n"
+                   f"File: {Path(file_path).name}\n"
+                   f"Rows: {len(dataframe)}")
 
-        except Exception as e:
-            self.logger.log_exception(e, "Save Data")
-            error_dialog(self.root, "Error", f"Failed to save data:\n{str(e)}")
+    def _on_save_processed_data_failed(self, e: Exception):
+        """Report a failed _save_processed_data"""
+        self.logger.log_exception(e, "Save Data")
+        self._update_status("Error saving data", 'error')
+        error_dialog(self.root, "Error", f"Failed to save data:\n{str(e)}")
 
     # ==================== Profile Management ====================
 
@@ -1397,7 +1773,7 @@ class DecoderToolApp:
             if profile.client_name == selected_name:
                 self.current_profile_id = profile.client_id
                 self._update_profile_info(profile)
-                self.logger.log_info(f"Profile selected: {profile.client_id}", "ProfileChange")
+                self.logger.log_info("Profile selected: %s", "ProfileChange", profile.client_id)
                 return
 
     def _update_profile_info(self, profile):
@@ -1461,14 +1837,13 @@ class DecoderToolApp:
     def _on_closing(self):
         """Handle window close event"""
         try:
-            # Save final state
-            state = {
-                'master_file': self.current_master_file,
-                'orders_files': self.current_orders_files,
-                'master_loaded': self.master_loaded,
-                'orders_loaded': self.orders_loaded,
-            }
-            self.crash_recovery.save_state(state)
+            # Save final state (one write, skipped if autosave already wrote it)
+            state = self._get_session_state()
+            if state != self._last_autosave_state:
+                self.crash_recovery.save_state(state)
+
+            # Don't wait for a background parse nobody will look at
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
 
             # Log shutdown
             self.logger.log_info("Application closed normally", "MainWindow")
@@ -1483,6 +1858,9 @@ class DecoderToolApp:
 
 def main():
     """Main entry point for the application"""
+    # Lets the models share frames instead of copying them (see copy_frame)
+    enable_copy_on_write()
+
     try:
         root = tk.Tk()
         app = DecoderToolApp(root)
@@ -7,6 +7,7 @@ from pathlib import Path
 
 from .ui_constants import ICONS, COLORS, TOOLTIPS, FONTS, PADDING
 from .ui_utils import ToolTip, show_context_menu, confirm_dialog, info_dialog, error_dialog
+from ..utils.file_handlers import OrdersFileLoader
 
 
 class PreviewWindow:
@@ -67,10 +68,7 @@ class PreviewWindow:
 
         # Rows with price = 0 are likely decoded set components (except first component)
         if 'Lineitem price' in self.df.columns:
-            for idx, row in self.df.iterrows():
-                # Simple heuristic: if price is 0 and it's in original data
-                if row.get('Lineitem price', 0) == 0.0:
-                    self.decoded_rows.add(idx)
+            self.decoded_rows = set(self.df.index[self.df['Lineitem price'] == 0.0])
 
     def _create_ui(self):
         """Create the UI layout"""
@@ -349,13 +347,17 @@ class PreviewWindow:
 
     def _populate_table(self):
         """Populate table with data and apply visual indicators"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing items in one call
+        self.tree.delete(*self.tree.get_children())
 
-        # Add rows with appropriate tags
-        for idx, row in self.df.iterrows():
-            values = [row[col] for col in self.display_columns]
+        name_idx = (self.display_columns.index('Lineitem name')
+                    if 'Lineitem name' in self.display_columns else None)
+
+        # Add rows with appropriate tags (itertuples reads only the displayed
+        # columns and doesn't build a Series per row like iterrows)
+        rows = self.df[self.display_columns].itertuples(index=False, name=None)
+        for idx, row in zip(self.df.index, rows):
+            values = list(row)
 
             # Determine tags for this row
             tags = [str(idx)]  # Store index as tag
@@ -369,8 +371,7 @@ class PreviewWindow:
             if idx in self.row_notes:
                 tags.append('has_note')
                 # Add note indicator to name
-                if 'Lineitem name' in self.display_columns:
-                    name_idx = self.display_columns.index('Lineitem name')
+                if name_idx is not None:
                     values[name_idx] = f"{ICONS['note']} {values[name_idx]}"
 
             self.tree.insert('', tk.END, values=values, tags=tuple(tags))
@@ -760,7 +761,7 @@ class PreviewWindow:
 
         if file_path:
             try:
-                selected_df.to_csv(file_path, index=False)
+                OrdersFileLoader.save(selected_df, file_path)
                 info_dialog(self.window, "Success",
                           f"Saved {len(selected_df)} rows to:\n{Path(file_path).name}")
             except Exception as e:
@@ -792,7 +793,7 @@ class PreviewWindow:
 
             if file_path:
                 try:
-                    self.original_df.to_csv(file_path, index=False)
+                    OrdersFileLoader.save(self.original_df, file_path)
                     info_dialog(self.window, "Success", f"File saved:\n{Path(file_path).name}")
                     self.window.destroy()
                 except Exception as e:
@@ -1,16 +1,12 @@
 """Profile Manager Window - UI for managing client profiles"""
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from pathlib import Path
 from typing import Optional, Callable
-import sys
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from src.models.client_profile import ClientProfile, create_default_profile, PLATFORM_TEMPLATES
-from src.models.client_profile_manager import ClientProfileManager
-from src.ui.ui_constants import COLORS, FONTS, PADDING
-from src.ui.ui_utils import info_dialog, error_dialog, warning_dialog, confirm_dialog
+from ..models.client_profile import ClientProfile, create_default_profile, PLATFORM_COLUMN_MAPPINGS
+from ..models.client_profile_manager import ClientProfileManager
+from .ui_constants import COLORS, FONTS, PADDING
+from .ui_utils import info_dialog, error_dialog, warning_dialog, confirm_dialog
 
 
 class ProfileManagerWindow:
@@ -388,7 +384,7 @@ class ProfileEditDialog:
         platform_combo = ttk.Combobox(
             basic_frame,
             textvariable=self.platform_var,
-            values=list(PLATFORM_TEMPLATES.keys()),
+            values=list(PLATFORM_COLUMN_MAPPINGS.keys()),
             state='readonly',
             width=37
         )
@@ -465,15 +461,15 @@ class ProfileEditDialog:
     def _on_platform_change(self, event):
         """Handle platform change"""
         platform = self.platform_var.get()
-        if platform in PLATFORM_TEMPLATES:
-            template = PLATFORM_TEMPLATES[platform]
+        if platform in PLATFORM_COLUMN_MAPPINGS:
+            template_mapping = PLATFORM_COLUMN_MAPPINGS[platform]
             # Clear existing mappings
             for entry_pair in self.mapping_entries:
                 entry_pair[2].destroy()  # Destroy the frame
             self.mapping_entries.clear()
 
             # Load template mappings
-            for client_col, std_col in template.column_mapping.items():
+            for client_col, std_col in template_mapping.items():
                 self._add_mapping_row(client_col, std_col)
 
     def _browse_folder(self):
@@ -2,7 +2,7 @@
 import tkinter as tk
 from tkinter import ttk
 from typing import Optional, Callable
-from .ui_constants import COLORS, FONTS, TOOLTIPS
+from .ui_constants import COLORS, FONTS, PADDING, TOOLTIPS
 
 
 class ToolTip:
@@ -27,6 +27,7 @@ class ToolTip:
         self.text = text.strip() if text else ""
         self.delay = delay
         self.tooltip_window = None
+        self._visible = False
         self.after_id = None
 
         # Only bind events if we have valid text
@@ -57,37 +58,41 @@ class ToolTip:
 
     def _show(self):
         """Show the tooltip"""
-        if self.tooltip_window or not self.text:
+        if self._visible or not self.text:
             return
 
         # Get widget position
         x = self.widget.winfo_rootx() + 20
         y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
 
-        # Create tooltip window
-        self.tooltip_window = tk.Toplevel(self.widget)
-        self.tooltip_window.wm_overrideredirect(True)
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
+        # Create the tooltip window once and reuse it on every hover
+        if self.tooltip_window is None:
+            self.tooltip_window = tk.Toplevel(self.widget)
+            self.tooltip_window.wm_overrideredirect(True)
+
+            # Create label with text
+            label = tk.Label(
+                self.tooltip_window,
+                text=self.text,
+                justify=tk.LEFT,
+                background="#ffffe0",
+                relief=tk.SOLID,
+                borderwidth=1,
+                font=FONTS['small'],
+                padx=5,
+                pady=3
+            )
+            label.pack()
 
-        # Create label with text
-        label = tk.Label(
-            self.tooltip_window,
-            text=self.text,
-            justify=tk.LEFT,
-            background="#ffffe0",
-            relief=tk.SOLID,
-            borderwidth=1,
-            font=FONTS['small'],
-            padx=5,
-            pady=3
-        )
-        label.pack()
+        self.tooltip_window.wm_geometry(f"+{x}+{y}")
+        self.tooltip_window.deiconify()
+        self._visible = True
 
     def _hide(self):
         """Hide the tooltip"""
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+        if self._visible:
+            self.tooltip_window.withdraw()
+            self._visible = False
 
 
 def create_button_with_icon(parent, text: str, icon: str, command: Callable,
@@ -314,3 +319,32 @@ def warning_dialog(parent, title: str, message: str) -> bool:
     """
     from tkinter import messagebox
     return messagebox.askokcancel(title, message, parent=parent, icon='warning')
+
+
+def show_toast(parent, message: str, status_type: str = 'success', duration_ms: int = 2500) -> tk.Label:
+    """
+    Show a short message over the bottom of a window that goes away by itself
+
+    Unlike the dialogs above this doesn't wait for the user, so use it for
+    confirmations; errors should still use error_dialog.
+
+    Args:
+        parent: Window to show the message in
+        message: Message text
+        status_type: Status type for the background color (see set_status_color)
+        duration_ms: How long the message stays visible
+
+    Returns:
+        The message label (destroyed automatically after duration_ms; destroying
+        it earlier cancels the timer)
+    """
+    toast = tk.Label(parent, text=message, font=FONTS['default'], justify=tk.LEFT,
+                     background=COLORS.get(status_type, COLORS['default']), foreground='white',
+                     padx=PADDING['large'], pady=PADDING['normal'])
+    toast.place(relx=0.5, rely=1.0, y=-PADDING['xlarge'], anchor='s')
+    toast.lift()
+    after_id = toast.after(duration_ms, toast.destroy)
+    # Destroyed early (e.g. replaced by a newer message): drop the pending timer,
+    # which would otherwise fire into the deleted widget
+    toast.bind('<Destroy>', lambda e: toast.after_cancel(after_id))
+    return toast
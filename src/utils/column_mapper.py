@@ -44,8 +44,8 @@ class ColumnMapper:
         self._mapping: Dict[str, str] = {}
 
         if profile and profile.column_mapping:
-            # Invert mapping: client column → standard column
-            self._mapping = profile.column_mapping.copy()
+            # Client column → standard column, in DataFrame.rename form
+            self._mapping = profile.as_renamer()
 
     def apply_mapping(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -67,11 +67,8 @@ class ColumnMapper:
             # No mapping needed
             return df.copy()
 
-        # Create a copy to avoid modifying original
-        result_df = df.copy()
-
-        # Apply column renaming
-        result_df.rename(columns=self._mapping, inplace=True)
+        # rename returns a new DataFrame, so the original is left untouched
+        result_df = df.rename(columns=self._mapping)
 
         # Validate that required columns are present
         missing_required = self._get_missing_required_columns(result_df)
@@ -87,6 +84,20 @@ class ColumnMapper:
 
         return result_df
 
+    def get_source_columns(self, standard_columns) -> Set[str]:
+        """
+        Get the client column names that end up as the given standard columns
+
+        Args:
+            standard_columns: Iterable of standard column names
+
+        Returns:
+            Set with the standard names themselves plus every client column
+            mapped onto one of them
+        """
+        wanted = set(standard_columns)
+        return wanted | {client for client, standard in self._mapping.items() if standard in wanted}
+
     def _get_missing_required_columns(self, df: pd.DataFrame) -> Set[str]:
         """
         Get set of required columns that are missing
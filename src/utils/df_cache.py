@@ -0,0 +1,174 @@
+"""On-disk cache of parsed input files, keyed by path, modification time and size
+
+Entries are Arrow Feather files (plain columnar data, nothing is executed on
+read), one per parsed DataFrame. The cache needs pyarrow; without it files are
+simply parsed every time.
+"""
+import hashlib
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+import pandas as pd
+
+from .error_logger import get_logger
+
+try:
+    import pyarrow  # Optional: Feather files for the cache
+    import pyarrow.feather
+except ImportError:
+    pyarrow = None
+
+# Where parsed files are kept; None turns the on-disk cache off
+CACHE_DIR = Path.home() / '.decoder_tool' / 'cache'
+
+# Number of cached files kept (the least recently written are removed)
+MAX_ENTRIES = 16
+
+# Entries older than this are removed, so parsed copies don't stay around indefinitely
+MAX_AGE_SECONDS = 7 * 24 * 3600
+
+# Bump when the layout of cache entries changes, so old entries are ignored
+_FORMAT_VERSION = 2
+
+Frames = Tuple[Optional[pd.DataFrame], ...]
+
+
+def is_enabled() -> bool:
+    """
+    Check if parsed files are cached on disk
+
+    Returns:
+        True if CACHE_DIR is set and pyarrow is installed
+    """
+    return CACHE_DIR is not None and pyarrow is not None
+
+
+def cache_key(file_path: str, extra: str = "") -> str:
+    """
+    Build the cache key for a file in its current state
+
+    Args:
+        file_path: Path to the input file
+        extra: Anything else the parsed result depends on (reader, parser version)
+
+    Returns:
+        Hex digest identifying the file contents and how they were parsed
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    st = os.stat(file_path)
+    raw = f"{_FORMAT_VERSION}|{pd.__version__}|{os.path.abspath(file_path)}|{st.st_mtime_ns}|{st.st_size}|{extra}"
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=20).hexdigest()
+
+
+def load_or_parse(file_path: str, parse: Callable[[str], Frames], extra: str = "") -> Frames:
+    """
+    Return the parsed file from the cache, parsing and caching it on a miss
+
+    A missing or expired entry means the file is parsed again; an unreadable
+    one is logged and removed. Failing to write the cache (e.g. a column
+    mixing text and numbers, which Feather can't store) never fails the load.
+
+    Args:
+        file_path: Path to the input file
+        parse: Function parsing the file into a tuple of DataFrames (or None),
+            called as parse(file_path)
+        extra: Anything else the parsed result depends on (part of the key)
+
+    Returns:
+        The parsed tuple
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        Exception: Whatever parse() raises
+    """
+    if not is_enabled():
+        return parse(file_path)
+
+    key = cache_key(file_path, extra)
+    entry = Path(CACHE_DIR) / key
+
+    if entry.is_dir():
+        if time.time() - entry.stat().st_mtime < MAX_AGE_SECONDS:
+            try:
+                return _read_entry(entry)
+            except Exception as e:
+                get_logger().log_warning("Removing unreadable cache entry %s: %s", "DfCache", entry, e)
+        shutil.rmtree(entry, ignore_errors=True)
+
+    result = parse(file_path)
+
+    # Only cache if the file didn't change while it was parsed
+    if cache_key(file_path, extra) == key:
+        _store(entry, result)
+
+    return result
+
+
+def _read_entry(entry: Path) -> Frames:
+    """Read the DataFrames of a cache entry ('<i>.feather', or '<i>.none' for None)"""
+    files = sorted(entry.iterdir(), key=lambda p: int(p.stem))
+    if [int(p.stem) for p in files] != list(range(len(files))):
+        raise ValueError("incomplete entry")
+    return tuple(
+        None if p.suffix == '.none' else pyarrow.feather.read_table(p).to_pandas()
+        for p in files
+    )
+
+
+def _store(entry: Path, result: Frames) -> None:
+    """Write a cache entry atomically and drop expired and the oldest entries"""
+    tmp_dir = entry.with_name(f"{entry.name}.tmp{os.getpid()}")
+    try:
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        for i, df in enumerate(result):
+            if df is None:
+                (tmp_dir / f"{i}.none").touch()
+            else:
+                table = pyarrow.Table.from_pandas(df, preserve_index=None)
+                pyarrow.feather.write_feather(table, str(tmp_dir / f"{i}.feather"))
+        os.replace(tmp_dir, entry)
+    except Exception as e:
+        get_logger().log_debug("Not caching %s: %s", "DfCache", entry.name, e)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return
+
+    _prune(entry.parent)
+
+
+def _prune(cache_dir: Path) -> None:
+    """Remove expired entries, all but the MAX_ENTRIES newest, and leftover files"""
+    try:
+        now = time.time()
+        entries = []
+        for path in cache_dir.iterdir():
+            if not path.is_dir():
+                path.unlink(missing_ok=True)  # e.g. pickles of the earlier format
+            elif '.tmp' in path.name:
+                # Another process's write in progress, unless it was abandoned
+                if now - path.stat().st_mtime >= MAX_AGE_SECONDS:
+                    shutil.rmtree(path, ignore_errors=True)
+            else:
+                entries.append(path)
+
+        entries.sort(key=lambda p: p.stat().st_mtime_ns)
+        for i, old in enumerate(entries):
+            if i < len(entries) - MAX_ENTRIES or now - old.stat().st_mtime >= MAX_AGE_SECONDS:
+                shutil.rmtree(old, ignore_errors=True)
+    except OSError:
+        pass  # Pruning is retried after the next write
+
+
+def clear() -> None:
+    """Remove all cached entries"""
+    if CACHE_DIR is None or not Path(CACHE_DIR).is_dir():
+        return
+    for entry in Path(CACHE_DIR).iterdir():
+        if entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
@@ -1,12 +1,17 @@
 """Error logging and crash recovery utilities"""
 import logging
+import logging.handlers
+import os
 import sys
 import traceback
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 import json
 
+from .json_io import dumps
+
 
 class ErrorLogger:
     """Centralized error logging system"""
@@ -54,6 +59,8 @@ class ErrorLogger:
         # Add handlers
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
+        self._file_handler = file_handler
+        self._batch_handler = None  # MemoryHandler in front of the file while batched
 
         self._initialized = True
 
@@ -62,6 +69,37 @@ class ErrorLogger:
         self.logger.info(f"Log file: {self.log_file}")
         self.logger.info("=" * 60)
 
+    @contextmanager
+    def batched(self, capacity: int = 1000) -> Iterator[None]:
+        """
+        Buffer log file writes and write them out together on exit
+
+        Records are held in memory and written in one go when the block
+        ends, the buffer is full, or an error is logged. Nested calls share
+        the outer buffer.
+
+        Args:
+            capacity: Maximum records held before writing them out
+        """
+        if self._batch_handler is not None:
+            yield
+            return
+
+        batch_handler = logging.handlers.MemoryHandler(
+            capacity, flushLevel=logging.ERROR, target=self._file_handler
+        )
+        batch_handler.setLevel(self._file_handler.level)
+        self.logger.removeHandler(self._file_handler)
+        self.logger.addHandler(batch_handler)
+        self._batch_handler = batch_handler
+        try:
+            yield
+        finally:
+            self.logger.removeHandler(batch_handler)
+            self.logger.addHandler(self._file_handler)
+            self._batch_handler = None
+            batch_handler.close()  # Flushes the buffered records to the file
+
     def log_exception(self, exc: Exception, context: str = ""):
         """
         Log an exception with full traceback
@@ -78,49 +116,65 @@ class ErrorLogger:
 
         return error_msg
 
-    def log_error(self, message: str, context: str = ""):
+    def _log(self, level: int, message: str, context: str, args: tuple):
+        """
+        Format and emit a message, skipping all string work if the level is disabled
+
+        Args:
+            level: logging level
+            message: Message, with %-style placeholders if args are given
+            context: Additional context
+            args: Values for the placeholders
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        if args:
+            message = message % args
+        self.logger.log(level, f"[{context}] {message}" if context else message)
+
+    def log_error(self, message: str, context: str = "", *args):
         """
         Log an error message
 
         Args:
-            message: Error message
+            message: Error message, optionally with %-style placeholders
             context: Additional context
+            *args: Values for the placeholders (formatted only if the level is enabled)
         """
-        full_msg = f"[{context}] {message}" if context else message
-        self.logger.error(full_msg)
+        self._log(logging.ERROR, message, context, args)
 
-    def log_warning(self, message: str, context: str = ""):
+    def log_warning(self, message: str, context: str = "", *args):
         """
         Log a warning message
 
         Args:
-            message: Warning message
+            message: Warning message, optionally with %-style placeholders
             context: Additional context
+            *args: Values for the placeholders (formatted only if the level is enabled)
         """
-        full_msg = f"[{context}] {message}" if context else message
-        self.logger.warning(full_msg)
+        self._log(logging.WARNING, message, context, args)
 
-    def log_info(self, message: str, context: str = ""):
+    def log_info(self, message: str, context: str = "", *args):
         """
         Log an info message
 
         Args:
-            message: Info message
+            message: Info message, optionally with %-style placeholders
             context: Additional context
+            *args: Values for the placeholders (formatted only if the level is enabled)
         """
-        full_msg = f"[{context}] {message}" if context else message
-        self.logger.info(full_msg)
+        self._log(logging.INFO, message, context, args)
 
-    def log_debug(self, message: str, context: str = ""):
+    def log_debug(self, message: str, context: str = "", *args):
         """
         Log a debug message
 
         Args:
-            message: Debug message
+            message: Debug message, optionally with %-style placeholders
             context: Additional context
+            *args: Values for the placeholders (formatted only if the level is enabled)
         """
-        full_msg = f"[{context}] {message}" if context else message
-        self.logger.debug(full_msg)
+        self._log(logging.DEBUG, message, context, args)
 
     def get_recent_errors(self, lines: int = 50) -> str:
         """
@@ -191,13 +245,16 @@ class CrashRecovery:
             state['timestamp'] = datetime.now().isoformat()
             state['version'] = '2.3.1'
 
-            with open(self.recovery_file, 'w', encoding='utf-8') as f:
-                json.dump(state, f, indent=2)
+            # Write to a temp file and swap it in, so a crash mid-write
+            # can't leave a truncated recovery file behind
+            tmp_file = self.recovery_file.with_name(self.recovery_file.name + '.tmp')
+            tmp_file.write_bytes(dumps(state))
+            os.replace(tmp_file, self.recovery_file)
 
             self.logger.log_debug("Application state saved", "CrashRecovery")
 
         except Exception as e:
-            self.logger.log_error(f"Failed to save state: {str(e)}", "CrashRecovery")
+            self.logger.log_error("Failed to save state: %s", "CrashRecovery", e)
 
     def load_state(self) -> Optional[dict]:
         """
@@ -217,7 +274,7 @@ class CrashRecovery:
             return state
 
         except Exception as e:
-            self.logger.log_error(f"Failed to load state: {str(e)}", "CrashRecovery")
+            self.logger.log_error("Failed to load state: %s", "CrashRecovery", e)
             return None
 
     def clear_state(self):
@@ -227,7 +284,7 @@ class CrashRecovery:
                 self.recovery_file.unlink()
                 self.logger.log_debug("Recovery state cleared", "CrashRecovery")
         except Exception as e:
-            self.logger.log_error(f"Failed to clear state: {str(e)}", "CrashRecovery")
+            self.logger.log_error("Failed to clear state: %s", "CrashRecovery", e)
 
     def has_recovery_state(self) -> bool:
         """Check if recovery state exists"""
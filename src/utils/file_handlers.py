@@ -1,13 +1,242 @@
 """File handlers for loading master files and order exports"""
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Tuple, Optional, List
+from typing import Iterable, Tuple, Optional, List
 from .column_mapper import ColumnMapper
+from . import df_cache
+from .pandas_compat import copy_frame
+
+try:
+    import pyarrow  # Optional: multithreaded CSV parser, Parquet output
+    import pyarrow.csv
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    pyarrow = None
+    CSV_ENGINE = 'c'
+
+try:
+    # Optional: Rust xlsx reader, several times faster than openpyxl
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# Upper bound on threads reading order CSVs in parallel (the C parser releases the GIL);
+# more threads than cores only adds contention
+MAX_READ_WORKERS = min(8, os.cpu_count() or 1)
+
+# Rows formatted per write when saving CSV output, so the whole file is never
+# built in memory at once
+SAVE_CHUNK_ROWS = 65536
+
+# Standard columns always read as text, so e.g. SKU '00123' keeps its leading zeros
+TEXT_COLUMNS = ('Name', 'Lineitem sku')
+
+# With pyarrow, text columns are stored as Arrow strings so isna/isin/nunique/
+# duplicated run on Arrow's string kernels. NaN (not pd.NA) marks missing values,
+# so comparisons still give plain bool masks like object columns do.
+TEXT_DTYPE = str
+if pyarrow is not None:
+    try:
+        TEXT_DTYPE = pd.StringDtype('pyarrow', na_value=np.nan)
+    except TypeError:  # pandas < 2.3
+        pass
+
+
+def _read_sheet(worksheet) -> pd.DataFrame:
+    """
+    Read a worksheet of a read-only workbook into a DataFrame
+
+    Reads plain cell values (no Cell objects or styles) and builds the frame
+    in one go, see _frame_from_rows.
+
+    Args:
+        worksheet: openpyxl worksheet from a workbook opened with read_only=True
+
+    Returns:
+        DataFrame with the sheet's data
+    """
+    # Writers don't always record the sheet size correctly
+    worksheet.reset_dimensions()
+    return _frame_from_rows(worksheet.iter_rows(values_only=True))
+
+
+def _read_calamine_sheet(sheet) -> pd.DataFrame:
+    """
+    Read a python-calamine sheet into a DataFrame
+
+    Args:
+        sheet: CalamineSheet
+
+    Returns:
+        DataFrame with the sheet's data, the same as _read_sheet gives
+    """
+    # Keep leading empty rows/columns, as openpyxl and pd.read_excel do
+    return _frame_from_rows(sheet.to_python(skip_empty_area=False))
+
+
+def _frame_from_rows(sheet_rows: Iterable[Iterable]) -> pd.DataFrame:
+    """
+    Build a DataFrame from a sheet's cell values
+
+    Like pd.read_excel, the first row is the header, empty cells become NaN,
+    trailing empty rows/columns are dropped and whole-number floats become
+    integers (cell by cell, so a SKU 10023 in a text column stays 10023,
+    not 10023.0).
+
+    Args:
+        sheet_rows: Rows of cell values, empty cells as None or ""
+
+    Returns:
+        DataFrame with the sheet's data
+    """
+    # calamine returns every number as a float; openpyxl only non-integral ones
+    rows = [[None if value == "" else int(value) if isinstance(value, float) and value.is_integer() else value
+             for value in row] for row in sheet_rows]
+
+    # Trim trailing empty rows
+    while rows and all(value is None for value in rows[-1]):
+        rows.pop()
+    if not rows:
+        return pd.DataFrame()
+
+    # Rows may have different lengths; keep up to the last column with data
+    width = max((i + 1 for row in rows for i, value in enumerate(row) if value is not None), default=0)
+    rows = [row[:width] + [None] * (width - len(row)) for row in rows]
+
+    # Name empty headers and number duplicates the way pandas does
+    columns = []
+    seen = {}
+    for i, name in enumerate(rows[0]):
+        if name is None:
+            name = f"Unnamed: {i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        columns.append(name)
+
+    df = pd.DataFrame(rows[1:], columns=columns)
+
+    # Columns with no values at all are NaN floats, as in pd.read_excel
+    if len(df):
+        for column in df.columns[df.isna().all().to_numpy()]:
+            df[column] = df[column].astype('float64')
+
+    return df
+
+
+def _is_number_or_text(data_type) -> bool:
+    """Check if Arrow inferred a type the C parser would also give (numbers, text, empty)"""
+    types = pyarrow.types
+    return (types.is_integer(data_type) or types.is_floating(data_type) or types.is_null(data_type)
+            or types.is_string(data_type) or types.is_large_string(data_type))
+
+
+def _read_csv_arrow(file_path: str, text_columns: Iterable[str]) -> pd.DataFrame:
+    """
+    Read a CSV with pyarrow's multithreaded parser
+
+    Text columns are typed as strings while parsing (pandas' pyarrow engine only
+    casts after inferring, which turns SKU '00123' into '123'). Arrow would also
+    infer timestamps and booleans where the C parser keeps the text, so every
+    column that isn't numeric in the first block is read as a string too.
+
+    Args:
+        file_path: Path to CSV file (.csv or gzip-compressed .csv.gz)
+        text_columns: Columns to read as text (missing ones are ignored)
+
+    Returns:
+        DataFrame with numbers as int64/float64 and everything else as text
+    """
+    column_types = dict.fromkeys(text_columns, pyarrow.string())
+    with pyarrow.csv.open_csv(file_path) as reader:
+        column_types.update(
+            (field.name, pyarrow.string()) for field in reader.schema if not _is_number_or_text(field.type)
+        )
+
+    def read() -> pyarrow.Table:
+        return pyarrow.csv.read_csv(file_path, convert_options=pyarrow.csv.ConvertOptions(
+            column_types=column_types, strings_can_be_null=True,
+        ))
+
+    table = read()
+    # A column empty in the first block can still hold dates further down
+    inferred = [field.name for field in table.schema if not _is_number_or_text(field.type)]
+    if inferred:
+        column_types.update(dict.fromkeys(inferred, pyarrow.string()))
+        table = read()
+
+    # Empty columns are NaN floats, as with the C parser
+    if any(pyarrow.types.is_null(field.type) for field in table.schema):
+        table = table.cast(pyarrow.schema([
+            field.with_type(pyarrow.float64()) if pyarrow.types.is_null(field.type) else field
+            for field in table.schema
+        ]))
+
+    string_dtype = None if TEXT_DTYPE is str else TEXT_DTYPE
+    return table.to_pandas(types_mapper={
+        pyarrow.string(): string_dtype, pyarrow.large_string(): string_dtype,
+    }.get)
+
+
+def _read_orders_csv(file_path: str, column_mapper: Optional[ColumnMapper] = None,
+                     usecols: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Read one order export CSV and apply the column mapping
+
+    Args:
+        file_path: Path to CSV file (.csv or gzip-compressed .csv.gz)
+        column_mapper: Optional ColumnMapper for transforming column names
+        usecols: Optional standard column names to keep (others are not parsed)
+
+    Returns:
+        DataFrame with order data
+    """
+    has_mapping = column_mapper is not None and column_mapper.has_mapping()
+
+    def source_columns(columns: Iterable[str]) -> set:
+        # Names the columns have in the file, before mapping
+        return column_mapper.get_source_columns(columns) if has_mapping else set(columns)
+
+    text_columns = source_columns(TEXT_COLUMNS)
+
+    if CSV_ENGINE == 'pyarrow' and usecols is None:
+        orders_df = _read_csv_arrow(file_path, text_columns)
+    else:
+        read_kwargs = {'dtype': dict.fromkeys(text_columns, TEXT_DTYPE)}
+        if usecols is not None:
+            wanted = source_columns(usecols)
+            # Callable so columns missing from this file are simply skipped
+            read_kwargs['usecols'] = lambda column: column in wanted
+
+        # One pass over the whole file instead of chunked dtype guessing
+        orders_df = pd.read_csv(file_path, low_memory=False, **read_kwargs)
+
+    # Apply column mapping if provided
+    if has_mapping:
+        orders_df = column_mapper.apply_mapping(orders_df)
+
+    return orders_df
 
 
 class MasterFileLoader:
     """Handles loading of master XLSX files with PRODUCTS, SETS, and optionally ADDITION sheets"""
 
+    # Number of parsed master files kept by load_cached (least recently used are dropped)
+    CACHE_SIZE = 4
+
+    # Bump when load() starts returning differently parsed sheets, so the
+    # parsed copies cached on disk by earlier versions are ignored
+    PARSE_VERSION = 2
+
+    # (path, mtime_ns, size) -> (products_df, sets_df, additions_df)
+    _cache: OrderedDict = OrderedDict()
+
     @staticmethod
     def load(file_path: str) -> Tuple[pd.DataFrame, pd.DataFrame, Optional[pd.DataFrame]]:
         """
@@ -24,44 +253,114 @@ class MasterFileLoader:
             FileNotFoundError: If file doesn't exist
             ValueError: If required sheets are missing
         """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
         try:
-            # Read all sheets
-            excel_file = pd.ExcelFile(file_path)
+            if CalamineWorkbook is not None:
+                workbook = CalamineWorkbook.from_path(file_path)
+                sheet_names = workbook.sheet_names
+
+                def read(name: str) -> pd.DataFrame:
+                    return _read_calamine_sheet(workbook.get_sheet_by_name(name))
+            else:
+                # Imported here: openpyxl takes a while to import and isn't
+                # needed until a master file is opened (or at all with calamine)
+                from openpyxl import load_workbook
+                workbook = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+                sheet_names = workbook.sheetnames
+
+                def read(name: str) -> pd.DataFrame:
+                    return _read_sheet(workbook[name])
+        except Exception as e:
+            raise ValueError(f"Error loading master file: {str(e)}")
 
+        try:
             # Check for required sheets
-            if 'PRODUCTS' not in excel_file.sheet_names:
+            if 'PRODUCTS' not in sheet_names:
                 raise ValueError("Missing required sheet: PRODUCTS")
-            if 'SETS' not in excel_file.sheet_names:
+            if 'SETS' not in sheet_names:
                 raise ValueError("Missing required sheet: SETS")
 
             # Load required sheets
-            products_df = pd.read_excel(excel_file, sheet_name='PRODUCTS')
-            sets_df = pd.read_excel(excel_file, sheet_name='SETS')
+            products_df = read('PRODUCTS')
+            sets_df = read('SETS')
 
             # Load optional ADDITION sheet
             additions_df = None
-            if 'ADDITION' in excel_file.sheet_names:
-                additions_df = pd.read_excel(excel_file, sheet_name='ADDITION')
+            if 'ADDITION' in sheet_names:
+                additions_df = read('ADDITION')
 
             return products_df, sets_df, additions_df
 
-        except FileNotFoundError:
-            raise FileNotFoundError(f"File not found: {file_path}")
         except Exception as e:
             raise ValueError(f"Error loading master file: {str(e)}")
+        finally:
+            workbook.close()
+
+    @classmethod
+    def load_cached(cls, file_path: str) -> Tuple[pd.DataFrame, pd.DataFrame, Optional[pd.DataFrame]]:
+        """
+        Load master file, reusing the parsed sheets while the file is unchanged
+
+        Parsing the workbook is the slow part of loading, so reloading the same
+        file (or reopening it from history) returns the sheets parsed last time
+        as long as its modification time and size are the same. Recent files
+        are kept in memory. With pyarrow installed the parsed sheets are also
+        cached on disk for a week (see df_cache), so the next app session skips
+        the workbook parse too.
+
+        Args:
+            file_path: Path to XLSX file
+
+        Returns:
+            Tuple of (products_df, sets_df, additions_df), see load()
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If required sheets are missing
+        """
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+        sheets = cls._cache.get(key)
+        if sheets is None:
+            reader = 'calamine' if CalamineWorkbook is not None else 'openpyxl'
+            sheets = df_cache.load_or_parse(file_path, cls.load,
+                                            extra=f"master|{reader}|{cls.PARSE_VERSION}")
+            cls._cache[key] = sheets
+            if len(cls._cache) > cls.CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        else:
+            cls._cache.move_to_end(key)
+
+        # Copies (shallow under Copy-on-Write): callers can't change the cached frames
+        return tuple(copy_frame(df) if df is not None else None for df in sheets)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all cached master files"""
+        cls._cache.clear()
 
 
 class OrdersFileLoader:
     """Handles loading of order export CSV files with optional column mapping"""
 
     @staticmethod
-    def load(file_path: str, column_mapper: Optional[ColumnMapper] = None) -> pd.DataFrame:
+    def load(file_path: str, column_mapper: Optional[ColumnMapper] = None,
+             usecols: Optional[Iterable[str]] = None) -> pd.DataFrame:
         """
         Load orders from CSV file with optional column mapping
 
         Args:
-            file_path: Path to CSV file
+            file_path: Path to CSV file (.csv or gzip-compressed .csv.gz)
             column_mapper: Optional ColumnMapper for transforming column names
+            usecols: Optional standard column names to keep, e.g.
+                     OrderProcessor.REQUIRED_COLUMNS (default: all columns,
+                     which the export needs)
 
         Returns:
             DataFrame with order data (columns mapped to standard names if mapper provided)
@@ -71,13 +370,7 @@ class OrdersFileLoader:
             ValueError: If file cannot be parsed or mapping fails
         """
         try:
-            orders_df = pd.read_csv(file_path)
-
-            # Apply column mapping if provided
-            if column_mapper and column_mapper.has_mapping():
-                orders_df = column_mapper.apply_mapping(orders_df)
-
-            return orders_df
+            return _read_orders_csv(file_path, column_mapper, usecols)
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
         except Exception as e:
@@ -102,23 +395,23 @@ class OrdersFileLoader:
         if not file_paths:
             raise ValueError("No files provided")
 
-        dataframes = []
-
-        for file_path in file_paths:
+        def read_one(file_path: str) -> pd.DataFrame:
             try:
-                df = pd.read_csv(file_path)
-
-                # Apply column mapping if provided
-                if column_mapper and column_mapper.has_mapping():
-                    df = column_mapper.apply_mapping(df)
-
-                dataframes.append(df)
+                return _read_orders_csv(file_path, column_mapper)
             except FileNotFoundError:
                 raise FileNotFoundError(f"File not found: {file_path}")
             except Exception as e:
                 raise ValueError(f"Error loading {file_path}: {str(e)}")
 
-        # Combine all dataframes
+        # Parse the files in parallel; map keeps file order and re-raises
+        # the first failing file's error
+        if len(file_paths) == 1:
+            dataframes = [read_one(file_paths[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(file_paths))) as executor:
+                dataframes = list(executor.map(read_one, file_paths))
+
+        # Combine all dataframes in a single concat
         try:
             combined_df = pd.concat(dataframes, ignore_index=True)
             return combined_df
@@ -149,8 +442,8 @@ class OrdersFileLoader:
         if not folder.is_dir():
             raise ValueError(f"Path is not a folder: {folder_path}")
 
-        # Find all CSV files
-        csv_files = list(folder.glob('*.csv'))
+        # Find all CSV files (gzip-compressed exports are read transparently)
+        csv_files = list(folder.glob('*.csv')) + list(folder.glob('*.csv.gz'))
 
         if not csv_files:
             raise ValueError(f"No CSV files found in folder: {folder_path}")
@@ -166,10 +459,13 @@ class OrdersFileLoader:
 
         return combined_df, file_names
 
+    # Output formats save() can write (Parquet needs pyarrow)
+    SAVE_FILETYPES = [("CSV files", "*.csv")] + ([("Parquet files", "*.parquet")] if pyarrow is not None else [])
+
     @staticmethod
     def save(df: pd.DataFrame, file_path: str) -> None:
         """
-        Save processed orders to CSV file
+        Save processed orders to CSV file (or Parquet if the path ends in .parquet)
 
         Args:
             df: DataFrame to save
@@ -179,6 +475,12 @@ class OrdersFileLoader:
             ValueError: If save fails
         """
         try:
-            df.to_csv(file_path, index=False)
+            if file_path.lower().endswith('.parquet'):
+                if pyarrow is None:
+                    raise ValueError("Parquet output requires pyarrow")
+                # Columnar and compressed: much smaller than CSV, faster to read back
+                df.to_parquet(file_path, index=False, engine='pyarrow')
+            else:
+                df.to_csv(file_path, index=False, chunksize=SAVE_CHUNK_ROWS)
         except Exception as e:
             raise ValueError(f"Error saving file: {str(e)}")
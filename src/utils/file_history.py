@@ -23,9 +23,11 @@ class FileHistory:
 
         self.history_file = self.config_dir / 'history.json'
         self.favorites_file = self.config_dir / 'favorites.json'
+        self.last_dirs_file = self.config_dir / 'last_dirs.json'
 
         self.recent_files = self._load_history()
         self.favorites = self._load_favorites()
+        self.last_dirs = self._load_last_dirs()
 
     def _load_history(self) -> List[Dict]:
         """Load recent files history"""
@@ -65,6 +67,58 @@ class FileHistory:
         except Exception:
             pass  # Silently fail
 
+    def _load_last_dirs(self) -> Dict[str, str]:
+        """Load last used dialog directories"""
+        if not self.last_dirs_file.exists():
+            return {}
+
+        try:
+            with open(self.last_dirs_file, 'r', encoding='utf-8') as f:
+                last_dirs = json.load(f)
+            return last_dirs if isinstance(last_dirs, dict) else {}
+        except Exception:
+            return {}
+
+    def save_last_dirs(self):
+        """Save last used dialog directories"""
+        try:
+            with open(self.last_dirs_file, 'w', encoding='utf-8') as f:
+                json.dump(self.last_dirs, f, indent=2)
+        except Exception:
+            pass  # Silently fail
+
+    def get_last_dir(self, dialog: str) -> str:
+        """
+        Get the directory a file dialog should open in
+
+        Args:
+            dialog: Dialog name (e.g. 'master', 'orders', 'save')
+
+        Returns:
+            Directory last used with this dialog, or the home directory if
+            there is none or it no longer exists
+        """
+        last_dir = self.last_dirs.get(dialog)
+        if last_dir and Path(last_dir).is_dir():
+            return last_dir
+        return str(Path.home())
+
+    def set_last_dir(self, dialog: str, directory: str) -> bool:
+        """
+        Remember the directory used with a file dialog (call save_last_dirs to persist)
+
+        Args:
+            dialog: Dialog name (e.g. 'master', 'orders', 'save')
+            directory: Directory the user picked a file in (or picked)
+
+        Returns:
+            True if it differs from the one remembered before
+        """
+        if not directory or self.last_dirs.get(dialog) == directory:
+            return False
+        self.last_dirs[dialog] = directory
+        return True
+
     def add_recent(self, file_path: str, file_type: str = 'master'):
         """
         Add file to recent history
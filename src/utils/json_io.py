@@ -0,0 +1,75 @@
+"""JSON helpers that use orjson when it is installed and stdlib json otherwise"""
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson  # Optional: native JSON encoder/decoder, several times faster
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to indented UTF-8 JSON
+
+    Both backends produce the same text (2-space indent, non-ASCII kept as is).
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON text
+
+    Args:
+        data: JSON as bytes or str
+
+    Returns:
+        Parsed object
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file
+
+    Args:
+        path: Path to JSON file
+
+    Returns:
+        Parsed object
+
+    Raises:
+        OSError: If file cannot be read
+        json.JSONDecodeError: If file is not valid JSON
+    """
+    return loads(Path(path).read_bytes())
+
+
+def write_json(path: Union[str, Path], obj: Any) -> None:
+    """
+    Write an object to a JSON file (binary write, no text-layer re-encoding)
+
+    Args:
+        path: Output file path
+        obj: JSON-serializable object
+
+    Raises:
+        OSError: If file cannot be written
+    """
+    Path(path).write_bytes(dumps(obj))
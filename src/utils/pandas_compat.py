@@ -0,0 +1,33 @@
+"""Helpers for pandas behavior that differs between pandas 2 and 3"""
+import pandas as pd
+
+# Copy-on-Write is always on from pandas 3.0 (the option is deprecated there)
+PANDAS_3 = int(pd.__version__.split('.')[0]) >= 3
+
+
+def enable_copy_on_write() -> None:
+    """
+    Turn on Copy-on-Write for the whole process
+
+    Changes a global pandas option, so only the application entry point
+    calls this, once at startup.
+    """
+    if not PANDAS_3:
+        pd.set_option('mode.copy_on_write', True)
+
+
+def copy_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy a DataFrame so that changing either side doesn't change the other
+
+    With Copy-on-Write this is a shallow copy sharing the data until one side
+    is modified; without it (pandas 2 with the option off) a deep copy.
+
+    Args:
+        df: DataFrame to copy
+
+    Returns:
+        Independent copy of df
+    """
+    copy_on_write = PANDAS_3 or pd.options.mode.copy_on_write is True
+    return df.copy(deep=not copy_on_write)
@@ -2,6 +2,12 @@
 import re
 from typing import Optional
 
+import numpy as np
+import pandas as pd
+
+# Text values treated as "no SKU" (compared after strip + lowercase)
+EMPTY_SKU_VALUES = ('nan', 'none', 'null', '')
+
 
 def generate_sku_from_name(product_name: str) -> str:
     """
@@ -61,12 +67,31 @@ def is_empty_sku(sku) -> bool:
     sku_str = str(sku).strip()
 
     # Check for common empty indicators
-    if not sku_str or sku_str.lower() in ['nan', 'none', 'null', '']:
+    if not sku_str or sku_str.lower() in EMPTY_SKU_VALUES:
         return True
 
     return False
 
 
+def empty_sku_mask(skus: pd.Series) -> np.ndarray:
+    """
+    Vectorized is_empty_sku over a whole column
+
+    String-dtype columns are checked with pandas string methods in one pass;
+    other columns (e.g. mixed object values) fall back to is_empty_sku per value.
+
+    Args:
+        skus: Series of SKU values
+
+    Returns:
+        Boolean array, True where the SKU is empty
+    """
+    if pd.api.types.is_string_dtype(skus) and not pd.api.types.is_object_dtype(skus):
+        normalized = skus.str.strip().str.lower()
+        return (skus.isna() | normalized.isin(EMPTY_SKU_VALUES)).to_numpy(dtype=bool)
+    return skus.map(is_empty_sku).to_numpy(dtype=bool)
+
+
 def validate_sku(sku: str) -> tuple[bool, Optional[str]]:
     """
     Validate SKU format
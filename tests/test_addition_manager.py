@@ -55,8 +55,8 @@ class TestAdditionManager:
 
         rule = manager.get_addition_rule('NECTAR-30')
         assert rule is not None
-        assert rule['add_sku'] == 'NECTAR-DROPPER'
-        assert rule['quantity'] == 1
+        assert rule.add_sku == 'NECTAR-DROPPER'
+        assert rule.quantity == 1
 
     def test_get_addition_rule_not_found(self):
         """Test getting rule for SKU that doesn't have one"""
@@ -99,7 +99,7 @@ class TestAdditionManager:
         manager.load_from_dataframe(df)
 
         rule = manager.get_addition_rule('PRODUCT-A')
-        assert rule['quantity'] == 1
+        assert rule.quantity == 1
 
     def test_quantity_invalid_values(self):
         """Test that invalid quantity values default to 1"""
@@ -113,9 +113,23 @@ class TestAdditionManager:
         manager.load_from_dataframe(df)
 
         # All invalid quantities should default to 1
-        assert manager.get_addition_rule('PRODUCT-A')['quantity'] == 1
-        assert manager.get_addition_rule('PRODUCT-B')['quantity'] == 1
-        assert manager.get_addition_rule('PRODUCT-C')['quantity'] == 1
+        assert manager.get_addition_rule('PRODUCT-A').quantity == 1
+        assert manager.get_addition_rule('PRODUCT-B').quantity == 1
+        assert manager.get_addition_rule('PRODUCT-C').quantity == 1
+
+    def test_quantity_numeric_strings(self):
+        """Test that numeric strings and floats are converted to int quantities"""
+        manager = AdditionManager()
+
+        df = pd.DataFrame({
+            'IF_SKU': ['PRODUCT-A', 'PRODUCT-B'],
+            'THEN_ADD': ['PRODUCT-X', 'PRODUCT-Y'],
+            'QUANTITY': ['3', 2.0]
+        })
+        manager.load_from_dataframe(df)
+
+        assert manager.get_addition_rule('PRODUCT-A').quantity == 3
+        assert manager.get_addition_rule('PRODUCT-B').quantity == 2
 
     def test_empty_skus_ignored(self):
         """Test that rows with empty SKUs are ignored"""
@@ -196,8 +210,8 @@ class TestAdditionManager:
         # Should only have 1 rule, with the last value
         assert manager.count() == 1
         rule = manager.get_addition_rule('PRODUCT-A')
-        assert rule['add_sku'] == 'PRODUCT-C'
-        assert rule['quantity'] == 2
+        assert rule.add_sku == 'PRODUCT-C'
+        assert rule.quantity == 2
 
     def test_whitespace_handling(self):
         """Test that whitespace is properly stripped from SKUs"""
@@ -215,10 +229,10 @@ class TestAdditionManager:
         assert manager.has_addition_rule('PRODUCT-B')
 
         rule_a = manager.get_addition_rule('PRODUCT-A')
-        assert rule_a['add_sku'] == 'PRODUCT-X'
+        assert rule_a.add_sku == 'PRODUCT-X'
 
         rule_b = manager.get_addition_rule('PRODUCT-B')
-        assert rule_b['add_sku'] == 'PRODUCT-Y'
+        assert rule_b.add_sku == 'PRODUCT-Y'
 
     def test_type_fixed(self):
         """Test FIXED type addition rule"""
@@ -233,8 +247,8 @@ class TestAdditionManager:
         manager.load_from_dataframe(df)
 
         rule = manager.get_addition_rule('PRODUCT-A')
-        assert rule['type'] == 'FIXED'
-        assert rule['quantity'] == 2
+        assert rule.type == 'FIXED'
+        assert rule.quantity == 2
 
     def test_type_matched(self):
         """Test MATCHED type addition rule"""
@@ -248,8 +262,8 @@ class TestAdditionManager:
         manager.load_from_dataframe(df)
 
         rule = manager.get_addition_rule('NECTAR-30')
-        assert rule['type'] == 'MATCHED'
-        assert rule['add_sku'] == 'NECTAR-DROPPER'
+        assert rule.type == 'MATCHED'
+        assert rule.add_sku == 'NECTAR-DROPPER'
 
     def test_type_defaults_to_fixed(self):
         """Test that TYPE defaults to FIXED if not specified"""
@@ -264,7 +278,7 @@ class TestAdditionManager:
         manager.load_from_dataframe(df)
 
         rule = manager.get_addition_rule('PRODUCT-A')
-        assert rule['type'] == 'FIXED'
+        assert rule.type == 'FIXED'
 
     def test_type_invalid_defaults_to_fixed(self):
         """Test that invalid TYPE values default to FIXED"""
@@ -278,9 +292,9 @@ class TestAdditionManager:
         manager.load_from_dataframe(df)
 
         # All should default to FIXED
-        assert manager.get_addition_rule('PRODUCT-A')['type'] == 'FIXED'
-        assert manager.get_addition_rule('PRODUCT-B')['type'] == 'FIXED'
-        assert manager.get_addition_rule('PRODUCT-C')['type'] == 'FIXED'
+        assert manager.get_addition_rule('PRODUCT-A').type == 'FIXED'
+        assert manager.get_addition_rule('PRODUCT-B').type == 'FIXED'
+        assert manager.get_addition_rule('PRODUCT-C').type == 'FIXED'
 
     def test_type_case_insensitive(self):
         """Test that TYPE is case-insensitive"""
@@ -293,10 +307,10 @@ class TestAdditionManager:
         })
         manager.load_from_dataframe(df)
 
-        assert manager.get_addition_rule('PRODUCT-A')['type'] == 'FIXED'
-        assert manager.get_addition_rule('PRODUCT-B')['type'] == 'FIXED'
-        assert manager.get_addition_rule('PRODUCT-C')['type'] == 'MATCHED'
-        assert manager.get_addition_rule('PRODUCT-D')['type'] == 'MATCHED'
+        assert manager.get_addition_rule('PRODUCT-A').type == 'FIXED'
+        assert manager.get_addition_rule('PRODUCT-B').type == 'FIXED'
+        assert manager.get_addition_rule('PRODUCT-C').type == 'MATCHED'
+        assert manager.get_addition_rule('PRODUCT-D').type == 'MATCHED'
 
     def test_mixed_types_in_same_file(self):
         """Test loading both FIXED and MATCHED rules in same file"""
@@ -311,11 +325,34 @@ class TestAdditionManager:
         manager.load_from_dataframe(df)
 
         assert manager.count() == 3
-        assert manager.get_addition_rule('PRODUCT-A')['type'] == 'FIXED'
-        assert manager.get_addition_rule('NECTAR-30')['type'] == 'MATCHED'
-        assert manager.get_addition_rule('PRODUCT-C')['type'] == 'FIXED'
-        assert manager.get_addition_rule('PRODUCT-C')['quantity'] == 3
+        assert manager.get_addition_rule('PRODUCT-A').type == 'FIXED'
+        assert manager.get_addition_rule('NECTAR-30').type == 'MATCHED'
+        assert manager.get_addition_rule('PRODUCT-C').type == 'FIXED'
+        assert manager.get_addition_rule('PRODUCT-C').quantity == 3
+
+
+    def test_to_frame(self):
+        """Test exporting rules as a DataFrame indexed by trigger SKU"""
+        manager = AdditionManager()
+
+        df = pd.DataFrame({
+            'IF_SKU': ['PRODUCT-A', 'NECTAR-30'],
+            'THEN_ADD': ['ACCESSORY-A', 'NECTAR-DROPPER'],
+            'TYPE': ['FIXED', 'MATCHED'],
+            'QUANTITY': [2, 1]
+        })
+        manager.load_from_dataframe(df)
+
+        frame = manager.to_frame()
+        assert list(frame.columns) == ['add_sku', 'quantity', 'type']
+        assert frame.loc['PRODUCT-A', 'add_sku'] == 'ACCESSORY-A'
+        assert frame.loc['PRODUCT-A', 'quantity'] == 2
+        assert frame.loc['NECTAR-30', 'type'] == 'MATCHED'
 
+        orders_skus = pd.Series(['NECTAR-30', 'OTHER'])
+        mapped = orders_skus.map(frame['add_sku'])
+        assert mapped[0] == 'NECTAR-DROPPER'
+        assert pd.isna(mapped[1])
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -271,6 +271,46 @@ class TestAdditionRulesIntegration:
         assert result.iloc[1]['Lineitem sku'] == 'ACCESSORY-B'
         assert result.iloc[1]['Lineitem quantity'] == 2  # Fixed at 2, not 10
 
+    def test_additions_follow_their_order(self):
+        """Test additions come after their own order's lines, once per order"""
+        product_manager = ProductManager()
+        product_manager.load_from_dataframe(pd.DataFrame({
+            'Products_Name': ['Nectar 30ml', 'Dropper'],
+            'SKU': ['NECTAR-30', 'NECTAR-DROPPER'],
+            'Quantity_Product': [1, 1]
+        }))
+        addition_manager = AdditionManager()
+        addition_manager.load_from_dataframe(pd.DataFrame({
+            'IF_SKU': ['NECTAR-30', 'OTHER'],
+            'THEN_ADD': ['NECTAR-DROPPER', 'GIFT-BOX'],
+            'TYPE': ['MATCHED', 'FIXED'],
+            'QUANTITY': [1, 2]
+        }))
+        order_processor = OrderProcessor(product_manager, SetManager(), addition_manager)
+
+        # Lines of order #1 are interleaved with #2; #3 already has the dropper
+        order_processor.load_orders(pd.DataFrame({
+            'Name': ['#1', '#2', '#1', '#3', '#3'],
+            'Lineitem sku': ['NECTAR-30', 'OTHER', 'NECTAR-30', 'NECTAR-DROPPER', 'NECTAR-30'],
+            'Lineitem name': ['Nectar 30ml', 'Other', 'Nectar 30ml', 'Dropper', 'Nectar 30ml'],
+            'Lineitem quantity': [3, 1, 2, 1, 4],
+            'Lineitem price': [30.0, 5.0, 20.0, 0.0, 40.0]
+        }))
+
+        result = order_processor.process_orders()
+
+        assert result['Name'].tolist() == ['#1', '#1', '#1', '#2', '#2', '#3', '#3']
+        assert result['Lineitem sku'].tolist() == [
+            'NECTAR-30', 'NECTAR-30', 'NECTAR-DROPPER',
+            'OTHER', 'GIFT-BOX',
+            'NECTAR-DROPPER', 'NECTAR-30'
+        ]
+        # MATCHED takes the first trigger line's quantity, FIXED the rule's
+        assert result['Lineitem quantity'].tolist() == [3, 2, 3, 1, 2, 1, 4]
+        assert result.loc[2, 'Lineitem name'] == 'Dropper'
+        assert result.loc[4, 'Lineitem name'] == 'GIFT-BOX'
+        assert result.loc[[2, 4], 'Lineitem price'].tolist() == [0, 0]
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
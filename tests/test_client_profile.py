@@ -2,7 +2,7 @@
 import pytest
 import json
 from pathlib import Path
-from src.models.client_profile import ClientProfile, create_default_profile, PLATFORM_TEMPLATES
+from src.models.client_profile import ClientProfile, create_default_profile, PLATFORM_COLUMN_MAPPINGS
 
 
 class TestClientProfile:
@@ -157,6 +157,33 @@ class TestClientProfile:
         assert profile_with_mapping.has_column_mapping() is True
         assert profile_without_mapping.has_column_mapping() is False
 
+    def test_as_renamer(self):
+        """Test as_renamer returns an independent copy of the mapping"""
+        profile = ClientProfile(
+            client_id="TEST018",
+            client_name="Test Client",
+            column_mapping={'Order ID': 'Name'}
+        )
+
+        renamer = profile.as_renamer()
+        assert renamer == {'Order ID': 'Name'}
+
+        renamer['Extra'] = 'Lineitem sku'
+        assert 'Extra' not in profile.column_mapping
+
+    def test_pickle_round_trip(self):
+        """Test profile survives pickling (slots dataclass)"""
+        import pickle
+
+        profile = ClientProfile(
+            client_id="TEST019",
+            client_name="Test Client",
+            column_mapping={'Order ID': 'Name'},
+            output_folder="/tmp/exports"
+        )
+
+        assert pickle.loads(pickle.dumps(profile)) == profile
+
     def test_validate_output_folder_not_set(self):
         """Test validating output folder when not set"""
         profile = ClientProfile(
@@ -186,6 +213,36 @@ class TestClientProfile:
 
         assert profile.validate_output_folder() is False
 
+    def test_validate_output_folder_is_file(self, tmp_path):
+        """Test validating an output folder path that points to a file"""
+        file_path = tmp_path / "not_a_folder.txt"
+        file_path.write_text("x")
+        profile = ClientProfile(
+            client_id="TEST016",
+            client_name="Test Client",
+            output_folder=str(file_path)
+        )
+
+        assert profile.validate_output_folder() is False
+
+    def test_validate_output_folder_after_ensure(self, tmp_path):
+        """Test cached result is dropped once the folder is created"""
+        new_folder = tmp_path / "created_later"
+        profile = ClientProfile(
+            client_id="TEST017",
+            client_name="Test Client",
+            output_folder=str(new_folder)
+        )
+
+        assert profile.validate_output_folder() is False
+        profile.ensure_output_folder()
+        assert profile.validate_output_folder() is True
+
+    def test_standard_columns_read_only(self):
+        """Test STANDARD_COLUMNS cannot be modified"""
+        with pytest.raises(TypeError):
+            ClientProfile.STANDARD_COLUMNS['New'] = 'New column'
+
     def test_ensure_output_folder_creates_folder(self, tmp_path):
         """Test that ensure_output_folder creates the folder"""
         new_folder = tmp_path / "test_output"
@@ -216,18 +273,22 @@ class TestPlatformTemplates:
 
     def test_shopify_template_exists(self):
         """Test Shopify template exists"""
-        assert 'Shopify' in PLATFORM_TEMPLATES
-        template = PLATFORM_TEMPLATES['Shopify']
-        assert template.platform == 'Shopify'
-        assert template.column_mapping == {}  # Shopify is the standard
+        assert 'Shopify' in PLATFORM_COLUMN_MAPPINGS
+        assert PLATFORM_COLUMN_MAPPINGS['Shopify'] == {}  # Shopify is the standard
 
     def test_woocommerce_template_exists(self):
         """Test WooCommerce template exists"""
-        assert 'WooCommerce' in PLATFORM_TEMPLATES
-        template = PLATFORM_TEMPLATES['WooCommerce']
-        assert template.platform == 'WooCommerce'
-        assert 'Order ID' in template.column_mapping
-        assert template.column_mapping['Order ID'] == 'Name'
+        assert 'WooCommerce' in PLATFORM_COLUMN_MAPPINGS
+        mapping = PLATFORM_COLUMN_MAPPINGS['WooCommerce']
+        assert 'Order ID' in mapping
+        assert mapping['Order ID'] == 'Name'
+
+    def test_default_profile_does_not_share_template_mapping(self):
+        """Test editing a new profile's mapping leaves the template untouched"""
+        profile = create_default_profile("CLIENT004", "Test Client", "WooCommerce")
+        profile.column_mapping['Extra'] = 'Lineitem sku'
+
+        assert 'Extra' not in PLATFORM_COLUMN_MAPPINGS['WooCommerce']
 
     def test_create_default_profile_shopify(self):
         """Test creating default Shopify profile"""
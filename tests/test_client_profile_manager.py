@@ -1,7 +1,10 @@
 """Tests for ClientProfileManager module"""
 import pytest
 import json
+import gc
+import weakref
 from pathlib import Path
+from src.models import client_profile_manager
 from src.models.client_profile import ClientProfile
 from src.models.client_profile_manager import ClientProfileManager
 
@@ -380,6 +383,104 @@ class TestClientProfileManager:
         assert (Path(temp_config_path) / "SAVE001.json").exists()
         assert (Path(temp_config_path) / "SAVE002.json").exists()
 
+    def test_flush_writes_deferred_profiles(self, manager, temp_config_path):
+        """Test flush writes only profiles added/updated with save=False"""
+        manager.add_profile(ClientProfile("LATER001", "Client 1"), save=False)
+        manager.add_profile(ClientProfile("LATER002", "Client 2"), save=False)
+
+        assert manager.has_unsaved_changes()
+        assert not (Path(temp_config_path) / "LATER001.json").exists()
+
+        manager.flush()
+
+        assert not manager.has_unsaved_changes()
+        assert (Path(temp_config_path) / "LATER001.json").exists()
+        assert (Path(temp_config_path) / "LATER002.json").exists()
+        assert not list(Path(temp_config_path).glob("*.tmp"))
+
+    def test_exit_hook_flushes_without_keeping_managers_alive(self, temp_config_path, tmp_path):
+        """Test pending changes are written at exit and unused managers can be freed"""
+        manager = ClientProfileManager(temp_config_path)
+        manager.add_profile(ClientProfile("EXIT001", "Client 1"), save=False)
+
+        client_profile_manager._flush_live_managers()
+        assert (Path(temp_config_path) / "EXIT001.json").exists()
+
+        unused = weakref.ref(ClientProfileManager(str(tmp_path)))
+        gc.collect()
+        assert unused() is None
+
+    def test_reload_keeps_deferred_changes(self, manager):
+        """Test reload writes pending changes before re-reading the folder"""
+        manager.add_profile(ClientProfile("LATER003", "Client 3"), save=False)
+
+        manager.reload()
+
+        assert manager.has_profile("LATER003")
+
+    def test_reload_skips_unchanged_files(self, manager, sample_profile, monkeypatch):
+        """Test reload only re-parses files whose mtime/size changed"""
+        import src.models.client_profile_manager as cpm
+
+        manager.add_profile(sample_profile)
+        manager.add_profile(ClientProfile("OTHER001", "Other Client"))
+        manager.reload()
+
+        parsed = []
+        real_read_json = cpm.read_json
+        monkeypatch.setattr(cpm, 'read_json', lambda path: parsed.append(path) or real_read_json(path))
+
+        manager.reload()
+        assert parsed == []
+        assert manager.get_profile("TEST001").column_mapping == {"Order ID": "Name"}
+
+        # Editing the reloaded profile in memory must not leak into the cache
+        manager.get_profile("TEST001").column_mapping["Extra"] = "Lineitem sku"
+        manager.reload()
+        assert "Extra" not in manager.get_profile("TEST001").column_mapping
+
+        sample_profile.client_name = "Renamed Client"
+        manager.update_profile(sample_profile)
+        manager.reload()
+        assert [p.name for p in parsed] == ["TEST001.json"]
+        assert manager.get_profile("TEST001").client_name == "Renamed Client"
+
+    def test_save_skips_unchanged_payload(self, manager, sample_profile, monkeypatch):
+        """Test saving identical content again does not rewrite the file"""
+        import src.models.client_profile_manager as cpm
+
+        manager.add_profile(sample_profile)
+
+        replaced = []
+        real_replace = cpm.os.replace
+        monkeypatch.setattr(cpm.os, 'replace', lambda src, dst: replaced.append(dst) or real_replace(src, dst))
+
+        manager.update_profile(sample_profile)
+        assert replaced == []
+
+        # A file changed by someone else is written again
+        profile_file = manager._get_profile_file_path("TEST001")
+        profile_file.write_text("{}")
+        manager.update_profile(sample_profile)
+        assert len(replaced) == 1
+        manager.reload()
+        assert manager.get_profile("TEST001").client_name == "Test Client"
+
+        sample_profile.client_name = "Renamed Client"
+        manager.update_profile(sample_profile)
+        assert len(replaced) == 2
+
+    def test_reload_ignores_non_profile_entries(self, manager, sample_profile, temp_config_path, capsys):
+        """Test reload only reads regular *.json files"""
+        manager.add_profile(sample_profile)
+        (Path(temp_config_path) / "folder.json").mkdir()
+        (Path(temp_config_path) / "TEST001.json.tmp").write_text("{not json")
+
+        manager.reload()
+
+        assert manager.get_profile_ids() == ["TEST001"]
+        assert "Warning" not in capsys.readouterr().out
+
     def test_profile_file_path_sanitization(self, manager):
         """Test that client_id is sanitized for file path"""
         # Client ID with special characters
@@ -65,6 +65,13 @@ class TestColumnMapper:
         assert 'Lineitem sku' in result_df.columns
         assert 'Lineitem quantity' in result_df.columns
 
+    def test_get_source_columns(self, woocommerce_profile):
+        """Test standard columns are traced back to the client's column names"""
+        mapper = ColumnMapper(woocommerce_profile)
+
+        assert mapper.get_source_columns(['Name', 'Lineitem sku']) == {'Name', 'Order ID', 'Lineitem sku'}
+        assert ColumnMapper().get_source_columns(['Name']) == {'Name'}
+
     def test_apply_mapping_without_mapping(self):
         """Test applying mapping when no mapping defined"""
         mapper = ColumnMapper()
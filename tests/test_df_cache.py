@@ -0,0 +1,162 @@
+"""Unit tests for the on-disk parsed file cache"""
+import os
+import time
+import pytest
+import pandas as pd
+from src.utils import df_cache
+
+pytest.importorskip('pyarrow')
+
+
+def read_frames(path):
+    """Parse a file into the (DataFrame, None) tuple cached by the tests"""
+    return pd.read_csv(path), None
+
+
+class TestDfCache:
+    """Test suite for df_cache helpers"""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Point the cache at a temporary folder"""
+        cache_dir = tmp_path / 'cache'
+        monkeypatch.setattr(df_cache, 'CACHE_DIR', cache_dir)
+        return cache_dir
+
+    @pytest.fixture
+    def input_file(self, tmp_path):
+        """Create a small input file"""
+        path = tmp_path / 'input.csv'
+        path.write_text('SKU,Qty\nLAV-10ML,1\n')
+        return path
+
+    def test_parses_once(self, input_file):
+        """Test an unchanged file is parsed only once"""
+        calls = []
+
+        def parse(path):
+            calls.append(path)
+            return read_frames(path)
+
+        first = df_cache.load_or_parse(str(input_file), parse)
+        second = df_cache.load_or_parse(str(input_file), parse)
+
+        assert len(calls) == 1
+        pd.testing.assert_frame_equal(first[0], second[0])
+        assert second[1] is None
+
+    def test_modified_file_parsed_again(self, input_file):
+        """Test a changed file misses the cache"""
+        df_cache.load_or_parse(str(input_file), read_frames)
+
+        input_file.write_text('SKU,Qty\nROSE-10ML,2\nTEA-10ML,3\n')
+        os.utime(input_file, ns=(0, 10**18))
+
+        result, _ = df_cache.load_or_parse(str(input_file), read_frames)
+        assert result['SKU'].tolist() == ['ROSE-10ML', 'TEA-10ML']
+
+    def test_extra_is_part_of_key(self, input_file):
+        """Test different parse settings get separate entries"""
+        df_cache.load_or_parse(str(input_file), lambda path: (pd.DataFrame({'a': [1]}),), extra='a')
+        result, = df_cache.load_or_parse(str(input_file), lambda path: (pd.DataFrame({'b': [2]}),), extra='b')
+        assert list(result.columns) == ['b']
+
+    def test_corrupt_entry_parsed_again(self, input_file, cache_dir):
+        """Test an unreadable cache entry is parsed again and replaced"""
+        df_cache.load_or_parse(str(input_file), read_frames)
+        for entry in cache_dir.glob('*/*.feather'):
+            entry.write_bytes(b'not a feather file')
+
+        calls = []
+
+        def parse(path):
+            calls.append(path)
+            return read_frames(path)
+
+        result, _ = df_cache.load_or_parse(str(input_file), parse)
+        assert calls and result['SKU'].tolist() == ['LAV-10ML']
+
+        # The rewritten entry is readable again
+        df_cache.load_or_parse(str(input_file), parse)
+        assert len(calls) == 1
+
+    def test_old_entries_removed(self, tmp_path, cache_dir, monkeypatch):
+        """Test the cache keeps at most MAX_ENTRIES entries"""
+        monkeypatch.setattr(df_cache, 'MAX_ENTRIES', 2)
+        for i in range(4):
+            path = tmp_path / f'input_{i}.csv'
+            path.write_text(f'SKU\n{i}\n')
+            df_cache.load_or_parse(str(path), read_frames)
+
+        assert len([p for p in cache_dir.iterdir() if p.is_dir()]) == 2
+
+    def test_expired_entries_removed(self, input_file, cache_dir):
+        """Test entries older than MAX_AGE_SECONDS are parsed again and removed"""
+        df_cache.load_or_parse(str(input_file), read_frames)
+        entry, = cache_dir.iterdir()
+        old = time.time() - df_cache.MAX_AGE_SECONDS - 60
+        os.utime(entry, (old, old))
+
+        calls = []
+
+        def parse(path):
+            calls.append(path)
+            return read_frames(path)
+
+        df_cache.load_or_parse(str(input_file), parse)
+        assert len(calls) == 1
+        assert entry.stat().st_mtime > old
+
+    def test_leftover_pickles_removed(self, input_file, cache_dir):
+        """Test files of the earlier pickle format are deleted"""
+        cache_dir.mkdir()
+        (cache_dir / 'abc.pkl').write_bytes(b'old')
+
+        df_cache.load_or_parse(str(input_file), read_frames)
+
+        assert not (cache_dir / 'abc.pkl').exists()
+
+    def test_uncacheable_result_returned(self, input_file, cache_dir):
+        """Test a frame Feather can't store is still returned, just not cached"""
+        mixed = pd.DataFrame({'SKU': pd.Series(['LAV-10ML', 5], dtype=object)})
+
+        result, = df_cache.load_or_parse(str(input_file), lambda path: (mixed,))
+
+        assert result is mixed
+        assert not any(cache_dir.iterdir())
+
+    def test_disabled(self, input_file, cache_dir, monkeypatch):
+        """Test CACHE_DIR = None parses every time and writes nothing"""
+        monkeypatch.setattr(df_cache, 'CACHE_DIR', None)
+        calls = []
+
+        def parse(path):
+            calls.append(path)
+            return read_frames(path)
+
+        df_cache.load_or_parse(str(input_file), parse)
+        df_cache.load_or_parse(str(input_file), parse)
+
+        assert len(calls) == 2
+        assert not cache_dir.exists()
+
+    def test_without_pyarrow(self, input_file, cache_dir, monkeypatch):
+        """Test nothing is written to disk without pyarrow"""
+        monkeypatch.setattr(df_cache, 'pyarrow', None)
+
+        df_cache.load_or_parse(str(input_file), read_frames)
+
+        assert not df_cache.is_enabled()
+        assert not cache_dir.exists()
+
+    def test_missing_file(self, tmp_path):
+        """Test missing file raises FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            df_cache.load_or_parse(str(tmp_path / 'missing.csv'), read_frames)
+
+    def test_clear(self, input_file, cache_dir):
+        """Test clear removes all entries"""
+        df_cache.load_or_parse(str(input_file), read_frames)
+        df_cache.clear()
+
+        assert list(cache_dir.iterdir()) == []
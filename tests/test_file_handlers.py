@@ -4,7 +4,11 @@ import pandas as pd
 from pathlib import Path
 import tempfile
 import shutil
-from src.utils.file_handlers import OrdersFileLoader
+from src.models.client_profile import ClientProfile
+from src.models.order_processor import OrderProcessor
+from src.utils.column_mapper import ColumnMapper
+from src.utils import df_cache, file_handlers
+from src.utils.file_handlers import MasterFileLoader, OrdersFileLoader
 
 
 class TestOrdersFileLoader:
@@ -131,6 +135,99 @@ class TestOrdersFileLoader:
         with pytest.raises(ValueError, match="No files provided"):
             OrdersFileLoader.load_multiple([])
 
+    def test_load_keeps_sku_text(self, temp_dir):
+        """Test numeric-looking SKUs are read as text (leading zeros kept)"""
+        file_path = Path(temp_dir) / "orders.csv"
+        file_path.write_text("Name,Lineitem sku,Lineitem quantity\n#001,00123,1\n#002,,2\n")
+
+        df = OrdersFileLoader.load(str(file_path))
+
+        assert df['Lineitem sku'].iloc[0] == '00123'
+        assert pd.isna(df['Lineitem sku'].iloc[1])
+        assert df['Lineitem quantity'].tolist() == [1, 2]
+
+    def test_load_usecols_with_mapping(self, temp_dir):
+        """Test usecols keeps only the given standard columns, before mapping"""
+        file_path = Path(temp_dir) / "orders.csv"
+        file_path.write_text(
+            "Order ID,Email,Lineitem sku,Lineitem quantity,Notes\n#001,a@b.c,00123,1,x\n"
+        )
+        mapper = ColumnMapper(ClientProfile("WOO001", "Woo Client", column_mapping={"Order ID": "Name"}))
+
+        df = OrdersFileLoader.load(str(file_path), mapper, usecols=OrderProcessor.REQUIRED_COLUMNS)
+
+        assert 'Email' not in df.columns
+        assert 'Notes' not in df.columns
+        assert df['Name'].iloc[0] == '#001'
+        assert df['Lineitem sku'].iloc[0] == '00123'
+
+    def test_load_multiple_missing_file(self, temp_dir, sample_csv_1, sample_csv_2):
+        """Test a missing file among several is reported by name"""
+        missing = str(Path(temp_dir) / "missing.csv")
+
+        with pytest.raises(FileNotFoundError, match="missing.csv"):
+            OrdersFileLoader.load_multiple([sample_csv_1, missing, sample_csv_2])
+
+    def test_save_round_trip(self, temp_dir, sample_csv_1):
+        """Test saved orders load back unchanged"""
+        df = OrdersFileLoader.load(sample_csv_1)
+        out_path = str(Path(temp_dir) / "out.csv")
+
+        OrdersFileLoader.save(df, out_path)
+
+        pd.testing.assert_frame_equal(OrdersFileLoader.load(out_path), df)
+
+    def test_save_parquet(self, temp_dir, sample_csv_1):
+        """Test saving to a .parquet path writes Parquet"""
+        pytest.importorskip('pyarrow')
+        df = OrdersFileLoader.load(sample_csv_1)
+        out_path = str(Path(temp_dir) / "out.parquet")
+
+        OrdersFileLoader.save(df, out_path)
+
+        pd.testing.assert_frame_equal(pd.read_parquet(out_path), df, check_dtype=False)
+
+    def test_save_parquet_without_pyarrow(self, temp_dir, sample_csv_1, monkeypatch):
+        """Test Parquet output fails cleanly without pyarrow"""
+        from src.utils import file_handlers
+        df = OrdersFileLoader.load(sample_csv_1)
+        monkeypatch.setattr(file_handlers, 'pyarrow', None)
+
+        with pytest.raises(ValueError, match="requires pyarrow"):
+            OrdersFileLoader.save(df, str(Path(temp_dir) / "out.parquet"))
+
+    @pytest.mark.parametrize('demo_file', ['orders_export.csv', 'orders_with_empty_skus.csv'])
+    def test_arrow_engine_matches_c_engine(self, demo_file, monkeypatch):
+        """Test the pyarrow CSV reader gives the same frame as the C parser"""
+        pytest.importorskip('pyarrow')
+        file_path = str(Path(__file__).parent.parent / 'demo_data' / demo_file)
+
+        monkeypatch.setattr(file_handlers, 'CSV_ENGINE', 'pyarrow')
+        arrow_df = OrdersFileLoader.load(file_path)
+        monkeypatch.setattr(file_handlers, 'CSV_ENGINE', 'c')
+        c_df = OrdersFileLoader.load(file_path)
+
+        pd.testing.assert_frame_equal(arrow_df, c_df)
+
+    def test_arrow_engine_keeps_dates_and_flags_as_text(self, temp_dir, monkeypatch):
+        """Test the pyarrow CSV reader doesn't infer timestamps or booleans"""
+        pytest.importorskip('pyarrow')
+        file_path = Path(temp_dir) / "orders.csv"
+        file_path.write_text(
+            "Name,Paid at,Accepts Marketing,Notes,Lineitem quantity\n"
+            "#001,2024-01-01 10:30:00 -0500,true,,1\n"
+            "#002,,false,,2\n"
+        )
+        monkeypatch.setattr(file_handlers, 'CSV_ENGINE', 'pyarrow')
+
+        df = OrdersFileLoader.load(str(file_path))
+
+        assert df['Paid at'].iloc[0] == '2024-01-01 10:30:00 -0500'
+        assert pd.isna(df['Paid at'].iloc[1])
+        assert df['Accepts Marketing'].tolist() == ['true', 'false']
+        assert df['Notes'].dtype == 'float64'
+        assert df['Lineitem quantity'].tolist() == [1, 2]
+
     def test_load_multiple_single_file(self, sample_csv_1):
         """Test load_multiple with just one file"""
         combined_df = OrdersFileLoader.load_multiple([sample_csv_1])
@@ -177,6 +274,17 @@ class TestOrdersFileLoader:
         assert len(file_names) == 1
         assert file_names[0] == 'orders1.csv'
 
+    def test_load_from_folder_with_gzipped_csv(self, temp_dir, sample_csv_1, sample_csv_2):
+        """Test folder loading picks up gzip-compressed CSV files"""
+        gz_path = Path(sample_csv_2).with_suffix('.csv.gz')
+        pd.read_csv(sample_csv_2).to_csv(gz_path, index=False)
+        Path(sample_csv_2).unlink()
+
+        combined_df, file_names = OrdersFileLoader.load_from_folder(temp_dir)
+
+        assert len(combined_df) == 3
+        assert file_names == ['orders1.csv', 'orders2.csv.gz']
+
     def test_load_multiple_preserves_column_order(self, sample_csv_1, sample_csv_2):
         """Test that column order is preserved when combining files"""
         combined_df = OrdersFileLoader.load_multiple([sample_csv_1, sample_csv_2])
@@ -202,3 +310,164 @@ class TestOrdersFileLoader:
         orders = combined_df['Name'].unique()
         assert '#001' in orders
         assert '#002' in orders
+
+
+class TestMasterFileLoader:
+    """Test suite for MasterFileLoader class"""
+
+    @pytest.fixture
+    def master_file(self, tmp_path, monkeypatch):
+        """Create a small master XLSX file"""
+        monkeypatch.setattr(df_cache, 'CACHE_DIR', tmp_path / 'cache')
+        path = tmp_path / "master.xlsx"
+        with pd.ExcelWriter(path) as writer:
+            pd.DataFrame({
+                'Products_Name': ['Lavender Oil'], 'SKU': ['LAV-10ML'], 'Quantity_Product': [1]
+            }).to_excel(writer, sheet_name='PRODUCTS', index=False)
+            pd.DataFrame({
+                'SET_Name': ['Relax'], 'SET_SKU': ['SET-RELAX'], 'SKUs_in_SET': ['LAV-10ML']
+            }).to_excel(writer, sheet_name='SETS', index=False)
+        MasterFileLoader.clear_cache()
+        yield path
+        MasterFileLoader.clear_cache()
+
+    def test_load_cached_reuses_unchanged_file(self, master_file, monkeypatch):
+        """Test an unchanged file is parsed only once"""
+        calls = []
+        real_load = MasterFileLoader.load
+        monkeypatch.setattr(MasterFileLoader, 'load',
+                            staticmethod(lambda path: calls.append(path) or real_load(path)))
+
+        products_df, sets_df, additions_df = MasterFileLoader.load_cached(str(master_file))
+        products_df.loc[0, 'SKU'] = 'CHANGED'
+        products_df, _, _ = MasterFileLoader.load_cached(str(master_file))
+
+        assert len(calls) == 1
+        assert products_df.loc[0, 'SKU'] == 'LAV-10ML'
+        assert additions_df is None
+
+    def test_load_cached_reuses_disk_cache(self, master_file, monkeypatch):
+        """Test sheets cached on disk are reused after the memory cache is cleared"""
+        pytest.importorskip('pyarrow')
+        expected, _, _ = MasterFileLoader.load_cached(str(master_file))
+        MasterFileLoader.clear_cache()
+
+        def fail(path):
+            raise AssertionError("master file parsed again")
+
+        monkeypatch.setattr(MasterFileLoader, 'load', staticmethod(fail))
+        products_df, _, additions_df = MasterFileLoader.load_cached(str(master_file))
+
+        pd.testing.assert_frame_equal(products_df, expected)
+        assert additions_df is None
+
+    def test_load_cached_key_includes_reader(self, master_file, monkeypatch):
+        """Test the disk cache key names the workbook reader and parse version"""
+        extras = []
+
+        def load_or_parse(path, parse, extra=""):
+            extras.append(extra)
+            return parse(path)
+
+        monkeypatch.setattr(df_cache, 'load_or_parse', load_or_parse)
+        MasterFileLoader.load_cached(str(master_file))
+        MasterFileLoader.clear_cache()
+        monkeypatch.setattr(file_handlers, 'CalamineWorkbook',
+                            None if file_handlers.CalamineWorkbook is not None else object())
+        try:
+            MasterFileLoader.load_cached(str(master_file))
+        except ValueError:
+            pass  # Only the key matters here, not whether the stand-in reader works
+
+        readers = {extra.split('|')[1] for extra in extras}
+        assert readers == {'calamine', 'openpyxl'}
+        assert all(extra.endswith(f"|{MasterFileLoader.PARSE_VERSION}") for extra in extras)
+
+    def test_load_cached_reparses_modified_file(self, master_file):
+        """Test a rewritten file is parsed again"""
+        MasterFileLoader.load_cached(str(master_file))
+
+        with pd.ExcelWriter(master_file) as writer:
+            pd.DataFrame({
+                'Products_Name': ['Rose Oil', 'Tea Tree Oil'], 'SKU': ['ROSE-10ML', 'TEA-10ML'],
+                'Quantity_Product': [1, 2]
+            }).to_excel(writer, sheet_name='PRODUCTS', index=False)
+            pd.DataFrame({
+                'SET_Name': ['Relax'], 'SET_SKU': ['SET-RELAX'], 'SKUs_in_SET': ['ROSE-10ML']
+            }).to_excel(writer, sheet_name='SETS', index=False)
+
+        products_df, _, _ = MasterFileLoader.load_cached(str(master_file))
+        assert products_df['SKU'].tolist() == ['ROSE-10ML', 'TEA-10ML']
+
+    def test_load_cached_missing_file(self, tmp_path):
+        """Test missing file raises FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            MasterFileLoader.load_cached(str(tmp_path / "missing.xlsx"))
+
+    def test_load_matches_read_excel(self, tmp_path):
+        """Test sheets read like pd.read_excel (blanks, whole-number floats, missing sheets)"""
+        path = tmp_path / "master.xlsx"
+        products = pd.DataFrame({
+            'Products_Name': ['Lavender Oil', None, 'Rose Oil'],
+            'SKU': ['00123', 'TEA-10ML', None],
+            'Quantity_Product': [1.0, 2.0, 1.0],
+            'Weight': [0.5, None, 1.25]
+        })
+        with pd.ExcelWriter(path) as writer:
+            products.to_excel(writer, sheet_name='PRODUCTS', index=False)
+            pd.DataFrame({'SET_SKU': [], 'SKUs_in_SET': []}).to_excel(writer, sheet_name='SETS', index=False)
+
+        products_df, sets_df, additions_df = MasterFileLoader.load(str(path))
+
+        pd.testing.assert_frame_equal(products_df, pd.read_excel(path, sheet_name='PRODUCTS'))
+        assert products_df['Quantity_Product'].dtype == 'int64'
+        assert list(sets_df.columns) == ['SET_SKU', 'SKUs_in_SET'] and sets_df.empty
+        assert additions_df is None
+
+    def test_calamine_matches_openpyxl(self, tmp_path, monkeypatch):
+        """Test the python-calamine reader gives the same sheets as openpyxl"""
+        pytest.importorskip('python_calamine')
+        from src.utils import file_handlers
+
+        path = tmp_path / "master.xlsx"
+        with pd.ExcelWriter(path) as writer:
+            pd.DataFrame({
+                'Products_Name': ['Lavender Oil', None, 'Rose Oil'],
+                'SKU': ['00123', 'TEA-10ML', None],
+                'Quantity_Product': [1, 2, 1],
+                'Weight': [0.5, None, 1.25]
+            }).to_excel(writer, sheet_name='PRODUCTS', index=False)
+            pd.DataFrame({'SET_SKU': ['SET-A'], 'SKUs_in_SET': ['00123']}).to_excel(
+                writer, sheet_name='SETS', index=False, startrow=1)
+            pd.DataFrame({'SKU': ['00123'], 'ADD_SKU': ['BOX']}).to_excel(
+                writer, sheet_name='ADDITION', index=False)
+
+        calamine_sheets = MasterFileLoader.load(str(path))
+        monkeypatch.setattr(file_handlers, 'CalamineWorkbook', None)
+        openpyxl_sheets = MasterFileLoader.load(str(path))
+
+        for calamine_df, openpyxl_df in zip(calamine_sheets, openpyxl_sheets):
+            pd.testing.assert_frame_equal(calamine_df, openpyxl_df)
+
+    def test_frame_from_rows_mixed_numbers(self, tmp_path):
+        """Test whole-number floats in a text column become ints, as in pd.read_excel"""
+        from src.utils.file_handlers import _frame_from_rows
+
+        # As python-calamine returns them: every number is a float
+        df = _frame_from_rows([["SKU", "Name", "Qty"], ["ABC-1", "a", 1.0], [10023.0, "b", 2.5]])
+
+        assert df['SKU'].tolist() == ['ABC-1', 10023]
+        assert type(df['SKU'].iloc[1]) is int
+        assert df['Qty'].tolist() == [1.0, 2.5]
+
+        path = tmp_path / "mixed.xlsx"
+        df.to_excel(path, index=False)
+        pd.testing.assert_frame_equal(df, pd.read_excel(path))
+
+    def test_load_missing_sheet(self, tmp_path):
+        """Test missing SETS sheet raises ValueError"""
+        path = tmp_path / "master.xlsx"
+        pd.DataFrame({'SKU': ['A']}).to_excel(path, sheet_name='PRODUCTS', index=False)
+
+        with pytest.raises(ValueError, match="Missing required sheet: SETS"):
+            MasterFileLoader.load(str(path))
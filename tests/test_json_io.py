@@ -0,0 +1,43 @@
+"""Unit tests for JSON helpers"""
+import json
+import pytest
+from src.utils import json_io
+
+
+class TestJsonIO:
+    """Test suite for json_io helpers"""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample JSON-serializable data"""
+        return {
+            'client_id': 'CLIENT001',
+            'client_name': 'Клієнт',
+            'column_mapping': {'Order ID': 'Name'},
+            'output_folder': None
+        }
+
+    def test_write_and_read_round_trip(self, tmp_path, sample_data):
+        """Test data survives a write/read cycle"""
+        file_path = tmp_path / 'data.json'
+
+        json_io.write_json(file_path, sample_data)
+
+        assert json_io.read_json(file_path) == sample_data
+
+    def test_stdlib_fallback_matches(self, monkeypatch, sample_data):
+        """Test stdlib fallback writes the same text as orjson"""
+        expected = json.dumps(sample_data, indent=2, ensure_ascii=False).encode('utf-8')
+        assert json_io.dumps(sample_data) == expected
+
+        monkeypatch.setattr(json_io, 'orjson', None)
+        assert json_io.dumps(sample_data) == expected
+        assert json_io.loads(expected) == sample_data
+
+    def test_invalid_json_raises(self, tmp_path):
+        """Test invalid JSON raises a JSONDecodeError"""
+        file_path = tmp_path / 'broken.json'
+        file_path.write_text('{ invalid json')
+
+        with pytest.raises(json.JSONDecodeError):
+            json_io.read_json(file_path)
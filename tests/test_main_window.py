@@ -0,0 +1,68 @@
+"""Unit tests for DecoderToolApp logic that doesn't need a display"""
+import pandas as pd
+from src.models.product_manager import ProductManager
+from src.models.set_manager import SetManager
+from src.models.order_processor import OrderProcessor
+from src.ui.main_window import DecoderToolApp
+
+
+def make_window(orders_df: pd.DataFrame) -> DecoderToolApp:
+    """Create a DecoderToolApp with loaded managers but no Tk widgets"""
+    window = DecoderToolApp.__new__(DecoderToolApp)
+    window.product_manager = ProductManager()
+    window.product_manager.load_from_dataframe(pd.DataFrame({
+        'Products_Name': ['Lavender Oil'],
+        'SKU': ['LAV-10ML'],
+        'Quantity_Product': [1]
+    }))
+    window.set_manager = SetManager()
+    window.order_processor = OrderProcessor(window.product_manager, window.set_manager)
+    window.order_processor.load_orders(orders_df)
+    window._order_checks = {}
+    window._order_checks_revision = None
+    return window
+
+
+class TestValidation:
+    """Test suite for DecoderToolApp._run_full_validation"""
+
+    def test_reports_missing_quantities(self):
+        """Test blank quantities are reported although they are loaded as 0"""
+        window = make_window(pd.DataFrame({
+            'Name': ['#1', '#2', '#3'],
+            'Lineitem sku': ['LAV-10ML'] * 3,
+            'Lineitem quantity': [1, None, None],
+        }))
+
+        issues = window._run_full_validation()
+
+        assert "Found 2 rows with missing or invalid quantities" in issues['warning']
+
+    def test_no_missing_quantities(self):
+        """Test complete quantities give no quantity warning"""
+        window = make_window(pd.DataFrame({
+            'Name': ['#1'],
+            'Lineitem sku': ['LAV-10ML'],
+            'Lineitem quantity': [1],
+        }))
+
+        issues = window._run_full_validation()
+
+        assert not any('quantities' in issue for issue in issues['warning'])
+
+
+class TestMasterLoad:
+    """Test suite for starting master file loads"""
+
+    def test_recent_file_ignored_while_busy(self, tmp_path):
+        """Test picking a recent file during a job doesn't announce a load"""
+        master_file = tmp_path / "master.xlsx"
+        master_file.touch()
+        window = make_window(pd.DataFrame({'Name': ['#1']}))
+        window._busy = True
+        statuses = []
+        window._update_status = lambda *args, **kwargs: statuses.append(args)
+
+        window._load_master_from_path(str(master_file))
+
+        assert statuses == []
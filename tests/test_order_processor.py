@@ -57,9 +57,74 @@ class TestOrderProcessor:
 
     def test_load_orders(self, order_processor, sample_orders_df):
         """Test loading orders"""
-        order_processor.load_orders(sample_orders_df)
+        assert order_processor.load_orders(sample_orders_df) == 3
         assert order_processor.get_order_count() == 3
 
+    def test_add_manual_product_multiple(self, order_processor, sample_orders_df):
+        """Test several manual additions are all visible to readers"""
+        order_processor.load_orders(sample_orders_df)
+
+        order_processor.add_manual_product('#76360', 'CHAM-10ML', 2)
+        order_processor.add_manual_product('#76361', 'LAV-10ML', 1)
+
+        assert order_processor.get_order_count() == 5
+
+        df = order_processor.get_orders_dataframe()
+        assert df['Lineitem sku'].tolist()[-2:] == ['CHAM-10ML', 'LAV-10ML']
+        assert df['Name'].tolist()[-2:] == ['#76360', '#76361']
+
+        result_df = order_processor.process_orders()
+        assert 'CHAM-10ML' in result_df[result_df['Name'] == '#76360']['Lineitem sku'].tolist()
+
+    def test_load_orders_isolated_from_input(self, order_processor, sample_orders_df):
+        """Test later edits to the input DataFrame don't reach loaded orders"""
+        order_processor.load_orders(sample_orders_df)
+
+        sample_orders_df.loc[0, 'Lineitem sku'] = 'MODIFIED'
+
+        assert order_processor.get_orders_dataframe().loc[0, 'Lineitem sku'] == 'SET-RELAX'
+
+    def test_load_orders_keeps_exported_values(self, order_processor):
+        """Test quantity/price read as text pass through unchanged and are parsed only for decoding"""
+        orders_df = pd.DataFrame({
+            'Name': ['#1', '#1', '#2', '#3'],
+            'Lineitem sku': ['SET-RELAX', 'LAV-10ML', 'LAV-10ML', 'SET-RELAX'],
+            'Lineitem quantity': ['2', '1', '', ''],
+            'Lineitem price': ['$19.99', '12,50', '10', '5'],
+        })
+
+        order_processor.load_orders(orders_df)
+        df = order_processor.get_orders_dataframe()
+
+        assert df['Lineitem quantity'].tolist() == ['2', '1', '', '']
+        assert df['Lineitem price'].tolist() == ['$19.99', '12,50', '10', '5']
+
+        result_df = order_processor.process_orders()
+        components = result_df[result_df['Lineitem sku'] == 'CHAM-10ML']
+        assert components['Lineitem quantity'].tolist() == [2, 0]
+        assert result_df['Lineitem price'].tolist() == ['$19.99', 0, 0, '12,50', '10', '5', 0, 0]
+
+    def test_missing_quantity_count(self, order_processor, sample_orders_df):
+        """Test blank and non-numeric quantities are counted before being stored as 0"""
+        orders_df = pd.DataFrame({
+            'Name': ['#1', '#2', '#3', '#4'],
+            'Lineitem sku': ['LAV-10ML'] * 4,
+            'Lineitem quantity': ['2', '', None, 'abc'],
+        })
+
+        order_processor.load_orders(orders_df)
+        assert order_processor.get_missing_quantity_count() == 3
+
+        order_processor.add_manual_product('#1', 'LAV-10ML', 1)
+        assert order_processor.get_missing_quantity_count() == 3
+
+        order_processor.load_orders(sample_orders_df)
+        assert order_processor.get_missing_quantity_count() == 0
+
+        order_processor.load_orders(orders_df)
+        order_processor.clear_orders()
+        assert order_processor.get_missing_quantity_count() == 0
+
     def test_add_manual_product_success(self, order_processor, sample_orders_df):
         """Test successful manual product addition"""
         order_processor.load_orders(sample_orders_df)
@@ -86,6 +151,23 @@ class TestOrderProcessor:
         assert success is False
         assert 'not found' in message
 
+    def test_add_manual_product_after_reload(self, order_processor, sample_orders_df):
+        """Test manual addition looks orders up in the currently loaded orders"""
+        order_processor.load_orders(sample_orders_df)
+        order_processor.add_manual_product('#76361', 'LAV-10ML', 1)
+
+        reloaded_df = sample_orders_df.copy()
+        reloaded_df['Name'] = ['#80001', '#80002', '#76361']
+        reloaded_df['Email'] = ['a@example.com', 'b@example.com', 'c@example.com']
+        order_processor.load_orders(reloaded_df)
+
+        assert order_processor.add_manual_product('#76360', 'LAV-10ML', 1)[0] is False
+        assert order_processor.add_manual_product('#80002', 'LAV-10ML', 1)[0] is True
+
+        added = order_processor.get_orders_dataframe().iloc[-1]
+        assert added['Name'] == '#80002'
+        assert added['Email'] == 'b@example.com'
+
     def test_add_manual_product_uses_product_name(self, order_processor, sample_orders_df):
         """Test that manual addition uses product name from map"""
         order_processor.load_orders(sample_orders_df)
@@ -171,6 +253,25 @@ class TestOrderProcessor:
         assert result_df.iloc[1]['Lineitem quantity'] == 2
         assert result_df.iloc[2]['Lineitem quantity'] == 2
 
+    def test_process_orders_keeps_line_order(self, order_processor):
+        """Test decoded components take the place of their set line"""
+        orders_df = pd.DataFrame({
+            'Name': ['#1', '#1', '#1'],
+            'Lineitem quantity': [1, 1, 1],
+            'Lineitem name': ['Peppermint Oil', 'Relaxation Bundle', 'Lavender Oil'],
+            'Lineitem sku': ['PEPP-10ML', 'SET-RELAX', 'LAV-10ML'],
+            'Lineitem price': [11.99, 49.99, 12.99],
+            'Lineitem discount': [0, 0, 0]
+        })
+        order_processor.load_orders(orders_df)
+
+        result_df = order_processor.process_orders()
+
+        assert result_df['Lineitem sku'].tolist() == [
+            'PEPP-10ML', 'LAV-10ML', 'CHAM-10ML', 'BOX-RELAX', 'LAV-10ML'
+        ]
+        assert result_df['Lineitem price'].tolist() == [11.99, 49.99, 0, 0, 12.99]
+
     def test_process_orders_component_not_in_product_map(self, order_processor):
         """Test decoding set with component not in product map"""
         # Create set with unknown component
@@ -207,6 +308,29 @@ class TestOrderProcessor:
         assert result_df.iloc[1]['Lineitem name'] == 'UNKNOWN-COMP'
         assert result_df.iloc[1]['Lineitem quantity'] == 1  # fallback physical_qty = 1
 
+    def test_process_orders_after_master_reload(self, order_processor, sample_orders_df):
+        """Test processing picks up reloaded products and sets"""
+        order_processor.load_orders(sample_orders_df)
+        order_processor.process_orders()
+
+        order_processor.product_manager.load_from_dataframe(pd.DataFrame({
+            'Products_Name': ['Lavender Oil 2', 'Chamomile Oil', 'Relax Box', 'Peppermint Oil'],
+            'SKU': ['LAV-10ML', 'CHAM-10ML', 'BOX-RELAX', 'PEPP-10ML'],
+            'Quantity_Product': [3, 1, 1, 2]
+        }))
+        result_df = order_processor.process_orders()
+        lavender = result_df[result_df['Lineitem sku'] == 'LAV-10ML']
+        assert lavender['Lineitem name'].iloc[0] == 'Lavender Oil 2'
+        assert lavender['Lineitem quantity'].iloc[0] == 6  # 2 sets x 3 physical
+
+        order_processor.set_manager.load_from_dataframe(pd.DataFrame({
+            'SET_Name': ['Relaxation Bundle'],
+            'SET_SKU': ['SET-RELAX'],
+            'SKUs_in_SET': ['CHAM-10ML']
+        }))
+        result_df = order_processor.process_orders()
+        assert result_df['Lineitem sku'].tolist() == ['CHAM-10ML', 'LAV-10ML', 'PEPP-10ML']
+
     def test_clear_orders(self, order_processor, sample_orders_df):
         """Test clearing orders"""
         order_processor.load_orders(sample_orders_df)
@@ -215,6 +339,32 @@ class TestOrderProcessor:
         order_processor.clear_orders()
         assert order_processor.get_order_count() == 0
 
+    def test_get_unique_order_count(self, order_processor, sample_orders_df):
+        """Test unique order count follows reloads"""
+        assert order_processor.get_unique_order_count() == 0
+
+        order_processor.load_orders(sample_orders_df)
+        assert order_processor.get_unique_order_count() == 2
+
+        order_processor.load_orders(sample_orders_df.iloc[:1])
+        assert order_processor.get_unique_order_count() == 1
+
+    def test_revision_tracks_changes(self, order_processor, sample_orders_df):
+        """Test the revision changes with the orders and not on reads"""
+        order_processor.load_orders(sample_orders_df)
+        revision = order_processor.get_revision()
+
+        order_processor.get_orders_dataframe()
+        order_processor.process_orders()
+        assert order_processor.get_revision() == revision
+
+        order_processor.add_manual_product('#76360', 'NEW-SKU', 1)
+        assert order_processor.get_revision() != revision
+
+        revision = order_processor.get_revision()
+        order_processor.clear_orders()
+        assert order_processor.get_revision() != revision
+
     def test_get_orders_dataframe_returns_copy(self, order_processor, sample_orders_df):
         """Test that get_orders_dataframe returns a copy"""
         order_processor.load_orders(sample_orders_df)
@@ -300,6 +450,26 @@ class TestOrderProcessor:
         # Special characters should be removed
         assert df.iloc[0]['Lineitem sku'] == 'PRODUCT_SAMPLE_TEST'
 
+    def test_generate_missing_skus_all_empty_column(self, order_processor):
+        """Test SKU generation when the whole SKU column is empty (read as float NaN)"""
+        orders_df = pd.DataFrame({
+            'Name': ['#1', '#2'],
+            'Lineitem name': ['Face Oil', 'Hand Cream'],
+            'Lineitem sku': [float('nan'), float('nan')],
+            'Lineitem quantity': [1, 1],
+            'Lineitem price': [0, 0]
+        })
+
+        order_processor.load_orders(orders_df)
+        count, changes = order_processor.generate_missing_skus()
+
+        assert count == 2
+        assert [c['new_sku'] for c in changes] == ['FACE_OIL', 'HAND_CREAM']
+        df = order_processor.get_orders_dataframe()
+        assert list(df['Lineitem sku']) == ['FACE_OIL', 'HAND_CREAM']
+        # Input frame is untouched
+        assert orders_df['Lineitem sku'].isna().all()
+
     def test_generate_missing_skus_no_orders_loaded(self, order_processor):
         """Test SKU generation when no orders are loaded"""
         count, changes = order_processor.generate_missing_skus()
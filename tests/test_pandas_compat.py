@@ -0,0 +1,18 @@
+"""Unit tests for pandas_compat"""
+import pandas as pd
+from src.utils.pandas_compat import copy_frame
+
+
+class TestCopyFrame:
+    """Test suite for copy_frame"""
+
+    def test_copy_is_independent(self):
+        """Test changing the copy or the original doesn't change the other"""
+        original = pd.DataFrame({'SKU': ['A', 'B'], 'Quantity': [1, 2]})
+        copy = copy_frame(original)
+
+        copy.loc[0, 'Quantity'] = 10
+        original.loc[1, 'SKU'] = 'C'
+
+        assert original['Quantity'].tolist() == [1, 2]
+        assert copy['SKU'].tolist() == ['A', 'B']
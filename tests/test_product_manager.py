@@ -122,3 +122,34 @@ class TestProductManager:
         product_manager.clear()
         assert product_manager.count() == 0
         assert product_manager.get_all_skus() == []
+
+    def test_skus(self, product_manager, sample_products_df):
+        """Test SKU set follows loads and clear"""
+        assert product_manager.skus == frozenset()
+
+        product_manager.load_from_dataframe(sample_products_df)
+        assert product_manager.skus == frozenset(product_manager.get_all_skus())
+
+        product_manager.clear()
+        assert product_manager.skus == frozenset()
+
+    def test_get_products_batch(self, product_manager, sample_products_df):
+        """Test looking up many SKUs at once"""
+        product_manager.load_from_dataframe(sample_products_df)
+
+        batch = product_manager.get_products_batch(['LAV-10ML', 'UNKNOWN', 'LAV-10ML'])
+
+        assert len(batch) == 3
+        assert batch['name'].iloc[0] == product_manager.get_product_name('LAV-10ML')
+        assert batch['physical_qty'].iloc[0] == product_manager.get_product_quantity('LAV-10ML')
+        assert pd.isna(batch['name'].iloc[1])
+        assert batch['name'].iloc[2] == batch['name'].iloc[0]
+
+    def test_get_products(self, product_manager, sample_products_df):
+        """Test dictionary batch lookup matches get_product"""
+        product_manager.load_from_dataframe(sample_products_df)
+
+        products = product_manager.get_products([' LAV-10ML ', 'UNKNOWN', 'LAV-10ML'])
+
+        assert products == {'LAV-10ML': product_manager.get_product('LAV-10ML')}
+        assert product_manager.get_products([]) == {}
@@ -97,6 +97,21 @@ class TestSetManager:
         count = set_manager.get_component_count('UNKNOWN')
         assert count == 0
 
+    def test_empty_set_skus(self, set_manager):
+        """Test sets listed without components are reported, not mapped"""
+        df = pd.DataFrame({
+            'SET_Name': ['Relax', 'Empty', 'Empty'],
+            'SET_SKU': ['SET-RELAX', 'SET-EMPTY', 'SET-EMPTY'],
+            'SKUs_in_SET': ['LAV-10ML', '', ' ']
+        })
+        set_manager.load_from_dataframe(df)
+
+        assert set_manager.empty_set_skus() == ['SET-EMPTY']
+        assert not set_manager.is_set('SET-EMPTY')
+
+        set_manager.clear()
+        assert set_manager.empty_set_skus() == []
+
     def test_clear(self, set_manager, sample_sets_df):
         """Test clearing set map"""
         set_manager.load_from_dataframe(sample_sets_df)
@@ -180,3 +195,51 @@ class TestSetManager:
         # Invalid values should default to 1
         assert components[1]['quantity'] == 1
         assert components[2]['quantity'] == 1
+
+    def test_get_components_df(self, set_manager):
+        """Test flat components DataFrame matches the set map"""
+        df_with_quantities = pd.DataFrame({
+            'SET_Name': ['Bundle A', 'Bundle A', 'Bundle B'],
+            'SET_SKU': ['SET-A', 'SET-A', 'SET-B'],
+            'SKUs_in_SET': ['COMP-1', 'COMP-2', 'COMP-1'],
+            'SET_QUANTITY': [2, 1, 3]
+        })
+
+        set_manager.load_from_dataframe(df_with_quantities)
+
+        components_df = set_manager.get_components_df()
+        assert components_df['set_sku'].tolist() == ['SET-A', 'SET-A', 'SET-B']
+        assert components_df['component_sku'].tolist() == ['COMP-1', 'COMP-2', 'COMP-1']
+        assert components_df['set_quantity'].tolist() == [2, 1, 3]
+        assert components_df['component_index'].tolist() == [0, 1, 0]
+
+        set_manager.clear()
+        assert set_manager.get_components_df().empty
+
+    def test_set_skus_frozenset(self, set_manager, sample_sets_df):
+        """Test set_skus mirrors the loaded sets"""
+        assert set_manager.set_skus == frozenset()
+
+        set_manager.load_from_dataframe(sample_sets_df)
+        assert set_manager.set_skus == frozenset(set_manager.get_all_set_skus())
+
+        set_manager.clear()
+        assert set_manager.set_skus == frozenset()
+
+    def test_lookups_follow_reload(self, set_manager, sample_sets_df):
+        """Test memoized is_set/get_components results are dropped on reload and clear"""
+        set_manager.load_from_dataframe(sample_sets_df)
+        assert set_manager.is_set(' SET-RELAX ')
+        assert set_manager.get_component_count('SET-ENERGY') == 2
+
+        set_manager.load_from_dataframe(pd.DataFrame({
+            'SET_Name': ['Energy Bundle'],
+            'SET_SKU': ['SET-ENERGY'],
+            'SKUs_in_SET': ['PEPP-10ML']
+        }))
+        assert not set_manager.is_set(' SET-RELAX ')
+        assert set_manager.get_component_count('SET-ENERGY') == 1
+
+        set_manager.clear()
+        assert not set_manager.is_set('SET-ENERGY')
+        assert set_manager.get_components('SET-ENERGY') is None
@@ -1,9 +1,11 @@
 """Unit tests for SKU generator utility"""
 import pytest
 import math
+import pandas as pd
 from src.utils.sku_generator import (
     generate_sku_from_name,
     is_empty_sku,
+    empty_sku_mask,
     validate_sku,
     sanitize_sku
 )
@@ -89,6 +91,23 @@ class TestIsEmptySku:
         assert is_empty_sku("  LAV-10ML  ") is False  # Has content after strip
 
 
+class TestEmptySkuMask:
+    """Test suite for empty_sku_mask function"""
+
+    VALUES = ['LAV-10ML', '', '  ', 'NaN', ' null ', None, float('nan'), ' A ']
+
+    def test_matches_is_empty_sku_for_strings(self):
+        """Test string column gives the same result as is_empty_sku per value"""
+        skus = pd.Series(self.VALUES)
+        assert list(empty_sku_mask(skus)) == [is_empty_sku(v) for v in self.VALUES]
+
+    def test_matches_is_empty_sku_for_mixed_values(self):
+        """Test mixed object/numeric columns fall back to is_empty_sku"""
+        mixed = [*self.VALUES, 123]
+        assert list(empty_sku_mask(pd.Series(mixed, dtype=object))) == [is_empty_sku(v) for v in mixed]
+        assert list(empty_sku_mask(pd.Series([1.0, float('nan')]))) == [False, True]
+
+
 class TestValidateSku:
     """Test suite for validate_sku function"""
 